@@ -61,6 +61,40 @@ DJANGO_GIT_FIRST_COMMIT_MESSAGE = env(
 DJANGO_GIT_RETRY_ATTEMPTS = 5
 DJANGO_GIT_BRANCH_NAME = "master"
 
+# Download Artifact Cache
+# ------------------------------------------------------------------------------
+# Generated downloads are immutable for a given (commit, format): they are kept
+# on disk (LRU) and optionally mirrored to S3. A size of `0` disables the cache.
+DJANGO_DOWNLOAD_CACHE_DIR = env(
+    "DJANGO_DOWNLOAD_CACHE_DIR", default=BASE_DIR / ".workdir/download_cache"
+)
+DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB = env.int(
+    "DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB",
+    default=2048,  # pyright: ignore[reportArgumentType]
+)
+DJANGO_DOWNLOAD_CACHE_S3 = env.bool("DJANGO_DOWNLOAD_CACHE_S3", default=False)  # pyright: ignore[reportArgumentType]
+
+# OGC GeoJSON Cache
+# ------------------------------------------------------------------------------
+# Normalized GeoJSON features too large for a single shared-cache entry are
+# spilled to this directory (LRU). A size of `0` disables the spill.
+DJANGO_GEOJSON_CACHE_DIR = env(
+    "DJANGO_GEOJSON_CACHE_DIR", default=BASE_DIR / ".workdir/geojson_cache"
+)
+DJANGO_GEOJSON_CACHE_MAX_SIZE_MB = env.int(
+    "DJANGO_GEOJSON_CACHE_MAX_SIZE_MB",
+    default=1024,  # pyright: ignore[reportArgumentType]
+)
+
+# Last Login Tracking
+# ------------------------------------------------------------------------------
+# `last_login` is refreshed by authenticated requests (session and token) at
+# most once per user per interval, in seconds. `0` writes on every request.
+DJANGO_LAST_LOGIN_UPDATE_INTERVAL = env.int(
+    "DJANGO_LAST_LOGIN_UPDATE_INTERVAL",
+    default=300,  # pyright: ignore[reportArgumentType]
+)
+
 # File Upload Limits
 # ------------------------------------------------------------------------------
 # File size limit per individual file
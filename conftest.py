@@ -69,3 +69,10 @@ def clear_cache_between_tests() -> Generator[None]:
 
     # Clear django cache after the yield runs as teardown
     cache.clear()
+
+    # ... and the per-process / on-disk OGC feature caches.
+    from speleodb.api.v2.views.gis_view import (  # noqa: PLC0415
+        clear_local_feature_caches,
+    )
+
+    clear_local_feature_caches()
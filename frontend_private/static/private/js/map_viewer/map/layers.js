@@ -584,16 +584,21 @@ export const Layers = {
         this.applyProjectLineColors();
     },
 
-    addProjectGeoJSON: async function (projectId, url) {
+    addProjectGeoJSON: async function (projectId, url, preloadedData = null) {
         const map = State.map;
         if (!map) return;
 
         const sourceId = `project-geojson-${projectId}`;
 
         try {
-            const response = await fetch(url);
-            if (!response.ok) throw new Error(`HTTP ${response.status}`);
-            const rawData = await response.json();
+            // `preloadedData`: the project GeoJSON, already fetched (e.g. from
+            // a GIS View bundle); `url` is only fetched without it.
+            let rawData = preloadedData;
+            if (!rawData) {
+                const response = await fetch(url);
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                rawData = await response.json();
+            }
             const data = processGeoJSON(projectId, rawData);
 
             Geometry.cacheLineFeatures(projectId, data);
@@ -156,9 +156,9 @@ class _BaseProjectView(AuthenticatedTemplateView):
 
         # Check if user only has WEB_VIEWER access
         try:
-            best_permission = project.get_best_permission(user)
+            best_level = user.get_best_permission_level(project)
 
-            if best_permission.level == PermissionLevel.WEB_VIEWER:
+            if best_level == PermissionLevel.WEB_VIEWER:
                 # User only has WEB_VIEWER access, which is not allowed for these views
                 raise PermissionError("Insufficient permissions")
 
@@ -168,8 +168,8 @@ class _BaseProjectView(AuthenticatedTemplateView):
 
         return {
             "project": project,
-            "is_project_admin": best_permission.level == PermissionLevel.ADMIN,
-            "has_write_access": best_permission.level >= PermissionLevel.READ_AND_WRITE,
+            "is_project_admin": best_level == PermissionLevel.ADMIN,
+            "has_write_access": best_level >= PermissionLevel.READ_AND_WRITE,
         }
 
 
@@ -101,6 +101,23 @@ export async function initPublicGISViewer() {
         return viewData;
     }
 
+    // The GeoJSON of every project of the view, as one object keyed by
+    // commit SHA (`bundle_url`). Fetched once; `null` when unavailable, in
+    // which case each project GeoJSON is fetched on its own.
+    let bundlePromise = null;
+    const commitShaByProject = new Map();
+
+    async function fetchBundle(bundleUrl) {
+        try {
+            const response = await fetch(bundleUrl);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return await response.json();
+        } catch (e) {
+            console.error('❌ Error loading GIS View bundle:', e);
+            return null;
+        }
+    }
+
     async function loadPublicMapData(options = {}) {
         const {
             fetchProjects = false,
@@ -124,6 +141,10 @@ export async function initPublicGISViewer() {
 
                 console.log(`✅ Received ${projects.length} projects from GIS View "${viewData.view_name}"`);
 
+                bundlePromise = viewData.bundle_url ? fetchBundle(viewData.bundle_url) : null;
+                commitShaByProject.clear();
+                projects.forEach(p => commitShaByProject.set(String(p.id), p.commit_sha));
+
                 Config.setPublicProjects(projects.map(p => ({
                     id: p.id,
                     name: p.name,
@@ -139,12 +160,15 @@ export async function initPublicGISViewer() {
             }
 
             // Load GeoJSON for each project
+            const bundle = bundlePromise ? await bundlePromise : null;
             const loadPromises = Config.projects.map(async (project) => {
                 const geojsonUrl = project.geojson_url;
+                const bundled = bundle?.[commitShaByProject.get(String(project.id))];
+                const args = bundled ? [project.id, geojsonUrl, bundled] : [project.id, geojsonUrl];
 
-                if (geojsonUrl) {
+                if (bundled || geojsonUrl) {
                     try {
-                        await Layers.addProjectGeoJSON(project.id, geojsonUrl);
+                        await Layers.addProjectGeoJSON(...args);
                         console.log(`✅ Loaded GeoJSON for project: ${project.name}`);
                     } catch (e) {
                         console.error(`❌ Error loading GeoJSON for ${project.name}:`, e);
@@ -299,6 +299,42 @@ describe('frontend_public gis_view_main', () => {
         expect(layersMock.addProjectGeoJSON).toHaveBeenCalledWith('p1', '/g1.geojson');
     });
 
+    it('loads project GeoJSON from the view bundle when one is provided', async () => {
+        window.MAPVIEWER_CONTEXT = {
+            viewMode: 'public',
+            gisToken: 'public-token',
+            mapboxToken: 'mapbox-token'
+        };
+
+        const bundled = { type: 'FeatureCollection', features: [] };
+        globalThis.fetch
+            .mockResolvedValueOnce({
+                ok: true,
+                json: async () => ({
+                    view_name: 'Public View',
+                    bundle_url: '/bundle.json.gz',
+                    projects: [
+                        { id: 'p1', name: 'Project One', geojson_file: '/g1.geojson', commit_sha: 'aaa' },
+                        { id: 'p2', name: 'Project Two', geojson_file: '/g2.geojson', commit_sha: 'bbb' }
+                    ]
+                })
+            })
+            .mockResolvedValueOnce({
+                ok: true,
+                json: async () => ({ aaa: bundled })
+            });
+
+        const onDomReady = await importModuleAndGetDomReadyHandler();
+        await onDomReady();
+        await mapHandlers.load();
+
+        expect(globalThis.fetch).toHaveBeenCalledTimes(2);
+        expect(globalThis.fetch).toHaveBeenLastCalledWith('/bundle.json.gz');
+        // Projects missing from the bundle still load from their own URL.
+        expect(layersMock.addProjectGeoJSON).toHaveBeenCalledWith('p1', '/g1.geojson', bundled);
+        expect(layersMock.addProjectGeoJSON).toHaveBeenCalledWith('p2', '/g2.geojson');
+    });
+
     it('uses precise zoom limits when allowPreciseZoom is enabled', async () => {
         window.MAPVIEWER_CONTEXT = {
             viewMode: 'public',
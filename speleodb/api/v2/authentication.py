@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
-from django.contrib.auth.models import update_last_login
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.plumbing import build_bearer_security_scheme_object
 from rest_framework import exceptions
@@ -42,7 +41,7 @@ class SDBTokenAuthentication(TokenAuthentication):
         result = super().authenticate(request)
         if result is not None:
             user, _ = result
-            update_last_login(None, user=user)  # type: ignore[arg-type]
+            user.touch_last_login()
         return result
 
 
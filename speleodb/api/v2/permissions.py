@@ -9,6 +9,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import permissions
 from rest_framework.exceptions import NotAuthenticated
 
+from speleodb.api.v2.resource_access import get_user_permission_level
 from speleodb.common.enums import PermissionLevel
 from speleodb.common.enums import SurveyTeamMembershipRole
 from speleodb.gis.models import Cylinder
@@ -17,7 +18,6 @@ from speleodb.gis.models import CylinderFleetUserPermission
 from speleodb.gis.models import CylinderInstall
 from speleodb.gis.models import Experiment
 from speleodb.gis.models import ExperimentRecord
-from speleodb.gis.models import ExperimentUserPermission
 from speleodb.gis.models import ExplorationLead
 from speleodb.gis.models import GISView
 from speleodb.gis.models import GPSTrack
@@ -63,7 +63,7 @@ class BaseAccessLevel(permissions.BasePermission):
         """Check permission on a project."""
         try:
             return (
-                request.user.get_best_permission(project=project).level
+                request.user.get_best_permission_level(project=project)
                 >= self.MIN_ACCESS_LEVEL
             )
         except ObjectDoesNotExist, NotAuthorizedError:
@@ -82,64 +82,22 @@ class BaseAccessLevel(permissions.BasePermission):
             case Project():
                 try:
                     return (
-                        request.user.get_best_permission(project=obj).level
+                        request.user.get_best_permission_level(project=obj)
                         >= self.MIN_ACCESS_LEVEL
                     )
                 except ObjectDoesNotExist, NotAuthorizedError:
                     return False
 
-            case SurfaceMonitoringNetwork():
-                try:
-                    return (
-                        SurfaceMonitoringNetworkUserPermission.objects.get(
-                            user=request.user,
-                            network=obj,
-                            is_active=True,
-                        ).level
-                        >= self.MIN_ACCESS_LEVEL
-                    )
-                except ObjectDoesNotExist, NotAuthorizedError:
-                    return False
-
-            case SensorFleet():
-                try:
-                    return (
-                        SensorFleetUserPermission.objects.get(
-                            user=request.user,
-                            sensor_fleet=obj,
-                            is_active=True,
-                        ).level
-                        >= self.MIN_ACCESS_LEVEL
-                    )
-
-                except ObjectDoesNotExist:
-                    return False
-
-            case CylinderFleet():
-                try:
-                    return (
-                        CylinderFleetUserPermission.objects.get(
-                            user=request.user,
-                            cylinder_fleet=obj,
-                            is_active=True,
-                        ).level
-                        >= self.MIN_ACCESS_LEVEL
-                    )
-                except ObjectDoesNotExist:
-                    return False
-
-            case Experiment():
-                try:
-                    return (
-                        ExperimentUserPermission.objects.get(
-                            user=request.user,
-                            experiment=obj,
-                            is_active=True,
-                        ).level
-                        >= self.MIN_ACCESS_LEVEL
-                    )
-                except ObjectDoesNotExist, NotAuthorizedError:
-                    return False
+            case (
+                SurfaceMonitoringNetwork()
+                | SensorFleet()
+                | CylinderFleet()
+                | Experiment()
+            ):
+                # Reads the `user_permission_level` annotation when the view
+                # fetched `obj` through `with_user_permission_level`.
+                level = get_user_permission_level(request.user, obj)
+                return level is not None and level >= self.MIN_ACCESS_LEVEL
 
             case LandmarkCollection():
                 try:
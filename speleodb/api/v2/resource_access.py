@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db.models import Exists
+from django.db.models import IntegerField
+from django.db.models import Model
+from django.db.models import OuterRef
+from django.db.models import QuerySet
+from django.db.models import Subquery
+
+from speleodb.common.enums import PermissionLevel
+from speleodb.gis.models import CylinderFleet
+from speleodb.gis.models import CylinderFleetUserPermission
+from speleodb.gis.models import Experiment
+from speleodb.gis.models import ExperimentUserPermission
+from speleodb.gis.models import SensorFleet
+from speleodb.gis.models import SensorFleetUserPermission
+from speleodb.gis.models import SurfaceMonitoringNetwork
+from speleodb.gis.models import SurfaceMonitoringNetworkUserPermission
+
+if TYPE_CHECKING:
+    from speleodb.users.models import User
+
+#: Name of the annotation carrying the user's active permission level
+#: (``None`` when the user has no active permission on the row).
+USER_PERMISSION_LEVEL = "user_permission_level"
+
+# Resource model => (per-user permission model, FK from permission to resource)
+_RESOURCE_PERMISSIONS: dict[type[Model], tuple[type[Model], str]] = {
+    SensorFleet: (SensorFleetUserPermission, "sensor_fleet"),
+    CylinderFleet: (CylinderFleetUserPermission, "cylinder_fleet"),
+    SurfaceMonitoringNetwork: (SurfaceMonitoringNetworkUserPermission, "network"),
+    Experiment: (ExperimentUserPermission, "experiment"),
+}
+
+
+def _permission_queryset(model: type[Model], user: User) -> QuerySet[Any]:
+    permission_model, resource_field = _RESOURCE_PERMISSIONS[model]
+    return permission_model.objects.filter(  # type: ignore[attr-defined]
+        **{resource_field: OuterRef("pk")},
+        user=user,
+        is_active=True,
+    )
+
+
+def with_user_permission_level[M: Model](
+    queryset: QuerySet[M],
+    user: User,
+) -> QuerySet[M]:
+    """Annotate each row with the user's active permission level.
+
+    The level is computed by a correlated subquery, i.e. in the same SQL
+    query as the rows themselves, and read back by
+    :func:`get_user_permission_level` - so object-level permission checks
+    on those rows cost no extra query.
+    """
+    permission_qs = _permission_queryset(queryset.model, user)
+    return queryset.annotate(
+        **{
+            USER_PERMISSION_LEVEL: Subquery(
+                permission_qs.values("level")[:1],
+                output_field=IntegerField(),
+            )
+        }
+    )
+
+
+def accessible_resources_queryset[M: Model](
+    queryset: QuerySet[M],
+    user: User,
+    min_level: int = PermissionLevel.READ_ONLY,
+) -> QuerySet[M]:
+    """Restrict ``queryset`` to the rows the user holds ``min_level`` on.
+
+    Rows keep the ``user_permission_level`` annotation of
+    :func:`with_user_permission_level`.
+    """
+    permission_qs = _permission_queryset(queryset.model, user)
+    return with_user_permission_level(
+        queryset.filter(Exists(permission_qs.filter(level__gte=min_level))),
+        user,
+    )
+
+
+def get_user_permission_level(user: User, obj: Model) -> int | None:
+    """Return the user's active permission level on a fleet/network/experiment.
+
+    Reads the ``user_permission_level`` annotation when ``obj`` comes from
+    :func:`with_user_permission_level`, and falls back to one query
+    otherwise.
+    """
+    if hasattr(obj, USER_PERMISSION_LEVEL):
+        return getattr(obj, USER_PERMISSION_LEVEL)
+
+    permission_model, resource_field = _RESOURCE_PERMISSIONS[type(obj)]
+    return (
+        permission_model.objects.filter(  # type: ignore[attr-defined]
+            **{resource_field: obj},
+            user=user,
+            is_active=True,
+        )
+        .values_list("level", flat=True)
+        .first()
+    )
+
+
+class UserPermissionLevelMixin:
+    """Annotate ``get_queryset()`` with the request user's permission level.
+
+    Must be listed before ``GenericAPIView`` so that ``get_object()`` hands
+    the permission classes an annotated instance.
+    """
+
+    def get_queryset(self) -> QuerySet[Any]:
+        return with_user_permission_level(
+            super().get_queryset(),  # type: ignore[misc]
+            self.get_user(),  # type: ignore[attr-defined]
+        )
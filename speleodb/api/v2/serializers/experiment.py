@@ -16,6 +16,7 @@ from pydantic import ValidationError as PydanticValidationError
 from rest_framework import serializers
 from rest_framework.fields import Field as DRFField
 
+from speleodb.api.v2.resource_access import get_user_permission_level
 from speleodb.common.enums import PermissionLevel
 from speleodb.gis.models import Experiment
 from speleodb.gis.models import ExperimentRecord
@@ -144,8 +145,9 @@ class ExperimentSerializer(
         can pass an ``experiment_levels_by_id`` map via context to avoid
         a per-object query (used by the list endpoint).
 
-        Fallback: a single ``filter().first()`` for detail endpoints (no N+1
-        because detail returns one object per response).
+        Fallback: the ``user_permission_level`` annotation of detail views,
+        or a single query (no N+1 because detail returns one object per
+        response).
         """
         levels_by_id = self.context.get("experiment_levels_by_id")
         if isinstance(levels_by_id, dict):
@@ -157,10 +159,7 @@ class ExperimentSerializer(
         if request is None or not request.user.is_authenticated:
             return None
 
-        perm = ExperimentUserPermission.objects.filter(
-            user=request.user, experiment=obj, is_active=True
-        ).first()
-        return perm.level if perm is not None else None
+        return get_user_permission_level(request.user, obj)
 
     @extend_schema_field({"type": "boolean"})
     def get_can_write(self, obj: Experiment) -> bool:
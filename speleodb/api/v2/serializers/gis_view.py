@@ -145,6 +145,7 @@ class GISViewCreateUpdateSerializer(
             raise serializers.ValidationError("Duplicate projects not allowed")
 
         # Validate each project
+        user.load_project_levels()
 
         validated_projects = []
         for project_data in projects_data:
@@ -159,7 +160,7 @@ class GISViewCreateUpdateSerializer(
 
             # Check user has at least read access
             try:
-                user.get_best_permission(project)
+                user.get_best_permission_level(project)
             except NotAuthorizedError as e:
                 raise serializers.ValidationError(
                     f"You do not have access to project {project.name}"
@@ -274,12 +275,26 @@ class PublicGISViewSerializer(serializers.Serializer[GISView]):
     view_description = serializers.CharField(source="description")
     allow_precise_zoom = serializers.BooleanField()
     projects = serializers.SerializerMethodField()
+    bundle_url = serializers.SerializerMethodField()
+
+    def get_bundle_url(self, obj: GISView) -> str | None:
+        """Signed URL of the GeoJSON of every project, keyed by commit SHA."""
+        try:
+            return obj.get_geojson_bundle_url(
+                expires_in=self.context.get("expires_in", 3600),
+                lod=self.context.get("lod", 0),
+            )
+        except Exception:
+            logger.exception("Failed to build GeoJSON bundle for GISView %s", obj.pk)
+            return None
 
     def get_projects(self, obj: GISView) -> list[dict[str, Any]]:
         """Get projects with signed GeoJSON URLs."""
         expires_in = self.context.get("expires_in", 3600)
         try:
-            geojson_data = obj.get_geojson_urls(expires_in=expires_in)
+            geojson_data = obj.get_geojson_urls(
+                expires_in=expires_in, lod=self.context.get("lod", 0)
+            )
         except Exception:
             logger.exception("Failed to load geojson URLs for GISView %s", obj.pk)
             return []
@@ -316,7 +331,9 @@ class GISViewDataSerializer(serializers.Serializer[GISView]):
         """Get signed URLs for all projects in the view."""
         expires_in = self.context.get("expires_in", 3600)
         try:
-            geojson_data = obj.get_geojson_urls(expires_in=expires_in)
+            geojson_data = obj.get_geojson_urls(
+                expires_in=expires_in, lod=self.context.get("lod", 0)
+            )
             # Use the GeoJSON file serializer for consistent structure
             serializer = GISViewDataGeoJSONFileSerializer(geojson_data, many=True)
             return serializer.data  # type: ignore[return-value]
@@ -7,6 +7,7 @@ from typing import Any
 
 from django.core.exceptions import ValidationError
 from django.urls import reverse
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from frontend_private.templatetags.filter_utils import format_byte_size
@@ -143,7 +144,7 @@ class GitFileSerializer(serializers.Serializer[GitCommit]):
     # commit_message = serializers.CharField(source="commit.message")
     # commit_dt_since = serializers.SerializerMethodField()
     # commit_url = serializers.SerializerMethodField()
-    commit = GitCommitSerializer()
+    commit = serializers.SerializerMethodField()
 
     # ------------------------- Read-Only Serializer ------------------------ #
 
@@ -158,6 +159,19 @@ class GitFileSerializer(serializers.Serializer[GitCommit]):
     def get_size(self, obj: GitFile) -> str:
         return format_byte_size(obj.size)
 
+    @extend_schema_field(GitCommitSerializer)
+    def get_commit(self, obj: GitFile) -> dict[str, Any]:
+        """
+        Last commit modifying the file. Resolved in bulk by the caller through
+        `context["last_commits"]` (`{path: GitCommit}`) when available, otherwise
+        falls back to one history walk per file.
+        """
+        last_commits: dict[str, GitCommit] = self.context.get("last_commits", {})
+        if (commit := last_commits.get(obj.path.as_posix())) is None:
+            commit = obj.commit
+
+        return GitCommitSerializer(commit, context=self.context).data
+
     def get_download_url(self, obj: GitFile) -> str | None:
         project: Project | None = self.context.get("project")
         if project is not None:
@@ -182,7 +182,7 @@ class ProjectSerializer(SanitizedFieldsMixin, serializers.ModelSerializer[Projec
             return None
 
         try:
-            return str(user.get_best_permission(project=obj).level_label)
+            return str(user.get_best_permission_level(project=obj).label)
 
         except NotAuthorizedError:
             return None
@@ -205,7 +205,7 @@ class ProjectSerializer(SanitizedFieldsMixin, serializers.ModelSerializer[Projec
         # Check if the condition to include the expensive field is met
         if self.context.get("n_commits", False):
             # return len(obj.commit_history)
-            return obj.git_repo.commit_count
+            return obj.git_mirror.commit_count
         return None
 
     def get_latest_commit(self, obj: Project) -> None | dict[str, str]:
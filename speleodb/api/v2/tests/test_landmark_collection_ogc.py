@@ -203,6 +203,50 @@ class TestLandmarkCollectionOGC:
         assert cached.status_code == status.HTTP_304_NOT_MODIFIED
         assert cached["ETag"] == response["ETag"]
 
+    def test_items_cached_until_collection_changes(
+        self,
+        api_client: APIClient,
+        owner: User,
+        collection: LandmarkCollection,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            landmark = Landmark.objects.create(
+                name="Entrance",
+                latitude=45.1234567,
+                longitude=-122.1234567,
+                created_by=owner.email,
+                collection=collection,
+            )
+
+        url = reverse(
+            "api:v2:gis-ogc:landmark-collection-collection-items",
+            kwargs={"gis_token": collection.gis_token, "collection_id": "landmarks"},
+        )
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        _ = _streaming_json(first)
+
+        # Same version: the serialized features come from the cache.
+        with CaptureQueriesContext(connection) as ctx:
+            second = api_client.get(url)
+            payload = _streaming_json(second)
+        assert second["ETag"] == first["ETag"]
+        assert payload["features"][0]["properties"]["name"] == "Entrance"
+        assert not any(
+            '"gis_landmark"' in query["sql"] for query in ctx.captured_queries
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            landmark.name = "Renamed"
+            landmark.save()
+
+        updated = api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated["ETag"] != first["ETag"]
+        payload = _streaming_json(updated)
+        assert payload["features"][0]["properties"]["name"] == "Renamed"
+
     def test_personal_collection_token_returns_point_geojson(
         self,
         api_client: APIClient,
@@ -697,7 +741,7 @@ class TestLandmarkCollectionOGC:
         * get_object — 1 query (collection by gis_token)
         * get_collection — 0 queries (scope IS the collection)
         * bbox aggregate — 1 query
-        * ETag aggregate — 1 query
+        * ETag — 0 queries (cache-resident collection version)
         * landmarks list — 1 query (with select_related)
 
         Cap of 10 catches any per-landmark N+1 (e.g. permission checks
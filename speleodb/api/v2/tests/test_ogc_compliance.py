@@ -38,6 +38,7 @@ from typing import Any
 from typing import ClassVar
 from typing import Protocol
 from typing import cast
+from unittest.mock import patch
 from urllib.parse import parse_qs
 from urllib.parse import urlparse
 
@@ -74,16 +75,21 @@ from speleodb.gis.models import Landmark
 from speleodb.gis.models import LandmarkCollection
 from speleodb.gis.models import LandmarkCollectionUserPermission
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.gis.mvt import encode_tile
+from speleodb.gis.mvt import is_valid_tile
+from speleodb.gis.mvt import tile_bbox
 from speleodb.gis.ogc_helpers import CRS84_2D
 from speleodb.gis.ogc_helpers import CRS84_3D
 from speleodb.gis.ogc_helpers import MAX_OGC_LIMIT
 from speleodb.gis.ogc_helpers import OGC_CONFORMANCE_CLASSES
+from speleodb.gis.ogc_helpers import FeatureSpatialIndex
 from speleodb.gis.ogc_helpers import OGCQuery
 from speleodb.gis.ogc_helpers import _bbox_intersects
 from speleodb.gis.ogc_helpers import apply_ogc_query
 from speleodb.gis.ogc_helpers import build_collection_metadata
 from speleodb.gis.ogc_helpers import build_items_envelope
 from speleodb.gis.ogc_helpers import feature_bbox_2d
+from speleodb.gis.ogc_helpers import iter_items_envelope
 from speleodb.gis.ogc_helpers import normalize_features
 from speleodb.gis.ogc_helpers import parse_ogc_query
 from speleodb.gis.ogc_openapi import OGC_OPENAPI_DOC
@@ -266,6 +272,8 @@ class TestOGCHelpers:
             (f"limit={MAX_OGC_LIMIT + 1}", "limit"),
             ("offset=-1", "offset"),
             ("offset=abc", "offset"),
+            ("zoom=-1", "zoom"),
+            ("zoom=25", "zoom"),
             ("bbox=1,2,3", "bbox"),  # wrong arity (3)
             ("bbox=1,2,3,4,5", "bbox"),  # wrong arity (5)
             ("bbox=0,10,0,0", "bbox"),  # min > max in y
@@ -541,6 +549,37 @@ class TestOGCHelpers:
         assert total == 3  # noqa: PLR2004 — three features matched the bbox
         assert sliced == []  # offset past the matched count
 
+    def test_apply_query_spatial_index_matches_linear_scan(self) -> None:
+        """The grid index returns exactly what the linear scan returns,
+        in the same order — including antimeridian-crossing bboxes and
+        features without geometry."""
+        features: list[dict[str, Any]] = [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[-179.5 + i * 0.9, -80.0 + i * 0.4], [i, 2.0]],
+                },
+                "properties": {"name": f"L{i}"},
+            }
+            for i in range(400)
+        ]
+        features.append({"type": "Feature", "geometry": None, "properties": {}})
+        spatial_index = FeatureSpatialIndex(features)
+        assert spatial_index.cells_per_axis > 1
+
+        for bbox in (
+            (-10.0, -10.0, 10.0, 10.0),
+            (170.0, -90.0, -170.0, 90.0),  # crosses the antimeridian
+            (-180.0, -90.0, 180.0, 90.0),
+            (100.0, 80.0, 120.0, 85.0),  # outside the data extent
+            (-10.0, -10.0, -100.0, 10.0, 10.0, 100.0),  # 3-D
+        ):
+            query = OGCQuery(bbox=bbox)
+            assert apply_ogc_query(
+                features, query, spatial_index=spatial_index
+            ) == apply_ogc_query(features, query)
+
     def test_items_envelope_pagination_past_filtered_total(self) -> None:
         """Integration: the envelope reports ``numberMatched=3``,
         ``numberReturned=0``, omits ``next``, includes ``prev`` with
@@ -571,6 +610,99 @@ class TestOGCHelpers:
         # max(0, 5 - 10) = 0
         assert prev_qs["offset"] == ["0"]
 
+    def test_iter_items_envelope_matches_built_envelope(self) -> None:
+        """The streamed envelope is the built envelope, chunk by chunk."""
+        request = self.factory.get(
+            "/api/v2/gis-ogc/view/TKN/collections/SHA/items?limit=1200&offset=3",
+            secure=True,
+        )
+        request.query_params = request.GET  # type: ignore[attr-defined]
+        query = parse_ogc_query(request)  # type: ignore[arg-type]
+        features = [
+            {
+                "type": "Feature",
+                "id": str(i),
+                "geometry": {"type": "Point", "coordinates": [i, 0.5, -3.0]},
+                "properties": {"name": f"P{i}"},
+            }
+            for i in range(1_200)
+        ]
+
+        chunks = list(
+            iter_items_envelope(
+                features=[orjson.dumps(feat) for feat in features],
+                request=cast("Any", request),
+                number_matched=5_000,
+                query=query,
+            )
+        )
+        expected = build_items_envelope(
+            features=features,
+            request=cast("Any", request),
+            number_matched=5_000,
+            query=query,
+        )
+
+        assert len(chunks) > 3  # noqa: PLR2004 — header, features, footer
+        streamed = orjson.loads(b"".join(chunks))
+        assert streamed.pop("timeStamp")
+        expected.pop("timeStamp")
+        assert streamed == expected
+
+        empty = orjson.loads(
+            b"".join(
+                iter_items_envelope(
+                    features=[],
+                    request=cast("Any", request),
+                    number_matched=0,
+                    query=query,
+                )
+            )
+        )
+        assert empty["features"] == []
+        assert empty["numberReturned"] == 0
+
+    def test_encode_tile_keeps_only_features_touching_the_tile(self) -> None:
+        """Tiles hold the clipped features in the tile, one layer per name."""
+        passage = {
+            "type": "Feature",
+            "id": "sha:1",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[-87.5, 20.2, 0.0], [-87.6, 20.3, -1.83]],
+            },
+            "properties": {"name": "Passage A", "depth": -1.83, "tags": ["a"]},
+        }
+        far_away = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [10.0, 45.0]},
+            "properties": {"name": "Elsewhere"},
+        }
+        layers = {"sha_lines": [passage], "sha_points": [far_away]}
+
+        # z=0 covers the world: both features are kept.
+        world = encode_tile(layers, z=0, x=0, y=0)
+        assert b"sha_lines" in world
+        assert b"sha_points" in world
+        assert b"Passage A" in world
+        assert b"sha:1" in world  # String ids travel as an attribute.
+
+        # z=10 tile over the passage end: the far-away point is dropped.
+        z, x, y = 10, 262, 453
+        min_lon, min_lat, max_lon, max_lat = tile_bbox(z, x, y)
+        assert min_lon < -87.6 < max_lon  # noqa: PLR2004
+        assert min_lat < 20.3 < max_lat  # noqa: PLR2004
+        tile = encode_tile(layers, z=z, x=x, y=y)
+        assert b"sha_lines" in tile
+        assert b"sha_points" not in tile
+
+        # A tile without any feature is empty, and layers merge by
+        # concatenation.
+        assert encode_tile(layers, z=10, x=0, y=0) == b""
+        assert world.endswith(encode_tile({"sha_points": [far_away]}, z=0, x=0, y=0))
+        assert not is_valid_tile(1, 2, 0)
+        assert not is_valid_tile(-1, 0, 0)
+
     @pytest.mark.parametrize(
         "bad_arity",
         [
@@ -679,6 +811,26 @@ class TestOGCHelpers:
         assert params["limit"] == ["1"]
         assert params["offset"] == ["1"]
 
+    def test_items_envelope_links_preserve_zoom(self) -> None:
+        """``zoom`` selects the level of detail of the features: paging
+        links must keep it, or page two comes back at full precision.
+        """
+        request = self.factory.get(
+            "/api/v2/gis-ogc/view/TKN/collections/SHA/items?zoom=8&limit=1&offset=1",
+            secure=True,
+        )
+        request.query_params = request.GET  # type: ignore[attr-defined]
+        query = parse_ogc_query(request)  # type: ignore[arg-type]
+        envelope = build_items_envelope(
+            features=[],
+            request=cast("Any", request),
+            number_matched=3,
+            query=query,
+        )
+        links = {link["rel"]: link["href"] for link in envelope["links"]}
+        for rel in ("self", "next", "prev"):
+            assert parse_qs(urlparse(links[rel]).query)["zoom"] == ["8"]
+
     def test_items_envelope_self_link_uses_literal_commas_and_slashes(self) -> None:
         """Wire-format guarantee: bbox commas, datetime slashes/colons
         in self/next/prev links MUST stay literal (not percent-encoded).
@@ -1301,6 +1453,69 @@ class TestProjectViewOGCCompliance(BaseAPITestCase):
                 href = link["href"]
                 assert "?f=json/" not in href, f"Query string leaked into href: {href}"
 
+    def test_vector_tiles(self) -> None:
+        """Commit tiles are immutable; the view tile merges its commits."""
+        commit_url = reverse(
+            "api:v2:gis-ogc:view-commit-tile",
+            kwargs={
+                "gis_token": self.gis_view.gis_token,
+                "commit_sha": self.commit_sha,
+                "z": 0,
+                "x": 0,
+                "y": 0,
+            },
+        )
+        resp = self.public_client.get(commit_url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp["Content-Type"] == "application/vnd.mapbox-vector-tile"
+        assert "immutable" in resp["Cache-Control"]
+        assert self._lines_id.encode() in resp.content
+        assert self._points_id.encode() in resp.content
+
+        view_resp = self.public_client.get(
+            reverse(
+                "api:v2:gis-ogc:view-tile",
+                kwargs={"gis_token": self.gis_view.gis_token, "z": 0, "x": 0, "y": 0},
+            ),
+            HTTP_ACCEPT="application/vnd.mapbox-vector-tile",
+        )
+        assert view_resp.status_code == status.HTTP_200_OK
+        assert view_resp.content == resp.content
+        assert "immutable" not in view_resp["Cache-Control"]
+
+        # Outside the tile matrix, or a commit the view does not expose.
+        for kwargs in (
+            {"commit_sha": self.commit_sha, "z": 1, "x": 2, "y": 0},
+            {"commit_sha": "b" * 40, "z": 0, "x": 0, "y": 0},
+        ):
+            resp = self.public_client.get(
+                reverse(
+                    "api:v2:gis-ogc:view-commit-tile",
+                    kwargs={"gis_token": self.gis_view.gis_token, **kwargs},
+                )
+            )
+            assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_items_zoom_serves_same_features(self) -> None:
+        """``zoom`` only simplifies geometries: same features, same order."""
+        full = _streaming_json(self._items_response())
+        overview = _streaming_json(
+            self.public_client.get(
+                reverse(
+                    "api:v2:gis-ogc:view-collection-items",
+                    kwargs={
+                        "gis_token": self.gis_view.gis_token,
+                        "collection_id": self._lines_id,
+                    },
+                )
+                + "?zoom=3"
+            )
+        )
+        assert [feat["id"] for feat in overview["features"]] == [
+            feat["id"] for feat in full["features"]
+        ]
+        assert overview["numberMatched"] == full["numberMatched"]
+
 
 # ---------------------------------------------------------------------------
 # Integration tests — Landmark single-collection (ws7c1-c12)
@@ -1851,9 +2066,9 @@ class TestOGCCacheSizeGuard(BaseAPITestCase):
             )
             assert resp.status_code == status.HTTP_200_OK
             # Cache must be empty for this SHA — payload was over the cap.
-            assert _cache.get(f"ogc_geojson_features_{self.commit_sha}") is None
+            assert _cache.get(f"ogc_geojson_features_{collection_id}") is None
             # And the index cache is also empty (skipped together).
-            assert _cache.get(f"ogc_geojson_features_index_{self.commit_sha}") is None
+            assert _cache.get(f"ogc_geojson_features_index_{collection_id}") is None
 
             # A second request also serves 200 — re-reads from S3 each time.
             resp_again = self.public_client.get(
@@ -1869,6 +2084,67 @@ class TestOGCCacheSizeGuard(BaseAPITestCase):
         finally:
             _gis_view_mod._GEOJSON_CACHE_MAX_BYTES = original_cap  # noqa: SLF001
 
+    def test_oversize_payload_is_served_from_large_tiers(self) -> None:
+        """Payloads over the cap skip the plain cache entry but are kept in
+        the per-process LRU, the disk spill and the compressed shared
+        entry: storage is read once, whichever tier survives.
+        """
+        original_cap = _gis_view_mod._GEOJSON_CACHE_MAX_BYTES  # noqa: SLF001
+        _gis_view_mod._GEOJSON_CACHE_MAX_BYTES = 1  # noqa: SLF001
+        read_from_storage = _gis_view_mod._read_normalized_features_from_storage  # noqa: SLF001
+        storage_reads: list[str] = []
+
+        def _counting_read(commit_sha: str) -> list[dict[str, Any]]:
+            storage_reads.append(commit_sha)
+            return read_from_storage(commit_sha)
+
+        load = _gis_view_mod._load_normalized_features  # noqa: SLF001
+        try:
+            with patch.object(
+                _gis_view_mod,
+                "_read_normalized_features_from_storage",
+                side_effect=_counting_read,
+            ):
+                features = load(self.commit_sha)
+                assert features
+                assert storage_reads == [self.commit_sha]
+                assert _cache.get(f"ogc_geojson_features_{self.commit_sha}") is None
+
+                # Per-process LRU
+                assert load(self.commit_sha) == features
+
+                # Disk spill
+                _gis_view_mod._local_features_cache.clear()  # noqa: SLF001
+                assert load(self.commit_sha) == features
+
+                # Compressed shared-cache entry
+                _gis_view_mod.clear_local_feature_caches()
+                assert load(self.commit_sha) == features
+
+                assert storage_reads == [self.commit_sha]
+        finally:
+            _gis_view_mod._GEOJSON_CACHE_MAX_BYTES = original_cap  # noqa: SLF001
+
+    def test_oversize_serialized_features_are_measured_once(self) -> None:
+        """The "too large to cache" outcome of the serialized features is
+        cached too, so later ``/items`` requests do not serialize the
+        whole group again just to find it over the cap.
+        """
+        original_cap = _gis_view_mod._GEOJSON_CACHE_MAX_BYTES  # noqa: SLF001
+        _gis_view_mod._GEOJSON_CACHE_MAX_BYTES = 1  # noqa: SLF001
+        load = _gis_view_mod._load_serialized_features  # noqa: SLF001
+        try:
+            assert load(self.commit_sha, "points") is None
+
+            with patch.object(
+                _gis_view_mod,
+                "_load_group_features",
+                side_effect=AssertionError("features serialized again"),
+            ):
+                assert load(self.commit_sha, "points") is None
+        finally:
+            _gis_view_mod._GEOJSON_CACHE_MAX_BYTES = original_cap  # noqa: SLF001
+
 
 # ---------------------------------------------------------------------------
 # Single-feature index test (ArcGIS Pro edit-tracking hot path)
@@ -1974,9 +2250,11 @@ class TestSingleFeatureIndex(BaseAPITestCase):
         ``{id: feature}`` index in the cache. Subsequent single-feature
         lookups hit the index directly — no need to re-read the list.
         """
+        collection_id = f"{self.commit_sha}_points"
+
         # Cold: nothing cached.
-        assert _cache.get(f"ogc_geojson_features_{self.commit_sha}") is None
-        assert _cache.get(f"ogc_geojson_features_index_{self.commit_sha}") is None
+        assert _cache.get(f"ogc_geojson_features_{collection_id}") is None
+        assert _cache.get(f"ogc_geojson_features_index_{collection_id}") is None
 
         # Warm up via /items.
         items_resp = self.public_client.get(
@@ -1984,15 +2262,15 @@ class TestSingleFeatureIndex(BaseAPITestCase):
                 "api:v2:gis-ogc:view-collection-items",
                 kwargs={
                     "gis_token": self.gis_view.gis_token,
-                    "collection_id": f"{self.commit_sha}_points",
+                    "collection_id": collection_id,
                 },
             )
         )
         assert items_resp.status_code == status.HTTP_200_OK
 
         # Both list and index are now populated.
-        cached_list = _cache.get(f"ogc_geojson_features_{self.commit_sha}")
-        cached_index = _cache.get(f"ogc_geojson_features_index_{self.commit_sha}")
+        cached_list = _cache.get(f"ogc_geojson_features_{collection_id}")
+        cached_index = _cache.get(f"ogc_geojson_features_index_{collection_id}")
         assert cached_list is not None
         assert cached_index is not None
         assert isinstance(cached_index, dict)
@@ -2120,6 +2398,42 @@ class TestQueryCountInvariants(BaseAPITestCase):
             + "\n".join(q["sql"] for q in ctx.captured_queries)
         )
 
+    def test_user_token_collections_cached_until_permissions_change(self) -> None:
+        """The collections document is built from ``geometry_metadata``
+        without touching storage, then served from the cache until the
+        user's permissions (or the project GeoJSONs) change.
+        """
+        url = reverse(
+            "api:v2:gis-ogc:user-collections",
+            kwargs={"key": self.token.key},
+        )
+        collections = self.client.get(url).json()["collections"]
+        assert len(collections) == 10  # noqa: PLR2004
+        # The bbox comes with the metadata row: no world fallback.
+        assert all(
+            coll["extent"]["spatial"]["bbox"] != [[-180, -90, 180, 90]]
+            for coll in collections
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert not [
+            q["sql"] for q in ctx.captured_queries if "gis_projectgeojson" in q["sql"]
+        ]
+
+        project = ProjectFactory.create(created_by=self.user.email)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserProjectPermissionFactory(
+                target=self.user,
+                level=PermissionLevel.READ_ONLY,
+                project=project,
+            )
+            _create_project_geojson_for(
+                str(project.id), "fedcba9876543210" * 2 + "0" * 8
+            )
+        assert len(self.client.get(url).json()["collections"]) == 12  # noqa: PLR2004
+
 
 @pytest.mark.django_db
 class TestArcGISPro361Replay(BaseAPITestCase):
@@ -3246,18 +3560,19 @@ class TestOGCGeometrySplit(BaseAPITestCase):
     def test_polygon_features_are_dropped_with_warning(self) -> None:
         """SpeleoDB does not produce polygons; a stray one is dropped
         from the listing AND from every items response, with a single
-        structured warning logged so a future polygon-producing
-        pipeline is loud rather than silently ingesting bad data.
+        structured warning logged when the GeoJSON is stored so a future
+        polygon-producing pipeline is loud rather than silently
+        ingesting bad data.
         """
         sha = "4" * 40
-        self._make_geojson(
-            sha,
-            include_points=True,
-            include_lines=True,
-            include_polygon=True,
-        )
         with self.assertLogs("speleodb.gis.ogc_helpers", level="WARNING") as captured:
-            ids = [coll["id"] for coll in self._collections()]
+            self._make_geojson(
+                sha,
+                include_points=True,
+                include_lines=True,
+                include_polygon=True,
+            )
+        ids = [coll["id"] for coll in self._collections()]
         assert f"{sha}_polygons" not in ids
         assert len(captured.records) == 1
         warning = captured.records[0]
@@ -522,6 +522,31 @@ class TestProjectListLatestCommit(BaseAPITestCase):
         # Verify parents is a list
         assert isinstance(latest_commit_data["parent_ids"], list)
 
+    def test_project_list_permission_queries_are_constant(self) -> None:
+        """Permissions of every listed project are resolved in one query."""
+
+        def list_projects() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    reverse("api:v2:projects"),
+                    headers={"authorization": self.auth},
+                )
+            assert response.status_code == status.HTTP_200_OK
+            assert all(project["permission"] for project in response.data)
+            return len(context.captured_queries)
+
+        for _ in range(2):
+            UserProjectPermissionFactory.create(
+                target=self.user, level=PermissionLevel.READ_ONLY
+            )
+        few_projects_queries = list_projects()
+
+        for _ in range(5):
+            UserProjectPermissionFactory.create(
+                target=self.user, level=PermissionLevel.READ_AND_WRITE
+            )
+        assert list_projects() == few_projects_queries
+
     def test_project_list_no_n_plus_1_with_commits(self) -> None:
         """Test that fetching projects with latest_commit doesn't cause N+1 queries."""
         # Create multiple projects with commits
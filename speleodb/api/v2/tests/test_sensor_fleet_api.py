@@ -17,6 +17,8 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -379,6 +381,32 @@ class TestSensorFleetRetrieveUpdateDelete:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_retrieve_sensor_fleet_reads_annotated_permission(
+        self,
+        api_client: APIClient,
+        sensor_fleet_with_read: SensorFleet,
+        user: User,
+    ) -> None:
+        """The permission check reuses the level fetched with the fleet."""
+        auth = get_auth_header(user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(
+                reverse(
+                    "api:v2:sensor-fleet-detail",
+                    kwargs={"fleet_id": sensor_fleet_with_read.id},
+                ),
+                HTTP_AUTHORIZATION=auth,
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not [
+            query
+            for query in ctx.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "gis_sensorfleetuserpermission"' in query["sql"].split("(")[0]
+        ]
+
     def test_update_sensor_fleet_as_write(
         self,
         api_client: APIClient,
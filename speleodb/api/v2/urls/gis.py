@@ -42,9 +42,11 @@ expectation: 1 OGC collection = 1 GIS layer = 1 geometry type). The
 header pointing at the geometry-typed replacements. See
 ``docs/map-viewer/ogc-url-and-geometry-contract.md`` for the design.
 
-The non-OGC ``experiment`` endpoint and the frontend-helper
-``view-geojson`` endpoint stay where they are, with documentation
-clarifying that they are NOT OGC API Features services.
+The non-OGC ``experiment`` endpoint, the frontend-helper
+``view-geojson`` endpoint and the Mapbox Vector Tile endpoints
+(``<base>/tiles[/<sha>]/{z}/{x}/{y}.mvt``) stay outside the OGC route
+surface, with documentation clarifying that they are NOT OGC API
+Features services.
 
 URL converter discipline: every ``gis_token`` segment uses the explicit
 ``<gis_token:gis_token>`` form so the registered converter's regex
@@ -62,6 +64,7 @@ from django.urls import path
 
 import speleodb.utils.url_converters  # noqa: F401  # registers `gitsha` and `user_token`/`gis_token` converters
 from speleodb.api.v2.views.experiment import ExperimentGISApiView
+from speleodb.api.v2.views.gis_view import GISViewVectorTileApiView
 from speleodb.api.v2.views.gis_view import OGCGISViewCollectionApiView
 from speleodb.api.v2.views.gis_view import OGCGISViewCollectionItemsApiView
 from speleodb.api.v2.views.gis_view import OGCGISViewCollectionsApiView
@@ -113,6 +116,7 @@ from speleodb.api.v2.views.project_geojson import OGCGISUserConformanceApiView
 from speleodb.api.v2.views.project_geojson import OGCGISUserLandingPageApiView
 from speleodb.api.v2.views.project_geojson import OGCGISUserProjectsApiView
 from speleodb.api.v2.views.project_geojson import OGCGISUserSingleFeatureApiView
+from speleodb.api.v2.views.project_geojson import UserVectorTileApiView
 
 app_name = "gis-ogc"
 
@@ -242,6 +246,21 @@ urlpatterns: list[URLPattern | URLResolver] = [
         PublicGISViewGeoJSONApiView.as_view(),
         name="view-geojson",
     ),
+    # NOT OGC: Mapbox Vector Tiles of the whole view, or of one of its
+    # commits (immutable).
+    path(
+        "view/<gis_token:gis_token>/tiles/<int:z>/<int:x>/<int:y>.mvt",
+        GISViewVectorTileApiView.as_view(),
+        name="view-tile",
+    ),
+    path(
+        (
+            "view/<gis_token:gis_token>/tiles/<gitsha:commit_sha>/"
+            "<int:z>/<int:x>/<int:y>.mvt"
+        ),
+        GISViewVectorTileApiView.as_view(),
+        name="view-commit-tile",
+    ),
     path(
         "view/<gis_token:gis_token>/collections",
         OGCGISViewCollectionsApiView.as_view(),
@@ -305,6 +324,17 @@ urlpatterns: list[URLPattern | URLResolver] = [
         OGCGISUserConformanceApiView.as_view(),
         name="user-conformance",
     ),
+    # NOT OGC: Mapbox Vector Tiles, same layout as the GIS-View family.
+    path(
+        "user/<user_token:key>/tiles/<int:z>/<int:x>/<int:y>.mvt",
+        UserVectorTileApiView.as_view(),
+        name="user-tile",
+    ),
+    path(
+        "user/<user_token:key>/tiles/<gitsha:commit_sha>/<int:z>/<int:x>/<int:y>.mvt",
+        UserVectorTileApiView.as_view(),
+        name="user-commit-tile",
+    ),
     path(
         "user/<user_token:key>/collections",
         OGCGISUserProjectsApiView.as_view(),
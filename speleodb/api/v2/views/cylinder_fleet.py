@@ -13,11 +13,7 @@ from uuid import UUID
 import xlsxwriter
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Count
-from django.db.models import Exists
-from django.db.models import IntegerField
-from django.db.models import OuterRef
 from django.db.models import Prefetch
-from django.db.models import Subquery
 from django.http import Http404
 from django.http import StreamingHttpResponse
 from django.utils import timezone
@@ -34,6 +30,8 @@ from speleodb.api.v2.permissions import IsReadOnly
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WriteAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
+from speleodb.api.v2.resource_access import accessible_resources_queryset
 from speleodb.api.v2.serializers import CylinderFleetSerializer
 from speleodb.api.v2.serializers import CylinderFleetUserPermissionSerializer
 from speleodb.api.v2.serializers import CylinderFleetWithPermSerializer
@@ -82,22 +80,11 @@ class CylinderFleetApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
         """List all cylinder fleets with user permissions."""
         user = self.get_user()
 
-        perm_qs = CylinderFleetUserPermission.objects.filter(
-            cylinder_fleet=OuterRef("pk"),
-            user=user,
-            is_active=True,
-        )
-
         fleets = (
-            CylinderFleet.objects.filter(is_active=True)
-            .filter(Exists(perm_qs))
-            .annotate(
-                cylinder_count=Count("cylinders", distinct=True),
-                user_permission_level=Subquery(
-                    perm_qs.values("level")[:1],
-                    output_field=IntegerField(),
-                ),
+            accessible_resources_queryset(
+                CylinderFleet.objects.filter(is_active=True), user
             )
+            .annotate(cylinder_count=Count("cylinders", distinct=True))
             .distinct()
         )
 
@@ -123,7 +110,9 @@ class CylinderFleetApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
         return SuccessResponse(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class CylinderFleetSpecificApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
+class CylinderFleetSpecificApiView(
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
+):
     """
     GET: Retrieve a specific cylinder fleet
     PUT/PATCH: Update a cylinder fleet
@@ -197,7 +186,9 @@ class CylinderFleetSpecificApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixi
         )
 
 
-class CylinderApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
+class CylinderApiView(
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
+):
     """
     GET: List all cylinders in a fleet
     POST: Create a new cylinder in a fleet
@@ -299,7 +290,9 @@ class CylinderSpecificApiView(GenericAPIView[Cylinder], SDBAPIViewMixin):
         )
 
 
-class CylinderFleetPermissionApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
+class CylinderFleetPermissionApiView(
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
+):
     """
     GET: List all permissions for a fleet
     POST: Grant permission to a user
@@ -504,7 +497,9 @@ class CylinderFleetPermissionApiView(GenericAPIView[CylinderFleet], SDBAPIViewMi
         )
 
 
-class CylinderFleetExportExcelApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
+class CylinderFleetExportExcelApiView(
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
+):
     """
     Export cylinder fleet cylinders to Excel format.
 
@@ -629,7 +624,9 @@ class CylinderFleetExportExcelApiView(GenericAPIView[CylinderFleet], SDBAPIViewM
         return response
 
 
-class CylinderFleetWatchlistApiView(GenericAPIView[CylinderFleet], SDBAPIViewMixin):
+class CylinderFleetWatchlistApiView(
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
+):
     """
     GET: List cylinders in a fleet that are due for retrieval.
 
@@ -697,7 +694,7 @@ class CylinderFleetWatchlistApiView(GenericAPIView[CylinderFleet], SDBAPIViewMix
 
 
 class CylinderFleetWatchlistExportExcelApiView(
-    GenericAPIView[CylinderFleet], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[CylinderFleet], SDBAPIViewMixin
 ):
     """
     Export watchlist cylinders to Excel format.
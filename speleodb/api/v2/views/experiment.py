@@ -26,12 +26,15 @@ from speleodb.api.v2.permissions import IsReadOnly
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WriteAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
+from speleodb.api.v2.resource_access import accessible_resources_queryset
+from speleodb.api.v2.resource_access import get_user_permission_level
+from speleodb.api.v2.resource_access import with_user_permission_level
 from speleodb.api.v2.serializers import ExperimentRecordGISSerializer
 from speleodb.api.v2.serializers import ExperimentRecordSerializer
 from speleodb.api.v2.serializers import ExperimentSerializer
 from speleodb.gis.models import Experiment
 from speleodb.gis.models import ExperimentRecord
-from speleodb.gis.models import ExperimentUserPermission
 from speleodb.gis.models import Station
 from speleodb.gis.models import SubSurfaceStation
 from speleodb.gis.models.experiment import MandatoryFieldUuid
@@ -161,18 +164,16 @@ class ExperimentApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
         # Build the list of active experiments AND a per-id level map in a
         # single DB round trip. The map is passed to the serializer via
         # context so can_write/can_delete resolve without per-object queries
-        # (avoids N+1 inside SerializerMethodField). Swap the previous
-        # prefetch_related("experiment") for select_related: it's a
-        # many-to-one FK, so a JOIN is the correct load strategy.
-        experiments: list[Experiment] = []
-        levels_by_id: dict[Any, int] = {}
-        for perm in ExperimentUserPermission.objects.filter(
-            user=user, is_active=True
-        ).select_related("experiment"):
-            experiment = perm.experiment
-            if experiment.is_active:
-                levels_by_id[experiment.id] = perm.level
-                experiments.append(experiment)
+        # (avoids N+1 inside SerializerMethodField).
+        experiments = list(
+            accessible_resources_queryset(
+                Experiment.objects.filter(is_active=True), user
+            )
+        )
+        levels_by_id: dict[Any, int] = {
+            experiment.id: experiment.user_permission_level  # type: ignore[attr-defined]
+            for experiment in experiments
+        }
 
         context = self.get_serializer_context()
         context["experiment_levels_by_id"] = levels_by_id  # type: ignore[index]
@@ -202,7 +203,9 @@ class ExperimentApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
         )
 
 
-class ExperimentSpecificApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
+class ExperimentSpecificApiView(
+    UserPermissionLevelMixin, GenericAPIView[Experiment], SDBAPIViewMixin
+):
     queryset = Experiment.objects.all()
     permission_classes = [
         (IsObjectDeletion & SDB_AdminAccess)
@@ -407,7 +410,9 @@ class ExperimentRecordApiView(GenericAPIView[Station], SDBAPIViewMixin):
             )
 
         try:
-            return Experiment.objects.get(id=experiment_id, is_active=True)
+            return with_user_permission_level(
+                Experiment.objects.filter(is_active=True), self.get_user()
+            ).get(id=experiment_id)
         except Experiment.DoesNotExist:
             return ErrorResponse(
                 {"error": f"The Experiment `{experiment_id}` was not found."},
@@ -641,7 +646,9 @@ class ExperimentGISApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
         return NoWrapResponse(FeatureCollection(serializer.data))  # type: ignore[no-untyped-call]
 
 
-class ExperimentExportExcelApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
+class ExperimentExportExcelApiView(
+    UserPermissionLevelMixin, GenericAPIView[Experiment], SDBAPIViewMixin
+):
     """
     Export experiment data to Excel format.
     """
@@ -658,13 +665,7 @@ class ExperimentExportExcelApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
         experiment = self.get_object()
 
         # Check if user has read access
-        try:
-            ExperimentUserPermission.objects.get(
-                user=user,
-                experiment=experiment,
-                is_active=True,
-            )
-        except ExperimentUserPermission.DoesNotExist:
+        if get_user_permission_level(user, experiment) is None:
             return ErrorResponse(
                 {"error": "You do not have permission to access this experiment"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -168,12 +168,9 @@ class AllExploLeadsGeoJSONApiView(GenericAPIView[ExplorationLead], SDBAPIViewMix
     def get_queryset(self) -> QuerySet[ExplorationLead]:
         """Get only stations that the user has access to."""
         user = self.get_user()
-        user_projects: list[Project] = [
-            perm.project
-            for perm in user.permissions
-            if perm.level >= PermissionLevel.READ_ONLY
-        ]
-        return ExplorationLead.objects.filter(project__in=user_projects)
+        return ExplorationLead.objects.filter(
+            project__in=user.accessible_project_ids(PermissionLevel.READ_ONLY)
+        )
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Get all stations for a user in a map-friendly format."""
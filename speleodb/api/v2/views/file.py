@@ -24,6 +24,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.db import transaction
 from django.http import HttpResponse
+from django.http import HttpResponseRedirect
 from django.urls import reverse
 from drf_spectacular.utils import extend_schema
 from git.exc import GitCommandError
@@ -41,6 +42,7 @@ from speleodb.api.v2.serializers import ProjectSerializer
 from speleodb.api.v2.serializers import UploadSerializer
 from speleodb.common.enums import ProjectType
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.gis.ogc_helpers import build_geometry_metadata
 from speleodb.git_engine.exceptions import GitBlobNotFoundError
 from speleodb.git_engine.gitlab_manager import GitlabError
 from speleodb.processors import ArianeTMLFileProcessor
@@ -51,6 +53,7 @@ from speleodb.processors._impl.compass_toml import (
     build_compass_toml_bytes_from_upload_filenames,
 )
 from speleodb.processors._impl.compass_toml import get_compass_mak_filepath
+from speleodb.processors.download_cache import DownloadCache
 from speleodb.surveys.models import FileFormat
 from speleodb.surveys.models import Format
 from speleodb.surveys.models import Project
@@ -62,16 +65,21 @@ from speleodb.utils.exceptions import ProjectNotFound
 from speleodb.utils.helpers import retry_with_backoff
 from speleodb.utils.response import DownloadResponseFromBlob
 from speleodb.utils.response import DownloadResponseFromFile
+from speleodb.utils.response import DownloadStreamingResponse
 from speleodb.utils.response import ErrorResponse
 from speleodb.utils.response import SuccessResponse
 from speleodb.utils.timing_ctx import timed_section
 
 if TYPE_CHECKING:
     from django.http import FileResponse
+    from django.http import StreamingHttpResponse
     from openspeleo_lib.models import Survey
     from rest_framework.request import Request
     from rest_framework.response import Response
 
+    from speleodb.processors import BaseFileProcessor
+    from speleodb.processors.download_cache import CachedDownload
+
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +138,7 @@ def create_project_geojson(
             project=project,
             commit=commit_obj,
             file=geojson_f,
+            geometry_metadata=build_geometry_metadata(geojson_data.get("features", [])),
         )
 
 
@@ -570,6 +579,26 @@ class FileDownloadView(GenericAPIView[Project], SDBAPIViewMixin):
     http_method_names = ["get"]
     lookup_field = "id"
 
+    @staticmethod
+    def _get_cached_response(
+        processor: BaseFileProcessor, cached: CachedDownload
+    ) -> StreamingHttpResponse | HttpResponseRedirect | None:
+        filename = processor.get_download_filename(
+            committed_date=cached.committed_date,
+            default=f"{processor.ASSOC_FILEFORMAT.label.lower()}.bin",
+        )
+
+        if cached.path is not None:
+            try:
+                return DownloadResponseFromFile(
+                    filepath=cached.path, filename=filename, attachment=True
+                )
+            except FileNotFoundError:
+                # Evicted in the meantime
+                return None
+
+        return HttpResponseRedirect(cached.get_url(filename=filename))
+
     @extend_schema(operation_id="v2_projects_download_retrieve_by_format")
     def get(
         self,
@@ -578,7 +607,7 @@ class FileDownloadView(GenericAPIView[Project], SDBAPIViewMixin):
         hexsha: str | None = None,
         *args: Any,
         **kwargs: Any,
-    ) -> Response | FileResponse:
+    ) -> Response | StreamingHttpResponse:
         try:
             fileformat_f: FileFormat = getattr(FileFormat, fileformat.upper())
         except AttributeError:
@@ -627,6 +656,48 @@ class FileDownloadView(GenericAPIView[Project], SDBAPIViewMixin):
 
         with tempfile.TemporaryDirectory() as tempdir:
             try:
+                # A download never changes for a given (commit, format): serve it
+                # from the download cache whenever possible - without git access.
+                cache_hexsha: str | None = None
+                if processor.TARGET_DOWNLOAD_FILENAME is not None:
+                    cache_hexsha = DownloadCache.resolve_hexsha(project, hexsha)
+
+                if cache_hexsha is not None:
+                    if (
+                        cached := DownloadCache.get(project, cache_hexsha, fileformat_f)
+                    ) is not None and (
+                        response := self._get_cached_response(processor, cached)
+                    ) is not None:
+                        return response
+
+                    # Pin the download to the commit the cache entry is keyed on.
+                    hexsha = cache_hexsha
+
+                if processor.ARCHIVE_DOWNLOAD:
+                    # Archives are zipped on the fly while being sent: neither the
+                    # blobs nor the archive are ever fully buffered.
+                    try:
+                        stream, filename = processor.get_archive_stream_for_download(
+                            hexsha=hexsha
+                        )
+                    except FileNotFoundError as e:
+                        return ErrorResponse(
+                            {"error": str(e)},
+                            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        )
+
+                    if cache_hexsha is not None:
+                        stream = DownloadCache.store_stream(
+                            project=project,
+                            commit=project.git_mirror.commit(cache_hexsha),
+                            fileformat=fileformat_f,
+                            stream=stream,
+                        )
+
+                    return DownloadStreamingResponse(
+                        stream=stream, filename=filename, attachment=True
+                    )
+
                 temp_filepath = (
                     pathlib.Path(tempdir)
                     / f"{''.join(random.choice(string.ascii_letters) for _ in range(10))}.obj"  # noqa: E501
@@ -652,6 +723,14 @@ class FileDownloadView(GenericAPIView[Project], SDBAPIViewMixin):
                     )
 
                 if filename is not None and temp_filepath.is_file():
+                    if cache_hexsha is not None:
+                        DownloadCache.store_file(
+                            project=project,
+                            commit=project.git_mirror.commit(cache_hexsha),
+                            fileformat=fileformat_f,
+                            source=temp_filepath,
+                        )
+
                     return DownloadResponseFromFile(
                         filepath=temp_filepath,
                         filename=str(filename),
@@ -702,19 +781,20 @@ class BlobDownloadView(GenericAPIView[Project], SDBAPIViewMixin):
     ) -> Response | FileResponse:
         project = self.get_object()
 
-        # Using a retry-loop to prevent "pulling the repo" first.
+        # Using a retry-loop to prevent "fetching the repo" first.
         # If - by any chance - the blob is already known by GIT, we can reply fast
-        # Otherwise, we detect the blob to not be found and pull the repo and try again.
+        # Otherwise, we detect the blob to not be found and fetch the repo and try
+        # again.
         for retry_attempt in range(2):
             with contextlib.suppress(GitBlobNotFoundError):
-                obj = project.git_repo.find_blob(hexsha)
+                obj = project.find_blob(hexsha)
                 return DownloadResponseFromBlob(
                     obj=obj.content, filename=obj.name, attachment=True
                 )
 
             if retry_attempt == 0:
-                # Ensure we pull the project to update just in case
-                project.checkout_commit_or_default_pull_branch()
+                # Ensure we fetch the project (and index new blobs) just in case
+                project.fetch_git_mirror()
 
         return ErrorResponse(
             {"error": f"Object id=`{hexsha}` not found."},
@@ -733,5 +813,5 @@ class FileDownloadAtHashView(FileDownloadView):
         hexsha: str | None = None,
         *args: Any,
         **kwargs: Any,
-    ) -> Response | FileResponse:
+    ) -> Response | StreamingHttpResponse:
         return super().get(request, fileformat, hexsha, *args, **kwargs)
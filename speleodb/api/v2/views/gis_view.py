@@ -16,15 +16,25 @@ provides:
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import mmap
+import os
+import shutil
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 
 import orjson
 import sentry_sdk
+from django.conf import settings
 from django.core.cache import cache
+from django.core.files.base import ContentFile
 from rest_framework import permissions
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
@@ -38,14 +48,23 @@ from speleodb.api.v2.views.ogc_base import BaseOGCCollectionsApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCConformanceApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCLandingPageApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCSingleFeatureApiView
+from speleodb.api.v2.views.ogc_base import BaseOGCVectorTileApiView
 from speleodb.api.v2.views.ogc_base import OGCCollectionMeta
 from speleodb.api.v2.views.ogc_base import OGCFeatureService
+from speleodb.common.caching import GIS_VIEWS_GENERATION
+from speleodb.common.caching import PROJECT_GEOJSONS_GENERATION
+from speleodb.gis.lod import GEOJSON_LOD_TOLERANCES
+from speleodb.gis.lod import lod_for_zoom
+from speleodb.gis.lod import simplify_features
 from speleodb.gis.models import GISProjectView
 from speleodb.gis.models import GISView
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.gis.mvt import encode_tile
+from speleodb.gis.mvt import tile_bbox
 from speleodb.gis.ogc_helpers import GEOMETRY_GROUPS_ORDERED
+from speleodb.gis.ogc_helpers import FeatureSpatialIndex
 from speleodb.gis.ogc_helpers import classify_geometry
-from speleodb.gis.ogc_helpers import collection_bbox_2d_for_group
+from speleodb.gis.ogc_helpers import collection_bbox_2d
 from speleodb.gis.ogc_helpers import filter_features_by_geometry_group
 from speleodb.gis.ogc_helpers import geometry_groups_present
 from speleodb.gis.ogc_helpers import normalize_features
@@ -53,8 +72,17 @@ from speleodb.gis.ogc_helpers import parse_typed_collection_id
 from speleodb.utils.api_mixin import SDBAPIViewMixin
 from speleodb.utils.response import ErrorResponse
 from speleodb.utils.response import SuccessResponse
+from speleodb.utils.s3_storages import VectorTileStorage
+from speleodb.utils.s3_storages import signed_url_window
+
+try:
+    from compression import zstd as _features_codec
+except ImportError:  # Python built without libzstd
+    import zlib as _features_codec  # type: ignore[no-redef]
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from rest_framework.request import Request
     from rest_framework.response import Response
 
@@ -78,6 +106,24 @@ _GEOJSON_CACHE_LOCK_WAIT_SECONDS: float = 0.1
 # cache is skipped — slow but correct, never broken.
 _GEOJSON_CACHE_MAX_BYTES: int = 5 * 1024 * 1024  # 5 MiB
 
+# Payloads above ``_GEOJSON_CACHE_MAX_BYTES`` go through the "large" tiers
+# instead (see :func:`_load_normalized_features`):
+#
+# * a per-process LRU of parsed feature lists, bounded in payload bytes;
+# * a local-disk spill of the orjson payload, read back through ``mmap``;
+# * a compressed shared-cache entry, split in chunks that each fit the
+#   memcached default item size. Compressed payloads above
+#   ``_GEOJSON_CACHE_MAX_COMPRESSED_BYTES`` are not shared.
+_LOCAL_FEATURES_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 256 MiB
+_GEOJSON_CACHE_CHUNK_BYTES: int = 1000 * 1024  # < 1 MiB
+_GEOJSON_CACHE_MAX_COMPRESSED_BYTES: int = 64 * 1024 * 1024  # 64 MiB
+_GEOJSON_CACHE_CODEC: str = _features_codec.__name__.rsplit(".", maxsplit=1)[-1]
+
+# Number of ``(commit, geometry group)`` spatial indexes kept per process.
+# Indexes hold one bbox per feature plus the grid cells, i.e. a fraction
+# of the features list itself.
+_SPATIAL_INDEX_CACHE_SIZE: int = 32
+
 # Min/max bounds for the GIS-View-data ``expires_in`` query parameter.
 _EXPIRES_IN_DEFAULT: int = 3600
 _EXPIRES_IN_MIN: int = 60
@@ -111,6 +157,83 @@ def _read_normalized_features_from_storage(commit_sha: str) -> list[dict[str, An
     return normalize_features(raw_features, commit_sha=commit_sha)
 
 
+def _read_lod_features_from_storage(commit_sha: str, lod: int) -> list[dict[str, Any]]:
+    """Read the *lod* level of detail of *commit_sha* (see ``speleodb.gis.lod``).
+
+    Levels that were not built (yet) are simplified on the fly from the
+    full-precision features, the same way ``build_levels_of_detail``
+    derives them.
+    """
+    try:
+        project_geojson = ProjectGeoJSON.objects.get(commit__id=commit_sha)
+    except ProjectGeoJSON.DoesNotExist:
+        return []
+
+    storage = project_geojson.file.storage
+    name = project_geojson.get_lod_file_name(lod)
+    try:
+        if lod in project_geojson.lod_levels:
+            with storage.open(name, "rb") as f:
+                raw_features = orjson.loads(f.read()).get("features", [])
+            return normalize_features(raw_features, commit_sha=commit_sha)
+    except Exception:
+        logger.exception("Unable to read level of detail `%s`", name)
+
+    features = _load_normalized_features(commit_sha)
+    for level, tolerance in sorted(GEOJSON_LOD_TOLERANCES.items()):
+        if level > lod:
+            break
+        features = simplify_features(features, tolerance)
+    return features
+
+
+def _read_group_features_from_storage(
+    commit_sha: str, group: str
+) -> list[dict[str, Any]]:
+    """Read the *group* split of *commit_sha* stored at creation time.
+
+    Rows without ``geometry_metadata`` (created before it existed) or
+    whose split was not built (yet) fall back to filtering the full
+    features list.
+    """
+    try:
+        project_geojson = ProjectGeoJSON.objects.get(commit__id=commit_sha)
+    except ProjectGeoJSON.DoesNotExist:
+        return []
+
+    metadata = project_geojson.geometry_metadata
+    if metadata is not None:
+        if group not in metadata["groups"]:
+            return []
+
+        storage = project_geojson.file.storage
+        name = project_geojson.get_group_file_name(group)
+        try:
+            if storage.exists(name):
+                with storage.open(name, "rb") as f:
+                    return orjson.loads(f.read()).get("features", [])  # type: ignore[no-any-return]
+        except Exception:
+            logger.exception("Unable to read geometry group split `%s`", name)
+
+    return filter_features_by_geometry_group(
+        _load_normalized_features(commit_sha), group
+    )
+
+
+def _load_geometry_metadata(commit_sha: str) -> dict[str, Any] | None:
+    """Return ``ProjectGeoJSON.geometry_metadata`` of *commit_sha*, if any."""
+    return (
+        ProjectGeoJSON.objects.filter(commit__id=commit_sha)
+        .values_list("geometry_metadata", flat=True)
+        .first()
+    )
+
+
+def _features_cache_id(commit_sha: str, lod: int) -> str:
+    """Identity of a features list in every cache tier."""
+    return commit_sha if lod == 0 else f"{commit_sha}_lod{lod}"
+
+
 def _build_feature_index(
     features: list[dict[str, Any]],
 ) -> dict[str, dict[str, Any]]:
@@ -128,123 +251,328 @@ def _build_feature_index(
     return index
 
 
-def _cache_features_if_under_limit(
-    cache_key: str,
-    features: list[dict[str, Any]],
-) -> None:
-    """Cache *features* under *cache_key* iff the serialised payload fits.
-
-    Memcached rejects values above its ``-I`` cap (default 1 MiB), Redis
-    silently accepts much bigger values but pinning a 50 MB Python
-    object in a shared cache is wasteful regardless. Skipping cache.set
-    above :data:`_GEOJSON_CACHE_MAX_BYTES` degrades the next request to
-    a fresh S3 read — slow but correct, and the request still serves a
-    200.
+def _cache_index(features_cache_key: str, features: list[dict[str, Any]]) -> None:
+    """Cache the ``{id: feature}`` index next to a shared features list.
+
+    Only called for payloads under :data:`_GEOJSON_CACHE_MAX_BYTES`: the
+    index has the same upper bound as the features list (one ref per
+    feature), so both caches stay in lockstep — never an index without
+    its features.
     """
+    suffix = features_cache_key.removeprefix("ogc_geojson_features_")
+    index_key = f"ogc_geojson_features_index_{suffix}"
+    cache.set(
+        index_key,
+        _build_feature_index(features),
+        timeout=_GEOJSON_CACHE_TIMEOUT,
+    )
+
+
+# -------------------------- Large payload tiers --------------------------- #
+
+_local_features_cache: OrderedDict[str, tuple[int, list[dict[str, Any]]]] = (
+    OrderedDict()
+)
+_local_features_cache_lock = threading.Lock()
+
+
+def _get_local_features(commit_sha: str) -> list[dict[str, Any]] | None:
+    with _local_features_cache_lock:
+        entry = _local_features_cache.get(commit_sha)
+        if entry is None:
+            return None
+        _local_features_cache.move_to_end(commit_sha)
+        return entry[1]
+
+
+def _set_local_features(
+    commit_sha: str, features: list[dict[str, Any]], size: int
+) -> None:
+    if size > _LOCAL_FEATURES_CACHE_MAX_BYTES:
+        return
+
+    with _local_features_cache_lock:
+        _local_features_cache[commit_sha] = (size, features)
+        _local_features_cache.move_to_end(commit_sha)
+        total = sum(entry_size for entry_size, _ in _local_features_cache.values())
+        while total > _LOCAL_FEATURES_CACHE_MAX_BYTES:
+            _, (evicted_size, _) = _local_features_cache.popitem(last=False)
+            total -= evicted_size
+
+
+def _spill_path(commit_sha: str) -> Path:
+    return Path(settings.DJANGO_GEOJSON_CACHE_DIR) / f"{commit_sha}.json"
+
+
+def _read_spilled_features(commit_sha: str) -> tuple[list[Any], int] | None:
+    """Return ``(features, payload size)`` from the local-disk spill."""
+    if settings.DJANGO_GEOJSON_CACHE_MAX_SIZE_MB <= 0:
+        return None
+
+    path = _spill_path(commit_sha)
     try:
-        size = len(orjson.dumps(features))
-    except TypeError, ValueError:
-        # Anything we can't serialise we definitely can't safely cache.
+        with (
+            path.open(mode="rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            features = orjson.loads(memoryview(mm))
+            size = len(mm)
+    except FileNotFoundError, ValueError:
+        return None
+
+    # Mark the entry as recently used for the LRU eviction
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path)
+
+    return features, size
+
+
+def _spill_features(commit_sha: str, payload: bytes) -> None:
+    max_size = settings.DJANGO_GEOJSON_CACHE_MAX_SIZE_MB * 1024 * 1024
+    if not 0 < len(payload) <= max_size:
         return
-    if size > _GEOJSON_CACHE_MAX_BYTES:
+
+    path = _spill_path(commit_sha)
+    tmp_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        # Atomic: concurrent readers never observe a partially written file.
+        tmp_path.replace(path)
+    except OSError:
+        logger.exception("Unable to spill OGC features for %s to disk", commit_sha)
+        tmp_path.unlink(missing_ok=True)
+        return
+
+    # Evict the least recently used spills until the directory fits.
+    entries: list[tuple[float, int, Path]] = []
+    for spilled in path.parent.glob("*.json"):
+        with contextlib.suppress(FileNotFoundError):
+            stat = spilled.stat()
+            entries.append((stat.st_mtime, stat.st_size, spilled))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, spilled in sorted(entries, key=lambda entry: entry[0]):
+        if total_size <= max_size:
+            break
+        spilled.unlink(missing_ok=True)
+        total_size -= size
+
+
+def _compressed_cache_key(commit_sha: str) -> str:
+    # The codec is part of the key: workers built with and without zstd
+    # never try to decode each other's entries.
+    return f"ogc_geojson_features_{_GEOJSON_CACHE_CODEC}_{commit_sha}"
+
+
+def _get_compressed_features(commit_sha: str) -> tuple[list[Any], bytes] | None:
+    """Return ``(features, payload)`` from the chunked compressed entry."""
+    manifest_key = _compressed_cache_key(commit_sha)
+    n_chunks = cache.get(manifest_key)
+    if n_chunks is None:
+        return None
+
+    chunk_keys = [f"{manifest_key}_{i}" for i in range(n_chunks)]
+    chunks = cache.get_many(chunk_keys)
+    if len(chunks) != n_chunks:
+        return None
+
+    try:
+        payload = _features_codec.decompress(b"".join(chunks[k] for k in chunk_keys))
+        return orjson.loads(payload), payload
+    except Exception:
+        logger.exception("Corrupted compressed OGC features for %s", commit_sha)
+        return None
+
+
+def _set_compressed_features(commit_sha: str, payload: bytes) -> None:
+    compressed = _features_codec.compress(payload)
+    if len(compressed) > _GEOJSON_CACHE_MAX_COMPRESSED_BYTES:
         logger.warning(
-            "OGC features payload for %s is %d bytes (>%d); skipping cache.set",
-            cache_key,
-            size,
-            _GEOJSON_CACHE_MAX_BYTES,
+            "Compressed OGC features for %s are %d bytes (>%d); not shared",
+            commit_sha,
+            len(compressed),
+            _GEOJSON_CACHE_MAX_COMPRESSED_BYTES,
         )
         return
-    cache.set(cache_key, features, timeout=_GEOJSON_CACHE_TIMEOUT)
 
+    manifest_key = _compressed_cache_key(commit_sha)
+    chunks = {
+        f"{manifest_key}_{i}": compressed[start : start + _GEOJSON_CACHE_CHUNK_BYTES]
+        for i, start in enumerate(range(0, len(compressed), _GEOJSON_CACHE_CHUNK_BYTES))
+    }
+    cache.set_many(chunks, timeout=_GEOJSON_CACHE_TIMEOUT)
+    # Written last: readers never see a manifest without its chunks.
+    cache.set(manifest_key, len(chunks), timeout=_GEOJSON_CACHE_TIMEOUT)
 
-def _cache_index_if_features_cached(
-    features_cache_key: str,
-    features: list[dict[str, Any]],
-) -> None:
-    """Cache the ``{id: feature}`` index iff the features list itself fits.
 
-    The index has the same upper bound as the features list (one ref per
-    feature), so the size check on ``features`` is a sufficient proxy.
-    Skipping the index cache when the features list doesn't fit keeps
-    the two caches in lockstep — never have an index without its
-    features.
+def clear_local_feature_caches() -> None:
+    """Drop the per-process and on-disk feature caches of this worker.
+
+    The shared Django cache is cleared with ``cache.clear()``; this is its
+    counterpart for the tiers that live outside of it.
+    """
+    with _local_features_cache_lock:
+        _local_features_cache.clear()
+    with _spatial_index_cache_lock:
+        _spatial_index_cache.clear()
+    shutil.rmtree(settings.DJANGO_GEOJSON_CACHE_DIR, ignore_errors=True)
+
+
+# ------------------------------------------------------------------------- #
+
+
+def _get_cached_features(commit_sha: str) -> list[dict[str, Any]] | None:
+    """Look *commit_sha* features up in every cache tier, fastest first."""
+    cached = cache.get(f"ogc_geojson_features_{commit_sha}")
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
+    if (features := _get_local_features(commit_sha)) is not None:
+        return features
+
+    if (spilled := _read_spilled_features(commit_sha)) is not None:
+        features, size = spilled
+        _set_local_features(commit_sha, features, size)
+        return features
+
+    if (entry := _get_compressed_features(commit_sha)) is not None:
+        features, payload = entry
+        _spill_features(commit_sha, payload)
+        _set_local_features(commit_sha, features, len(payload))
+        return features
+
+    return None
+
+
+def _cache_features(commit_sha: str, features: list[dict[str, Any]]) -> None:
+    """Store *features* in the cache tier matching their serialized size.
+
+    A single ``orjson.dumps`` pass measures the payload and provides the
+    bytes spilled to disk and compressed into the shared cache.
     """
     try:
-        size = len(orjson.dumps(features))
+        payload = orjson.dumps(features)
     except TypeError, ValueError:
+        # Anything we can't serialise we definitely can't safely cache.
         return
-    if size > _GEOJSON_CACHE_MAX_BYTES:
-        return
-    suffix = features_cache_key.removeprefix("ogc_geojson_features_")
-    index_key = f"ogc_geojson_features_index_{suffix}"
-    cache.set(
-        index_key,
-        _build_feature_index(features),
-        timeout=_GEOJSON_CACHE_TIMEOUT,
-    )
 
+    cache_key = f"ogc_geojson_features_{commit_sha}"
+    if len(payload) <= _GEOJSON_CACHE_MAX_BYTES:
+        cache.set(cache_key, features, timeout=_GEOJSON_CACHE_TIMEOUT)
+        _cache_index(cache_key, features)
+        return
 
-def _load_normalized_features(commit_sha: str) -> list[dict[str, Any]]:
-    """Load + normalize + cache the feature list for *commit_sha*.
+    logger.info(
+        "OGC features payload for %s is %d bytes (>%d); using the large tiers",
+        cache_key,
+        len(payload),
+        _GEOJSON_CACHE_MAX_BYTES,
+    )
+    _set_local_features(commit_sha, features, len(payload))
+    _spill_features(commit_sha, payload)
+    _set_compressed_features(commit_sha, payload)
 
-    Cache key uses the ``ogc_geojson_features_`` prefix to retire the
-    previous unfiltered/uncoded ``ogc_geojson_`` key (the old key
-    orphans-out within its 24 h TTL). The cached value is a Python list
-    of feature dicts, not bytes — the OGC envelope is built per-request
-    by :func:`speleodb.gis.ogc_helpers.build_items_envelope` so that
-    ``timeStamp`` and the ``self`` link are always fresh (OGC Req 29).
 
-    Payloads above :data:`_GEOJSON_CACHE_MAX_BYTES` are loaded from
-    storage on every request (cache.set is skipped) so a project with
-    an unusually large GeoJSON file does not blow up the cache backend.
+def _load_cached_features(
+    cache_id: str, read: Callable[[], list[dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    """Return the features cached under *cache_id*, filled from *read*.
 
-    The companion ``{id: feature}`` index is filled in the same
-    critical section (see :func:`_load_feature_by_id`).
+    Only one worker per *cache_id* calls *read* on a cold cache; the
+    others wait for it to fill the cache tiers.
     """
-    cache_key = f"ogc_geojson_features_{commit_sha}"
-    cached = cache.get(cache_key)
+    cached = _get_cached_features(cache_id)
     if cached is not None:
-        return cached  # type: ignore[no-any-return]
+        return cached
 
-    lock_key = f"{cache_key}:lock"
+    lock_key = f"ogc_geojson_features_{cache_id}:lock"
     if cache.add(lock_key, "1", timeout=_GEOJSON_CACHE_LOCK_TIMEOUT):
         try:
-            cached = cache.get(cache_key)
+            cached = _get_cached_features(cache_id)
             if cached is not None:
-                return cached  # type: ignore[no-any-return]
-            features = _read_normalized_features_from_storage(commit_sha)
-            _cache_features_if_under_limit(cache_key, features)
-            _cache_index_if_features_cached(cache_key, features)
+                return cached
+            features = read()
+            _cache_features(cache_id, features)
             return features
         finally:
             cache.delete(lock_key)
 
     for _ in range(_GEOJSON_CACHE_LOCK_RETRIES):
         time.sleep(_GEOJSON_CACHE_LOCK_WAIT_SECONDS)
-        cached = cache.get(cache_key)
+        cached = _get_cached_features(cache_id)
         if cached is not None:
-            return cached  # type: ignore[no-any-return]
+            return cached
 
     # If the filling worker died, serve the request rather than hanging.
-    features = _read_normalized_features_from_storage(commit_sha)
-    _cache_features_if_under_limit(cache_key, features)
-    _cache_index_if_features_cached(cache_key, features)
+    features = read()
+    _cache_features(cache_id, features)
     return features
 
 
+def _load_normalized_features(commit_sha: str, lod: int = 0) -> list[dict[str, Any]]:
+    """Load + normalize + cache the feature list for *commit_sha*.
+
+    Cache key uses the ``ogc_geojson_features_`` prefix to retire the
+    previous unfiltered/uncoded ``ogc_geojson_`` key (the old key
+    orphans-out within its 24 h TTL). The cached value is a Python list
+    of feature dicts, not bytes — the OGC envelope is built per-request
+    by :func:`speleodb.gis.ogc_helpers.build_items_envelope` so that
+    ``timeStamp`` and the ``self`` link are always fresh (OGC Req 29).
+
+    Payloads above :data:`_GEOJSON_CACHE_MAX_BYTES` do not fit a single
+    shared-cache entry. They are kept in a per-process LRU, spilled to
+    local disk, and shared between workers as compressed chunks, so the
+    largest projects are not re-read from storage on every request.
+
+    The companion ``{id: feature}`` index is filled in the same
+    critical section for shared payloads (see
+    :func:`_load_feature_by_id`).
+
+    A non-zero *lod* returns that level of detail instead, cached
+    under its own identity in the same tiers.
+    """
+
+    def read() -> list[dict[str, Any]]:
+        if lod == 0:
+            return _read_normalized_features_from_storage(commit_sha)
+        return _read_lod_features_from_storage(commit_sha, lod)
+
+    return _load_cached_features(_features_cache_id(commit_sha, lod), read)
+
+
+def _load_group_features(
+    commit_sha: str, group: str, lod: int = 0
+) -> list[dict[str, Any]]:
+    """Return the *commit_sha* features in geometry *group*.
+
+    Equal to ``filter_features_by_geometry_group(_load_normalized_features(
+    sha, lod), group)``, but full-precision requests only read (and cache)
+    the split of *group* stored with the ``ProjectGeoJSON``.
+    """
+    if lod != 0:
+        return filter_features_by_geometry_group(
+            _load_normalized_features(commit_sha, lod), group
+        )
+    return _load_cached_features(
+        f"{commit_sha}_{group}",
+        lambda: _read_group_features_from_storage(commit_sha, group),
+    )
+
+
 def _load_collection_bbox(
     commit_sha: str,
     group: str,
 ) -> tuple[float, float, float, float] | None:
     """Return the cached 2-D bbox for *commit_sha* features in *group*.
 
-    Computed lazily on first access from the cached features list and
-    cached separately so subsequent /collections/<id> requests serve a
-    real spatial extent for the geometry-typed layer (Points-only or
-    Lines-only) without re-walking the features. Returns ``None`` for
-    empty groups or for SHAs whose payload was too big to cache (in
-    which case the collection metadata falls back to the world bbox —
-    acceptable, never wrong).
+    Read from ``ProjectGeoJSON.geometry_metadata``; rows created before
+    it existed compute it lazily from the group features. Either way it
+    is cached separately so subsequent /collections/<id> requests serve
+    a real spatial extent for the geometry-typed layer (Points-only or
+    Lines-only) without another lookup. Returns ``None`` for empty
+    groups (in which case the collection metadata falls back to the
+    world bbox — acceptable, never wrong).
 
     Cache key shape: ``ogc_geojson_bbox_{sha}_{group}``. The previous
     un-grouped key (``ogc_geojson_bbox_{sha}``) is no longer queried
@@ -260,8 +588,13 @@ def _load_collection_bbox(
             return None
         return cached  # type: ignore[no-any-return]
 
-    features = _load_normalized_features(commit_sha)
-    bbox = collection_bbox_2d_for_group(features, group)
+    metadata = _load_geometry_metadata(commit_sha)
+    if metadata is not None:
+        group_metadata = metadata["groups"].get(group)
+        stored = group_metadata["bbox"] if group_metadata is not None else None
+        bbox = tuple(stored) if stored is not None else None
+    else:
+        bbox = collection_bbox_2d(_load_group_features(commit_sha, group))
     if bbox is None:
         cache.set(bbox_key, ("none",), timeout=_GEOJSON_CACHE_TIMEOUT)
         return None
@@ -276,7 +609,9 @@ def _load_geometry_groups_present(commit_sha: str) -> frozenset[str]:
     ``/collections`` listing only enumerates groups that actually have
     features (no empty layers in QGIS / ArcGIS Pro). Cached separately
     from the features list so the discovery path stays a single
-    ``cache.get`` per project commit on the warm path.
+    ``cache.get`` per project commit on the warm path; the cold path
+    reads ``ProjectGeoJSON.geometry_metadata`` (or, for rows created
+    before it existed, scans the features list).
 
     A SHA whose features list does not load (DoesNotExist or not yet
     indexed) reports an empty set; the caller treats that as "no
@@ -288,8 +623,13 @@ def _load_geometry_groups_present(commit_sha: str) -> frozenset[str]:
     if cached is not None:
         return frozenset(cached)
 
-    features = _load_normalized_features(commit_sha)
-    groups = frozenset(geometry_groups_present(features))
+    metadata = _load_geometry_metadata(commit_sha)
+    if metadata is not None:
+        groups = frozenset(metadata["groups"])
+    else:
+        groups = frozenset(
+            geometry_groups_present(_load_normalized_features(commit_sha))
+        )
     # Persist as a tuple for cache-backend compatibility (memcached
     # rejects sets); the readback above re-wraps in a frozenset so
     # callers always see an immutable value.
@@ -297,6 +637,77 @@ def _load_geometry_groups_present(commit_sha: str) -> frozenset[str]:
     return groups
 
 
+def _load_serialized_features(
+    commit_sha: str, group: str, lod: int = 0
+) -> list[bytes] | None:
+    """Return the *group* features of *commit_sha*, each one ``orjson``-dumped.
+
+    Lets the ``/items`` endpoint splice features into its response
+    stream without re-serializing any geometry (see
+    :func:`speleodb.gis.ogc_helpers.iter_items_envelope`). Positions
+    match :func:`_load_group_features`, at every *lod*. Returns ``None``
+    when the payload is too big to be cached: the caller then serializes
+    only the requested page. That outcome is itself cached, so oversized
+    payloads are measured once per key rather than on every request.
+    """
+    cache_key = (
+        f"ogc_geojson_features_bytes_{_features_cache_id(commit_sha, lod)}_{group}"
+    )
+    too_large_key = f"{cache_key}_too_large"
+    cached = cache.get_many([cache_key, too_large_key])
+    if cache_key in cached:
+        return cached[cache_key]  # type: ignore[no-any-return]
+    if too_large_key in cached:
+        return None
+
+    serialized = [
+        orjson.dumps(feat) for feat in _load_group_features(commit_sha, group, lod)
+    ]
+    size = sum(len(feat) for feat in serialized)
+    if size > _GEOJSON_CACHE_MAX_BYTES:
+        logger.warning(
+            "OGC serialized features for %s are %d bytes (>%d); skipping cache.set",
+            cache_key,
+            size,
+            _GEOJSON_CACHE_MAX_BYTES,
+        )
+        cache.set(too_large_key, size, timeout=_GEOJSON_CACHE_TIMEOUT)
+        return None
+
+    cache.set(cache_key, serialized, timeout=_GEOJSON_CACHE_TIMEOUT)
+    return serialized
+
+
+_spatial_index_cache: OrderedDict[tuple[str, str], FeatureSpatialIndex] = OrderedDict()
+_spatial_index_cache_lock = threading.Lock()
+
+
+def _load_spatial_index(commit_sha: str, group: str) -> FeatureSpatialIndex:
+    """Return the spatial index of *commit_sha* features in *group*.
+
+    Kept in a per-process LRU rather than the shared cache: the index is
+    only useful as live Python objects, and unpickling it on every
+    request would cost about as much as the linear scan it replaces.
+    Content is immutable for a given SHA, so entries never go stale;
+    the positions it returns refer to ``_load_group_features(sha, group)``,
+    which is deterministic for a given SHA.
+    """
+    key = (commit_sha, group)
+    with _spatial_index_cache_lock:
+        index = _spatial_index_cache.get(key)
+        if index is not None:
+            _spatial_index_cache.move_to_end(key)
+            return index
+
+    index = FeatureSpatialIndex(_load_group_features(commit_sha, group))
+
+    with _spatial_index_cache_lock:
+        _spatial_index_cache[key] = index
+        while len(_spatial_index_cache) > _SPATIAL_INDEX_CACHE_SIZE:
+            _spatial_index_cache.popitem(last=False)
+    return index
+
+
 def _load_feature_by_id(
     commit_sha: str,
     feature_id: str,
@@ -305,21 +716,21 @@ def _load_feature_by_id(
     """Look up a single feature by id within *group* with O(1) cache hit.
 
     Tries the cached ``{id: feature}`` index first; on miss, falls back
-    to loading the full features list (which also rebuilds and caches
+    to loading the group features list (which also rebuilds and caches
     the index). Returns ``None`` if no feature has the requested id
     OR the matching feature's geometry does not belong to *group*
     (i.e. the URL collection_id and the actual feature geometry
     disagree — typically a stale client URL after the geometry-typed
     split).
 
-    The features index is shared across all groups at the same SHA
-    (one feature has one id, and that id is unique across the entire
-    project); ``group`` is used to filter the lookup result, not the
-    cached object. This keeps the ArcGIS Pro 3.6 edit-tracking hot
-    path (one ``/items/{featureId}`` per modified row) at a single
-    cache GET plus a dict access regardless of how many groups exist.
+    The index is the one cached next to the *group* features list (see
+    :func:`_load_group_features`), so a lookup never loads the other
+    groups; ``group`` is still checked on the result as a guard. This
+    keeps the ArcGIS Pro 3.6 edit-tracking hot path (one
+    ``/items/{featureId}`` per modified row) at a single cache GET plus
+    a dict access regardless of how many groups exist.
     """
-    index_key = f"ogc_geojson_features_index_{commit_sha}"
+    index_key = f"ogc_geojson_features_index_{commit_sha}_{group}"
     target = str(feature_id)
 
     def _filter_to_group(feat: dict[str, Any] | None) -> dict[str, Any] | None:
@@ -332,7 +743,7 @@ def _load_feature_by_id(
         return _filter_to_group(cached_index.get(target))
 
     # Index missing — touch the features path which (re)builds it.
-    features = _load_normalized_features(commit_sha)
+    features = _load_group_features(commit_sha, group)
     cached_index = cache.get(index_key)
     if cached_index is not None:
         return _filter_to_group(cached_index.get(target))
@@ -346,6 +757,61 @@ def _load_feature_by_id(
     return None
 
 
+def _vector_tile_name(commit_sha: str, z: int, x: int, y: int) -> str:
+    return f"{commit_sha}/{z}/{x}/{y}.mvt"
+
+
+def _load_commit_tile(commit_sha: str, z: int, x: int, y: int) -> bytes:
+    """Return the MVT tile ``z/x/y`` of *commit_sha*.
+
+    One layer per geometry group, named after the matching OGC collection
+    (``<sha>_points`` / ``<sha>_lines``) so that tiles of several commits
+    can be concatenated into a single valid tile.
+
+    Lookup order: shared cache, then ``VectorTileStorage``, then render
+    from the per-commit features, at the level of detail matching *z*.
+    Only the features the spatial index places in the (buffered) tile are
+    encoded, so rendering cost scales with the viewport. Empty tiles are
+    never written to storage: they are cheap to recompute and far more
+    numerous than the others.
+    """
+    cache_key = f"ogc_mvt_tile_{commit_sha}_{z}_{x}_{y}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
+    bbox = tile_bbox(z, x, y)
+    lod = lod_for_zoom(z)
+    layers: dict[str, list[dict[str, Any]]] = {}
+    for group in GEOMETRY_GROUPS_ORDERED:
+        positions = _load_spatial_index(commit_sha, group).query(bbox)
+        if positions:
+            features = _load_group_features(commit_sha, group, lod)
+            layers[f"{commit_sha}_{group}"] = [features[pos] for pos in positions]
+
+    tile: bytes | None = None if layers else b""
+    if tile is None:
+        storage = VectorTileStorage()  # type: ignore[no-untyped-call]
+        name = _vector_tile_name(commit_sha, z, x, y)
+        try:
+            if storage.exists(name):
+                with storage.open(name, "rb") as f:
+                    tile = f.read()
+        except Exception:
+            logger.exception("Unable to read vector tile `%s`", name)
+
+        if tile is None:
+            tile = encode_tile(layers, z=z, x=x, y=y)
+            if tile:
+                try:
+                    storage.save(name, ContentFile(tile))
+                except Exception:
+                    logger.exception("Unable to store vector tile `%s`", name)
+
+    cache.set(cache_key, tile, timeout=_GEOJSON_CACHE_TIMEOUT)
+    return tile
+
+
 # ---------------------------------------------------------------------------
 # OGCFeatureService for GIS-View-scoped projects
 # ---------------------------------------------------------------------------
@@ -499,6 +965,8 @@ class ProjectViewOGCService(OGCFeatureService[GISView]):
         self,
         scope: GISView,
         collection_id: str,
+        *,
+        lod: int = 0,
     ) -> list[dict[str, Any]]:
         # Authorization is the responsibility of get_collection() (the
         # generic view always calls it first). Here we just fetch the
@@ -509,10 +977,31 @@ class ProjectViewOGCService(OGCFeatureService[GISView]):
         if parsed is None:
             return []
         sha, group = parsed
-        return filter_features_by_geometry_group(
-            _load_normalized_features(sha),
-            group,
-        )
+        return _load_group_features(sha, group, lod)
+
+    def get_spatial_index(
+        self,
+        scope: GISView,
+        collection_id: str,
+    ) -> FeatureSpatialIndex | None:
+        parsed = parse_typed_collection_id(collection_id)
+        if parsed is None:
+            return None
+        sha, group = parsed
+        return _load_spatial_index(sha, group)
+
+    def get_serialized_features(
+        self,
+        scope: GISView,
+        collection_id: str,
+        *,
+        lod: int = 0,
+    ) -> list[bytes] | None:
+        parsed = parse_typed_collection_id(collection_id)
+        if parsed is None:
+            return None
+        sha, group = parsed
+        return _load_serialized_features(sha, group, lod)
 
     def get_feature(
         self,
@@ -530,6 +1019,34 @@ class ProjectViewOGCService(OGCFeatureService[GISView]):
         sha, group = parsed
         return _load_feature_by_id(sha, feature_id, group)
 
+    def get_tile(
+        self,
+        scope: GISView,
+        commit_sha: str | None,
+        z: int,
+        x: int,
+        y: int,
+    ) -> bytes | None:
+        # Same reachability rule as get_collection(): pinned commits plus
+        # the latest commit of ``use_latest`` projects.
+        shas = list(
+            dict.fromkeys(
+                d["project_geojson"].commit_sha for d in scope.get_view_geojson_data()
+            )
+        )
+        if commit_sha is not None:
+            if commit_sha not in shas:
+                return None
+            shas = [commit_sha]
+        # Layer names are per-commit, so the tiles merge by concatenation.
+        return b"".join(_load_commit_tile(sha, z, x, y) for sha in shas)
+
+    def get_tile_cache_control(self, scope: GISView, commit_sha: str | None) -> str:
+        if commit_sha is None:
+            # The view membership (and its ``use_latest`` commits) moves.
+            return _USE_LATEST_CACHE_CONTROL
+        return super().get_tile_cache_control(scope, commit_sha)
+
     def get_etag(self, scope: GISView, collection_id: str) -> str | None:
         # Project commits are immutable, so the SHA + group itself is
         # a perfect ETag (a deploy that changes the geometry-classifier
@@ -569,12 +1086,60 @@ class ProjectViewOGCService(OGCFeatureService[GISView]):
 # ---------------------------------------------------------------------------
 
 
+def _get_view_data(
+    gis_view: GISView,
+    serializer_class: type[GISViewDataSerializer | PublicGISViewSerializer],
+    *,
+    expires_in: int,
+    lod: int,
+) -> dict[str, Any]:
+    """Serialize *gis_view* with its signed GeoJSON URLs, cached per view.
+
+    The data is reused as long as its signed URLs are (see
+    ``signed_url_window``) and until the view, its projects or their
+    GeoJSONs change. Data without its GeoJSON bundle is never reused.
+    """
+    start, end = signed_url_window(expires_in)
+    cache_key = (
+        f"gis_view_data_{serializer_class.__name__}_{gis_view.pk}"
+        f"_{GIS_VIEWS_GENERATION.get(gis_view.pk)}"
+        f"_{PROJECT_GEOJSONS_GENERATION.get()}"
+        f"_{expires_in}_{lod}_{start}"
+    )
+    if (data := cache.get(cache_key)) is not None:
+        return data  # type: ignore[no-any-return]
+
+    data = serializer_class(
+        gis_view,
+        context={"expires_in": expires_in, "lod": lod},
+    ).data
+    if "bundle_url" in data and data["bundle_url"] is None:
+        # The bundle is being built (see `GISView.get_geojson_bundle_url`):
+        # later requests must pick it up rather than reuse this data.
+        return data
+
+    cache.set(cache_key, data, timeout=max(end - int(time.time()), 1))
+    return data
+
+
+def _lod_from_request(request: Request) -> int:
+    """Level of detail matching the optional ``zoom`` query parameter."""
+    try:
+        zoom = int(request.query_params["zoom"])
+    except KeyError, ValueError, TypeError:
+        return 0
+    return lod_for_zoom(zoom)
+
+
 class GISViewDataApiView(GenericAPIView[GISView], SDBAPIViewMixin):
     """Private read-only endpoint to retrieve GISView data.
 
     Query params:
         - ``expires_in``: signed-URL expiration in seconds
           (default: 3600, min: 60, max: 86400).
+        - ``zoom``: map zoom level; links to simplified GeoJSON files
+          (see ``speleodb.gis.lod``) when omitted details are invisible
+          at that zoom. Full precision by default.
     """
 
     queryset = GISView.objects.all()
@@ -597,11 +1162,14 @@ class GISViewDataApiView(GenericAPIView[GISView], SDBAPIViewMixin):
             expires_in = _EXPIRES_IN_DEFAULT
 
         try:
-            serializer = GISViewDataSerializer(
-                gis_view,
-                context={"expires_in": expires_in},
+            return SuccessResponse(
+                _get_view_data(
+                    gis_view,
+                    GISViewDataSerializer,
+                    expires_in=expires_in,
+                    lod=_lod_from_request(request),
+                )
             )
-            return SuccessResponse(serializer.data)
 
         except Exception as e:
             logger.exception(
@@ -668,6 +1236,14 @@ class OGCGISViewSingleFeatureApiView(BaseOGCSingleFeatureApiView):
     service_class = ProjectViewOGCService
 
 
+class GISViewVectorTileApiView(BaseOGCVectorTileApiView):
+    """Mapbox Vector Tile endpoint for a GIS view (or one of its commits)."""
+
+    queryset = GISView.objects.all()
+    lookup_field = "gis_token"
+    service_class = ProjectViewOGCService
+
+
 # ---------------------------------------------------------------------------
 # Frontend map viewer endpoint (not OGC)
 # ---------------------------------------------------------------------------
@@ -676,7 +1252,8 @@ class OGCGISViewSingleFeatureApiView(BaseOGCSingleFeatureApiView):
 class PublicGISViewGeoJSONApiView(GenericAPIView[GISView], SDBAPIViewMixin):
     """Public endpoint returning GeoJSON URLs for the frontend map viewer.
 
-    Usage: Public SpeleoDB map viewer at /view/<gis_token>/.
+    Usage: Public SpeleoDB map viewer at /view/<gis_token>/. Accepts the
+    same ``zoom`` query parameter as ``GISViewDataApiView``.
     """
 
     queryset = GISView.objects.all()
@@ -687,11 +1264,14 @@ class PublicGISViewGeoJSONApiView(GenericAPIView[GISView], SDBAPIViewMixin):
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         gis_view = self.get_object()
         try:
-            serializer = PublicGISViewSerializer(
-                gis_view,
-                context={"expires_in": _EXPIRES_IN_DEFAULT},
+            return SuccessResponse(
+                _get_view_data(
+                    gis_view,
+                    PublicGISViewSerializer,
+                    expires_in=_EXPIRES_IN_DEFAULT,
+                    lod=_lod_from_request(request),
+                )
             )
-            return SuccessResponse(serializer.data)
         except Exception as e:
             logger.exception(
                 "Error generating public GeoJSON data for view %s",
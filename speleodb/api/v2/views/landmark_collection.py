@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import logging
 import re
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -37,6 +38,7 @@ from speleodb.api.v2.serializers.landmark_collection import (
 from speleodb.api.v2.serializers.landmark_collection import (
     LandmarkCollectionWithPermSerializer,
 )
+from speleodb.common.caching import LANDMARK_COLLECTIONS_GENERATION
 from speleodb.common.enums import PermissionLevel
 from speleodb.gis.models import Landmark
 from speleodb.gis.models import LandmarkCollection
@@ -625,6 +627,12 @@ class LandmarkCollectionBulkTransferApiView(
 
             transferred: int = source_landmarks.update(collection=target)
 
+            # ``update()`` sends no signal: version both collections here.
+            for collection_id in (source.id, target.id):
+                transaction.on_commit(
+                    partial(LANDMARK_COLLECTIONS_GENERATION.bump, collection_id)
+                )
+
         return SuccessResponse(
             {
                 "transferred": transferred,
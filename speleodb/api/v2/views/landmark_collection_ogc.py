@@ -15,7 +15,7 @@ abstraction:
 
 Both services hand back point-geometry features built by
 :class:`LandmarkGeoJSONSerializer`, with conditional-request support via
-an ETag derived from the collection state.
+an ETag derived from the collection version.
 """
 
 from __future__ import annotations
@@ -26,7 +26,8 @@ from typing import Any
 from typing import ClassVar
 from uuid import UUID
 
-from django.db.models import Count
+import orjson
+from django.core.cache import cache
 from django.db.models import Max
 from django.db.models import Min
 from rest_framework.authtoken.models import Token
@@ -41,11 +42,12 @@ from speleodb.api.v2.views.ogc_base import BaseOGCLandingPageApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCSingleFeatureApiView
 from speleodb.api.v2.views.ogc_base import OGCCollectionMeta
 from speleodb.api.v2.views.ogc_base import OGCFeatureService
+from speleodb.common.caching import LANDMARK_COLLECTIONS_GENERATION
 from speleodb.gis.models import Landmark
 from speleodb.gis.models import LandmarkCollection
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Sequence
 
 # Stable id for the singular collection exposed by the gis_token-scoped
 # (Landmark single) service. Persistence layer uses UUIDs but this
@@ -67,6 +69,10 @@ _LANDMARKS_COLLECTION_ID: str = "landmarks"
 # reads rather than the cache window.
 _LANDMARK_CACHE_CONTROL: str = "public, max-age=60, must-revalidate"
 
+# Serialized items of a collection version. Keys embed the ETag, so this
+# only bounds how long an unused version lingers in the cache.
+_LANDMARK_FEATURES_CACHE_TIMEOUT: int = 60 * 60 * 24
+
 
 # ---------------------------------------------------------------------------
 # Shared ETag + serialization helpers (used by both landmark services)
@@ -74,28 +80,14 @@ _LANDMARK_CACHE_CONTROL: str = "public, max-age=60, must-revalidate"
 
 
 def _landmark_collection_etag(collection: LandmarkCollection) -> str:
-    """Return a strong ETag for *collection* derived from its state.
+    """Return a strong ETag for *collection* derived from its version.
 
-    The ETag captures everything that could change the items
-    response: the collection's own ``modified_date``, the latest
-    landmark ``modified_date``, and the landmark count. Any landmark
-    add / update / delete invalidates the ETag.
+    The version is a cache-resident counter bumped (see
+    ``speleodb.gis.signals``) whenever the collection or one of its
+    landmarks is saved or deleted, so computing the ETag costs no query.
     """
-    agg = collection.landmarks.aggregate(
-        latest=Max("modified_date"),
-        landmark_count=Count("id"),
-    )
-    latest_landmark_modified: datetime | None = agg["latest"]
-    landmark_count: int = agg["landmark_count"]
-    latest_modified = (
-        latest_landmark_modified.isoformat() if latest_landmark_modified else ""
-    )
-    payload = (
-        f"{collection.id}:"
-        f"{collection.modified_date.isoformat()}:"
-        f"{latest_modified}:"
-        f"{landmark_count}"
-    )
+    version = LANDMARK_COLLECTIONS_GENERATION.get(collection.id)
+    payload = f"{collection.id}:{version}"
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
@@ -106,6 +98,22 @@ def _landmark_features(collection: LandmarkCollection) -> list[dict[str, Any]]:
     return list(serializer.data)
 
 
+def _landmark_serialized_features(collection: LandmarkCollection) -> list[bytes]:
+    """Return :func:`_landmark_features`, ``orjson``-dumped, cached per ETag.
+
+    A new ETag means a new cache key: entries of older versions are never
+    read again and simply expire.
+    """
+    cache_key = (
+        f"ogc_landmark_features_{collection.id}_{_landmark_collection_etag(collection)}"
+    )
+    serialized: list[bytes] | None = cache.get(cache_key)
+    if serialized is None:
+        serialized = [orjson.dumps(feat) for feat in _landmark_features(collection)]
+        cache.set(cache_key, serialized, _LANDMARK_FEATURES_CACHE_TIMEOUT)
+    return serialized
+
+
 def _landmark_feature(
     collection: LandmarkCollection, landmark_id: UUID
 ) -> dict[str, Any] | None:
@@ -207,6 +215,8 @@ class LandmarkSingleOGCService(OGCFeatureService[LandmarkCollection]):
         self,
         scope: LandmarkCollection,
         collection_id: str,
+        *,
+        lod: int = 0,  # Landmarks are points: there is nothing to simplify.
     ) -> list[dict[str, Any]]:
         # collection_id already validated by get_collection() in the
         # generic view; retain a defensive check so direct callers
@@ -215,6 +225,17 @@ class LandmarkSingleOGCService(OGCFeatureService[LandmarkCollection]):
             return []
         return _landmark_features(scope)
 
+    def get_serialized_features(
+        self,
+        scope: LandmarkCollection,
+        collection_id: str,
+        *,
+        lod: int = 0,  # Landmarks are points: there is nothing to simplify.
+    ) -> Sequence[bytes] | None:
+        if collection_id != _LANDMARKS_COLLECTION_ID:
+            return None
+        return _landmark_serialized_features(scope)
+
     def get_feature(
         self,
         scope: LandmarkCollection,
@@ -323,12 +344,26 @@ class LandmarkUserOGCService(OGCFeatureService[Token]):
         self,
         scope: Token,
         collection_id: str,
+        *,
+        lod: int = 0,  # Landmarks are points: there is nothing to simplify.
     ) -> list[dict[str, Any]]:
         collection = self._resolve_collection(scope, collection_id)
         if collection is None:
             return []
         return _landmark_features(collection)
 
+    def get_serialized_features(
+        self,
+        scope: Token,
+        collection_id: str,
+        *,
+        lod: int = 0,  # Landmarks are points: there is nothing to simplify.
+    ) -> Sequence[bytes] | None:
+        collection = self._resolve_collection(scope, collection_id)
+        if collection is None:
+            return None
+        return _landmark_serialized_features(collection)
+
     def get_feature(
         self,
         scope: Token,
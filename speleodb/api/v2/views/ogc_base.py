@@ -45,15 +45,20 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.renderers import BaseRenderer
 from rest_framework.renderers import JSONRenderer
 
+from speleodb.gis.lod import lod_for_zoom
+from speleodb.gis.mvt import MVT_CONTENT_TYPE
+from speleodb.gis.mvt import MVT_IMMUTABLE_CACHE_CONTROL
+from speleodb.gis.mvt import is_valid_tile
 from speleodb.gis.ogc_helpers import GEOMETRY_GROUPS_ORDERED
 from speleodb.gis.ogc_helpers import absolute_url
 from speleodb.gis.ogc_helpers import apply_ogc_query
 from speleodb.gis.ogc_helpers import build_collection_metadata
 from speleodb.gis.ogc_helpers import build_collections_response
 from speleodb.gis.ogc_helpers import build_conformance_declaration
-from speleodb.gis.ogc_helpers import build_items_envelope
 from speleodb.gis.ogc_helpers import build_landing_page
 from speleodb.gis.ogc_helpers import build_single_feature_response
+from speleodb.gis.ogc_helpers import iter_items_envelope
+from speleodb.gis.ogc_helpers import ogc_query_positions
 from speleodb.gis.ogc_helpers import parse_ogc_query
 from speleodb.gis.ogc_openapi import OGC_OPENAPI_BYTES
 from speleodb.gis.ogc_openapi import OGC_OPENAPI_CACHE_CONTROL
@@ -64,9 +69,12 @@ from speleodb.utils.response import NoWrapResponse
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from collections.abc import Sequence
 
     from rest_framework.request import Request
 
+    from speleodb.gis.ogc_helpers import FeatureSpatialIndex
+
 
 # ---------------------------------------------------------------------------
 # Renderers
@@ -134,6 +142,27 @@ class OpenAPI30Renderer(BaseRenderer):
         return orjson.dumps(data)
 
 
+class VectorTileRenderer(BaseRenderer):
+    """Declares ``application/vnd.mapbox-vector-tile`` for the tile views.
+
+    Map clients (MapLibre, QGIS) send ``Accept`` headers naming the MVT
+    media type; without a matching renderer DRF would 406 the request.
+    Like the renderers above, it is never used for serialisation — tile
+    views return the encoded bytes in a plain :class:`HttpResponse`.
+    """
+
+    media_type: str = MVT_CONTENT_TYPE
+    format: str = "mvt"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        return orjson.dumps(data)
+
+
 # ---------------------------------------------------------------------------
 # OGCFeatureService interface
 # ---------------------------------------------------------------------------
@@ -208,6 +237,8 @@ class OGCFeatureService[ScopeT](abc.ABC):
         self,
         scope: ScopeT,
         collection_id: str,
+        *,
+        lod: int = 0,
     ) -> list[dict[str, Any]]:
         """Return the normalized feature list for *collection_id*.
 
@@ -215,7 +246,66 @@ class OGCFeatureService[ScopeT](abc.ABC):
         generic view never caches the result, so the service can apply
         commit-SHA-keyed cache for immutable data and live queries for
         mutable data.
+
+        *lod* is the requested level of detail (see
+        :mod:`speleodb.gis.lod`); services without simplified geometries
+        ignore it. Every level holds the same features, in the same order.
+        """
+
+    def get_spatial_index(
+        self,
+        scope: ScopeT,
+        collection_id: str,
+    ) -> FeatureSpatialIndex | None:
+        """Return a spatial index over :meth:`get_features`, or ``None``.
+
+        Used to answer ``bbox`` queries without scanning every feature.
+        Only worth it for immutable collections, where the index can be
+        built once and reused; the default disables it.
+        """
+        return None
+
+    def get_serialized_features(
+        self,
+        scope: ScopeT,
+        collection_id: str,
+        *,
+        lod: int = 0,
+    ) -> Sequence[bytes] | None:
+        """Return :meth:`get_features`, each feature ``orjson``-dumped.
+
+        Lets immutable collections serialize their geometries once
+        instead of on every ``/items`` request. ``None`` (the default)
+        makes the view serialize the requested page itself.
+        """
+        return None
+
+    def get_tile(
+        self,
+        scope: ScopeT,
+        commit_sha: str | None,
+        z: int,
+        x: int,
+        y: int,
+    ) -> bytes | None:
+        """Return the Mapbox Vector Tile ``z/x/y``, or ``None`` if not served.
+
+        With a *commit_sha*, the tile covers that commit only; without,
+        every commit visible through *scope*. ``None`` (the default, also
+        used for unauthorized commits) makes the view return 404.
+        """
+        return None
+
+    def get_tile_cache_control(self, scope: ScopeT, commit_sha: str | None) -> str:
+        """Return the ``Cache-Control`` header value for a vector tile.
+
+        A commit tile is rendered from immutable data, so it can be cached
+        for good. Tiles merging every commit of *scope* change with its
+        membership and keep the service-wide :attr:`cache_control`.
         """
+        if commit_sha is not None:
+            return MVT_IMMUTABLE_CACHE_CONTROL
+        return self.cache_control
 
     def get_feature(
         self,
@@ -385,10 +475,11 @@ class BaseOGCCollectionItemsApiView(_OGCFeatureServiceView):
     """OGC API - Features ``/items`` endpoint (§7.15-7.16).
 
     Builds the response envelope per request via
-    :func:`build_items_envelope` so that ``timeStamp`` is fresh and
-    ``self`` reflects the actual request URL. Conditional requests
-    (``If-None-Match``) short-circuit to 304 when the service supplies
-    a stable ETag.
+    :func:`iter_items_envelope` so that ``timeStamp`` is fresh and
+    ``self`` reflects the actual request URL. The envelope is streamed
+    in chunks around the pre-serialized features supplied by the
+    service, when available. Conditional requests (``If-None-Match``)
+    short-circuit to 304 when the service supplies a stable ETag.
     """
 
     renderer_classes = [GeoJSONRenderer, LegacyGeoJSONRenderer, JSONRenderer]
@@ -426,19 +517,43 @@ class BaseOGCCollectionItemsApiView(_OGCFeatureServiceView):
             response_nm["Cache-Control"] = cache_control
             return response_nm
 
-        features = self.service.get_features(scope, collection_id)
-        sliced, number_matched = apply_ogc_query(features, query)
-
-        payload = build_items_envelope(
-            features=sliced,
-            request=request,
-            number_matched=number_matched,
-            query=query,
+        spatial_index = (
+            self.service.get_spatial_index(scope, collection_id)
+            if query.bbox is not None
+            else None
         )
-        content = orjson.dumps(payload)
+        # Positions are the same at every level of detail, so the
+        # (full-precision) spatial index still applies.
+        lod = lod_for_zoom(query.zoom)
+        serialized = self.service.get_serialized_features(scope, collection_id, lod=lod)
+
+        page: Sequence[bytes]
+        if serialized is not None and (
+            query.bbox is None
+            or (spatial_index is not None and len(spatial_index) == len(serialized))
+        ):
+            # Fast path: the feature dicts are not even loaded.
+            positions, number_matched = ogc_query_positions(
+                query,
+                count=len(serialized),
+                spatial_index=spatial_index,
+            )
+            page = [serialized[pos] for pos in positions]
+        else:
+            sliced, number_matched = apply_ogc_query(
+                self.service.get_features(scope, collection_id, lod=lod),
+                query,
+                spatial_index=spatial_index,
+            )
+            page = [orjson.dumps(feat) for feat in sliced]
 
         response = StreamingHttpResponse(
-            streaming_content=[content],
+            streaming_content=iter_items_envelope(
+                features=page,
+                request=request,
+                number_matched=number_matched,
+                query=query,
+            ),
             content_type="application/geo+json",
         )
         if etag_header:
@@ -494,6 +609,45 @@ class BaseOGCSingleFeatureApiView(_OGCFeatureServiceView):
         return response
 
 
+class BaseOGCVectorTileApiView(_OGCFeatureServiceView):
+    """Mapbox Vector Tile endpoint: ``<base>/tiles[/<sha>]/{z}/{x}/{y}.mvt``.
+
+    Not part of OGC API - Features: a viewport-sized alternative to
+    ``/items`` for map clients, sharing the same scope resolution and
+    authorization. Tiles use the XYZ (Web Mercator, y down) scheme; an
+    address outside the tile matrix returns 404.
+    """
+
+    renderer_classes = [VectorTileRenderer, JSONRenderer]
+
+    def get(
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        scope = self.get_object()
+        commit_sha: str | None = kwargs.get("commit_sha")
+        if commit_sha is not None:
+            commit_sha = commit_sha.lower()
+        z: int = kwargs["z"]
+        x: int = kwargs["x"]
+        y: int = kwargs["y"]
+
+        if not is_valid_tile(z, x, y):
+            raise Http404(f"Tile '{z}/{x}/{y}' does not exist.")
+
+        tile = self.service.get_tile(scope, commit_sha, z, x, y)
+        if tile is None:
+            raise Http404("Tiles not found.")
+
+        response = HttpResponse(tile, content_type=MVT_CONTENT_TYPE)
+        response["Cache-Control"] = self.service.get_tile_cache_control(
+            scope, commit_sha
+        )
+        return response
+
+
 # ---------------------------------------------------------------------------
 # OGC OpenAPI service-desc — single document shared by every family
 # ---------------------------------------------------------------------------
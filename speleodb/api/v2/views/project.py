@@ -109,13 +109,14 @@ class ProjectApiView(GenericAPIView[Project], SDBAPIViewMixin):
     @extend_schema(operation_id="v2_projects_list")
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         user = self.get_user()
-        project_ids = [perm.project.id for perm in user.permissions]
+        # Answers every `ProjectSerializer.get_permission` below.
+        user.load_project_levels()
         projects = (
             Project.objects.with_commits()  # pyright: ignore[reportAttributeAccessIssue]
             .with_commit_count()  # pyright: ignore[reportAttributeAccessIssue]
             .with_active_mutex()  # pyright: ignore[reportAttributeAccessIssue]
             .prefetch_related("_formats")
-            .filter(id__in=project_ids)
+            .filter(id__in=user.accessible_project_ids())
         )
 
         serializer = self.get_serializer(
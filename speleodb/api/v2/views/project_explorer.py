@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 import sentry_sdk
+from django.core.cache import cache
 from gitdb.exc import BadName as GitRevBadName
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
@@ -29,8 +30,35 @@ if TYPE_CHECKING:
     from rest_framework.request import Request
     from rest_framework.response import Response
 
+    from speleodb.git_engine.core import GitCommit
+
 logger = logging.getLogger(__name__)
 
+# The "last modifying commit" of every path is fully determined by the commit
+# SHA and therefore immutable - the timeout only bounds the cache footprint.
+_LAST_COMMITS_CACHE_TIMEOUT: int = 60 * 60 * 24 * 7
+
+
+def _get_last_modifying_commits(
+    project: Project, commit: GitCommit
+) -> dict[str, GitCommit]:
+    """Return `{path: last modifying GitCommit}` for every file of *commit*.
+
+    The `{path: hexsha}` mapping is computed in a single history walk (see
+    `GitCommit.last_modifying_commits`) and cached per (project, commit SHA).
+    Each distinct commit is instantiated once so its metadata is only parsed
+    once, no matter how many files it last touched.
+    """
+    cache_key = f"git_last_commits_{project.id}_{commit.hexsha}"
+    if (last_commits := cache.get(cache_key)) is None:
+        last_commits = commit.last_modifying_commits()
+        cache.set(cache_key, last_commits, timeout=_LAST_COMMITS_CACHE_TIMEOUT)
+
+    commits: dict[str, GitCommit] = {
+        hexsha: commit.repo.commit(hexsha) for hexsha in set(last_commits.values())
+    }
+    return {path: commits[hexsha] for path, hexsha in last_commits.items()}
+
 
 class ProjectRevisionsApiView(GenericAPIView[Project], SDBAPIViewMixin):
     queryset = Project.objects.prefetch_related("commits", "_formats").all()
@@ -54,7 +82,8 @@ class ProjectRevisionsApiView(GenericAPIView[Project], SDBAPIViewMixin):
 
 
 class ProjectGitExplorerApiView(GenericAPIView[Project], SDBAPIViewMixin):
-    queryset = Project.objects.all()
+    # `_formats` is read once per serialized commit (see `GitCommitSerializer`)
+    queryset = Project.objects.prefetch_related("_formats").all()
     permission_classes = [SDB_ReadAccess]
     serializer_class = ProjectSerializer
     lookup_field = "id"
@@ -63,10 +92,9 @@ class ProjectGitExplorerApiView(GenericAPIView[Project], SDBAPIViewMixin):
         user = self.get_user()
         project = self.get_object()
         try:
-            # Checkout default branch and pull repository.
-            project.checkout_commit_or_default_pull_branch()
-
-            commit = project.git_repo.commit(hexsha)
+            # Read straight from the project's bare mirror: no checkout, and a
+            # fetch only if the commit is not known locally yet.
+            commit = project.get_git_commit(hexsha)
 
             # Collect all the commits and sort them by date
             # Order: from most recent to oldest
@@ -76,7 +104,10 @@ class ProjectGitExplorerApiView(GenericAPIView[Project], SDBAPIViewMixin):
 
             file_serializer = GitFileSerializer(
                 [item for item in commit.tree.traverse() if isinstance(item, GitFile)],  # type: ignore[arg-type]
-                context={"project": project},
+                context={
+                    "project": project,
+                    "last_commits": _get_last_modifying_commits(project, commit),
+                },
                 many=True,
             )
 
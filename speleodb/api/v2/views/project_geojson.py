@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 
+from django.core.cache import cache
 from django.db.models import Prefetch
 from drf_spectacular.utils import extend_schema
 from rest_framework.authtoken.models import Token
@@ -28,22 +29,29 @@ from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WebViewerAccess
 from speleodb.api.v2.serializers import ProjectGeoJSONCommitSerializer
 from speleodb.api.v2.serializers import ProjectWithGeoJsonSerializer
+from speleodb.api.v2.views.gis_view import _GEOJSON_CACHE_TIMEOUT
+from speleodb.api.v2.views.gis_view import _USE_LATEST_CACHE_CONTROL
 from speleodb.api.v2.views.gis_view import _build_typed_collection_meta
 from speleodb.api.v2.views.gis_view import _load_collection_bbox
+from speleodb.api.v2.views.gis_view import _load_commit_tile
 from speleodb.api.v2.views.gis_view import _load_feature_by_id
 from speleodb.api.v2.views.gis_view import _load_geometry_groups_present
-from speleodb.api.v2.views.gis_view import _load_normalized_features
+from speleodb.api.v2.views.gis_view import _load_group_features
+from speleodb.api.v2.views.gis_view import _load_serialized_features
+from speleodb.api.v2.views.gis_view import _load_spatial_index
 from speleodb.api.v2.views.ogc_base import BaseOGCCollectionApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCCollectionItemsApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCCollectionsApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCConformanceApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCLandingPageApiView
 from speleodb.api.v2.views.ogc_base import BaseOGCSingleFeatureApiView
+from speleodb.api.v2.views.ogc_base import BaseOGCVectorTileApiView
 from speleodb.api.v2.views.ogc_base import OGCCollectionMeta
 from speleodb.api.v2.views.ogc_base import OGCFeatureService
+from speleodb.common.caching import PROJECT_GEOJSONS_GENERATION
+from speleodb.common.caching import USER_PERMISSIONS_GENERATION
 from speleodb.gis.models import ProjectGeoJSON
 from speleodb.gis.ogc_helpers import GEOMETRY_GROUPS_ORDERED
-from speleodb.gis.ogc_helpers import filter_features_by_geometry_group
 from speleodb.gis.ogc_helpers import parse_typed_collection_id
 from speleodb.surveys.models import Project
 from speleodb.utils.api_mixin import SDBAPIViewMixin
@@ -55,6 +63,7 @@ if TYPE_CHECKING:
     from rest_framework.request import Request
     from rest_framework.response import Response
 
+    from speleodb.gis.ogc_helpers import FeatureSpatialIndex
     from speleodb.users.models import User
 
 
@@ -72,8 +81,6 @@ class BaseUserProjectGeoJsonApiView(SDBAPIViewMixin):
         ``geojson.project.name`` resolve without per-row N+1 queries
         (ws6b).
         """
-        user_projects = [perm.project for perm in user.permissions]
-
         geojson_prefetch = Prefetch(
             "geojsons",
             queryset=ProjectGeoJSON.objects.select_related(
@@ -83,7 +90,7 @@ class BaseUserProjectGeoJsonApiView(SDBAPIViewMixin):
         )
 
         return Project.objects.filter(
-            id__in=[project.id for project in user_projects],
+            id__in=user.accessible_project_ids(),
         ).prefetch_related(geojson_prefetch)
 
 
@@ -131,31 +138,57 @@ class ProjectUserOGCService(OGCFeatureService[Token]):
     cache_control: ClassVar[str] = "public, max-age=86400"
 
     def list_collections(self, scope: Token) -> list[OGCCollectionMeta]:
+        """One collection per (accessible-project-latest-commit,
+        geometry_group) tuple actually present.
+
+        QGIS re-requests this document constantly, so it is built from
+        ``ProjectGeoJSON.geometry_metadata`` in a single query — no
+        storage read — and cached until the user's permissions or any
+        project GeoJSON change (see ``speleodb.common.caching``).
+        """
         user: User = scope.user
-        # One collection per (accessible-project-latest-commit,
-        # geometry_group) tuple actually present. Per-collection bbox
-        # is deferred to /collections/{id}; see
-        # ProjectViewOGCService.list_collections for the rationale.
-        helper = BaseUserProjectGeoJsonApiView()
-        projects = helper.get_user_projects(user)
+        cache_key = (
+            f"ogc_user_collections_{user.pk}"
+            f"_{USER_PERMISSIONS_GENERATION.get(user.pk)}"
+            f"_{PROJECT_GEOJSONS_GENERATION.get()}"
+        )
+        if (cached := cache.get(cache_key)) is not None:
+            return cached  # type: ignore[no-any-return]
+
+        latest_geojsons = (
+            ProjectGeoJSON.objects.filter(project__in=user.accessible_project_ids())
+            .order_by("project_id", "-commit__authored_date")
+            .distinct("project_id")
+            .values_list("commit_id", "project__name", "geometry_metadata")
+        )
+
         out: list[OGCCollectionMeta] = []
-        for project in projects:
-            geojsons = list(project.geojsons.all())
-            if not geojsons:
-                continue
-            latest = geojsons[0]
-            present = _load_geometry_groups_present(latest.commit_sha)
+        for commit_sha, project_name, metadata in sorted(
+            latest_geojsons, key=lambda row: (row[1], row[0])
+        ):
+            if metadata is None:
+                # Created before `geometry_metadata` existed. The bbox is
+                # deferred to /collections/{id}, as it used to be.
+                groups: dict[str, Any] = {
+                    group: {"bbox": None}
+                    for group in _load_geometry_groups_present(commit_sha)
+                }
+            else:
+                groups = metadata["groups"]
             for group in GEOMETRY_GROUPS_ORDERED:
-                if group not in present:
+                if group not in groups:
                     continue
+                bbox = groups[group]["bbox"]
                 out.append(
                     _build_typed_collection_meta(
-                        project_name=latest.project.name,
-                        commit_sha=latest.commit_sha,
+                        project_name=project_name,
+                        commit_sha=commit_sha,
                         group=group,
-                        bbox=None,
+                        bbox=tuple(bbox) if bbox is not None else None,
                     )
                 )
+
+        cache.set(cache_key, out, timeout=_GEOJSON_CACHE_TIMEOUT)
         return out
 
     def get_collection(
@@ -180,7 +213,7 @@ class ProjectUserOGCService(OGCFeatureService[Token]):
         except ProjectGeoJSON.DoesNotExist:
             return None
         try:
-            user.get_best_permission(project_geojson.project)
+            user.get_best_permission_level(project_geojson.project)
         except NotAuthorizedError:
             # Treat permission denial as "not found" — never leak the
             # existence of resources outside the user's read scope.
@@ -201,19 +234,42 @@ class ProjectUserOGCService(OGCFeatureService[Token]):
         self,
         scope: Token,
         collection_id: str,
+        *,
+        lod: int = 0,
     ) -> list[dict[str, Any]]:
         # Authorization performed in get_collection() — the generic
         # view always calls it first. The cached features list is
-        # keyed by commit SHA only; the geometry filter is applied
-        # at request time.
+        # keyed by commit SHA and geometry group only.
         parsed = parse_typed_collection_id(collection_id)
         if parsed is None:
             return []
         sha, group = parsed
-        return filter_features_by_geometry_group(
-            _load_normalized_features(sha),
-            group,
-        )
+        return _load_group_features(sha, group, lod)
+
+    def get_spatial_index(
+        self,
+        scope: Token,
+        collection_id: str,
+    ) -> FeatureSpatialIndex | None:
+        # Same commit-keyed index as ProjectViewOGCService.get_spatial_index.
+        parsed = parse_typed_collection_id(collection_id)
+        if parsed is None:
+            return None
+        sha, group = parsed
+        return _load_spatial_index(sha, group)
+
+    def get_serialized_features(
+        self,
+        scope: Token,
+        collection_id: str,
+        *,
+        lod: int = 0,
+    ) -> list[bytes] | None:
+        parsed = parse_typed_collection_id(collection_id)
+        if parsed is None:
+            return None
+        sha, group = parsed
+        return _load_serialized_features(sha, group, lod)
 
     def get_feature(
         self,
@@ -236,6 +292,42 @@ class ProjectUserOGCService(OGCFeatureService[Token]):
         sha, group = parsed
         return f"{sha}_{group}"
 
+    def get_tile(
+        self,
+        scope: Token,
+        commit_sha: str | None,
+        z: int,
+        x: int,
+        y: int,
+    ) -> bytes | None:
+        user: User = scope.user
+        if commit_sha is None:
+            # Latest commit of every readable project, as listed by
+            # list_collections().
+            helper = BaseUserProjectGeoJsonApiView()
+            shas = [
+                geojsons[0].commit_sha
+                for project in helper.get_user_projects(user)
+                if (geojsons := list(project.geojsons.all()))
+            ]
+            return b"".join(_load_commit_tile(sha, z, x, y) for sha in shas)
+
+        # Same permission check as get_collection(): denial is "not found".
+        try:
+            project_geojson = ProjectGeoJSON.objects.select_related("project").get(
+                commit__id=commit_sha
+            )
+            user.get_best_permission_level(project_geojson.project)
+        except ProjectGeoJSON.DoesNotExist, NotAuthorizedError:
+            return None
+        return _load_commit_tile(commit_sha, z, x, y)
+
+    def get_tile_cache_control(self, scope: Token, commit_sha: str | None) -> str:
+        if commit_sha is None:
+            # Follows the latest commits and the user's permissions.
+            return _USE_LATEST_CACHE_CONTROL
+        return super().get_tile_cache_control(scope, commit_sha)
+
 
 # ---------------------------------------------------------------------------
 # OGC API - Features: User subclasses (public, token-based)
@@ -290,6 +382,14 @@ class OGCGISUserSingleFeatureApiView(BaseOGCSingleFeatureApiView):
     service_class = ProjectUserOGCService
 
 
+class UserVectorTileApiView(BaseOGCVectorTileApiView):
+    """Mapbox Vector Tile endpoint for user-scoped projects."""
+
+    queryset = Token.objects.select_related("user").all()
+    lookup_field = "key"
+    service_class = ProjectUserOGCService
+
+
 # ---------------------------------------------------------------------------
 # Non-OGC: commit listing
 # ---------------------------------------------------------------------------
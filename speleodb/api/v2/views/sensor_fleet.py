@@ -14,8 +14,6 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import ValidationError
 from django.db.models import Case
 from django.db.models import Count
-from django.db.models import Exists
-from django.db.models import IntegerField
 from django.db.models import OuterRef
 from django.db.models import Prefetch
 from django.db.models import Q
@@ -38,6 +36,8 @@ from speleodb.api.v2.permissions import IsReadOnly
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WriteAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
+from speleodb.api.v2.resource_access import accessible_resources_queryset
 from speleodb.api.v2.serializers import SensorFleetSerializer
 from speleodb.api.v2.serializers import SensorFleetUserPermissionSerializer
 from speleodb.api.v2.serializers import SensorFleetWithPermSerializer
@@ -85,22 +85,11 @@ class SensorFleetApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
         """List all sensor fleets with user permissions."""
         user = self.get_user()
 
-        perm_qs = SensorFleetUserPermission.objects.filter(
-            sensor_fleet=OuterRef("pk"),
-            user=user,
-            is_active=True,
-        )
-
         fleets = (
-            SensorFleet.objects.filter(is_active=True)
-            .filter(Exists(perm_qs))
-            .annotate(
-                sensor_count=Count("sensors", distinct=True),
-                user_permission_level=Subquery(
-                    perm_qs.values("level")[:1],
-                    output_field=IntegerField(),
-                ),
+            accessible_resources_queryset(
+                SensorFleet.objects.filter(is_active=True), user
             )
+            .annotate(sensor_count=Count("sensors", distinct=True))
             .distinct()
         )
 
@@ -141,7 +130,9 @@ class SensorFleetApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
         return SuccessResponse(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class SensorFleetSpecificApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
+class SensorFleetSpecificApiView(
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
+):
     """
     GET: Retrieve a specific sensor fleet
     PUT/PATCH: Update a sensor fleet
@@ -212,7 +203,9 @@ class SensorFleetSpecificApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
         )
 
 
-class SensorApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
+class SensorApiView(
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
+):
     """
     GET: List all sensors in a fleet
     POST: Create a new sensor in a fleet
@@ -341,7 +334,9 @@ class SensorToggleFunctionalApiView(GenericAPIView[Sensor], SDBAPIViewMixin):
         return SuccessResponse(serializer.data)
 
 
-class SensorFleetPermissionApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
+class SensorFleetPermissionApiView(
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
+):
     """
     GET: List all permissions for a fleet
     POST: Grant permission to a user
@@ -550,7 +545,9 @@ class SensorFleetPermissionApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin)
         )
 
 
-class SensorFleetExportExcelApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
+class SensorFleetExportExcelApiView(
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
+):
     """
     Export sensor fleet sensors to Excel format.
 
@@ -675,7 +672,9 @@ class SensorFleetExportExcelApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin
         return response
 
 
-class SensorFleetWatchlistApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
+class SensorFleetWatchlistApiView(
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
+):
     """
     GET: List sensors in a fleet that are due for retrieval.
 
@@ -780,7 +779,7 @@ class SensorFleetWatchlistApiView(GenericAPIView[SensorFleet], SDBAPIViewMixin):
 
 
 class SensorFleetWatchlistExportExcelApiView(
-    GenericAPIView[SensorFleet], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[SensorFleet], SDBAPIViewMixin
 ):
     """
     Export watchlist sensors to Excel format.
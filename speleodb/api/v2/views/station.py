@@ -19,6 +19,7 @@ from speleodb.api.v2.permissions import IsReadOnly
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WriteAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
 from speleodb.api.v2.serializers.station import StationGeoJSONSerializer
 from speleodb.api.v2.serializers.station import StationSerializer
 from speleodb.api.v2.serializers.station import SubSurfaceStationSerializer
@@ -54,12 +55,9 @@ class BaseSubSurfaceStationsApiView(GenericAPIView[SubSurfaceStation], SDBAPIVie
     def get_queryset(self) -> QuerySet[SubSurfaceStation]:
         """Get only stations that the user has access to."""
         user = self.get_user()
-        user_projects: list[Project] = [
-            perm.project
-            for perm in user.permissions
-            if perm.level >= PermissionLevel.READ_ONLY
-        ]
-        return SubSurfaceStation.objects.filter(project__in=user_projects)
+        return SubSurfaceStation.objects.filter(
+            project__in=user.accessible_project_ids(PermissionLevel.READ_ONLY)
+        )
 
 
 class SubSurfaceStationsApiView(BaseSubSurfaceStationsApiView):
@@ -295,7 +293,9 @@ class SurfaceStationsGeoJSONApiView(BaseSurfaceStationsApiView):
         return NoWrapResponse(FeatureCollection(serializer.data))  # type: ignore[no-untyped-call]
 
 
-class NetworkStationsApiView(GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin):
+class NetworkStationsApiView(
+    UserPermissionLevelMixin, GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
+):
     """
     View to get all stations for a network or create a new station.
     """
@@ -353,7 +353,7 @@ class NetworkStationsApiView(GenericAPIView[SurfaceMonitoringNetwork], SDBAPIVie
 
 
 class NetworkStationsGeoJSONView(
-    GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
 ):
     """
     View to get all stations for a network as GeoJSON-compatible data.
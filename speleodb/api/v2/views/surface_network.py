@@ -7,10 +7,6 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Exists
-from django.db.models import IntegerField
-from django.db.models import OuterRef
-from django.db.models import Subquery
 from django.http import Http404
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions
@@ -23,6 +19,8 @@ from speleodb.api.v2.permissions import IsReadOnly
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
 from speleodb.api.v2.permissions import SDB_WriteAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
+from speleodb.api.v2.resource_access import accessible_resources_queryset
 from speleodb.api.v2.serializers.surface_network import (
     SurfaceMonitoringNetworkSerializer,
 )
@@ -70,21 +68,8 @@ class SurfaceMonitoringNetworkApiView(
         """List all networks with user permissions."""
         user = self.get_user()
 
-        perm_qs = SurfaceMonitoringNetworkUserPermission.objects.filter(
-            network=OuterRef("pk"),
-            user=user,
-            is_active=True,
-        )
-
-        networks = (
-            SurfaceMonitoringNetwork.objects.filter(is_active=True)
-            .filter(Exists(perm_qs))
-            .annotate(
-                user_permission_level=Subquery(
-                    perm_qs.values("level")[:1],
-                    output_field=IntegerField(),
-                ),
-            )
+        networks = accessible_resources_queryset(
+            SurfaceMonitoringNetwork.objects.filter(is_active=True), user
         )
 
         # # Build response data with permission info
@@ -119,7 +104,7 @@ class SurfaceMonitoringNetworkApiView(
 
 
 class SurfaceMonitoringNetworkSpecificApiView(
-    GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
 ):
     """
     GET: Retrieve a specific network
@@ -190,7 +175,7 @@ class SurfaceMonitoringNetworkSpecificApiView(
 
 
 class SurfaceMonitoringNetworkPermissionApiView(
-    GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[SurfaceMonitoringNetwork], SDBAPIViewMixin
 ):
     """
     GET: List all permissions for a network
@@ -14,6 +14,7 @@ from drf_spectacular.utils import extend_schema
 from rest_framework import permissions
 from rest_framework.generics import GenericAPIView
 
+from speleodb.common.enums import PermissionLevel
 from speleodb.gis.models import ExplorationLead
 from speleodb.gis.models import Landmark
 from speleodb.gis.models import LandmarkCollection
@@ -26,14 +27,11 @@ from speleodb.utils.response import SuccessResponse
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Iterable
 
     from rest_framework.request import Request
     from rest_framework.response import Response
 
-    from speleodb.surveys.models import TeamProjectPermission
-    from speleodb.surveys.models import UserProjectPermission
-
-    Permission = TeamProjectPermission | UserProjectPermission
 
 RECENT_ACTIVITY_LIMIT = 15
 COMMITS_OVER_TIME_MONTHS = 12
@@ -81,11 +79,13 @@ class UserDashboardStatsView(GenericAPIView[User], SDBAPIViewMixin):
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         user = self.get_user()
 
-        permissions_list: list[Permission] = user.permissions
-        project_ids: list[uuid.UUID] = [p.project_id for p in permissions_list]
+        levels: dict[uuid.UUID, int] = dict(
+            user.effective_project_permissions.values_list("project_id", "level")
+        )
+        project_ids: list[uuid.UUID] = list(levels)
 
         summary = self._build_summary(user, project_ids)
-        projects_by_level = self._build_projects_by_level(permissions_list)
+        projects_by_level = self._build_projects_by_level(levels.values())
         projects_by_type = self._build_projects_by_type(project_ids)
         commits_over_time = self._build_commits_over_time(user, project_ids)
         contribution_calendar = self._build_contribution_calendar(user, project_ids)
@@ -131,7 +131,7 @@ class UserDashboardStatsView(GenericAPIView[User], SDBAPIViewMixin):
 
     @staticmethod
     def _build_projects_by_level(
-        permissions_list: list[Permission],
+        levels: Iterable[int],
     ) -> dict[str, int]:
         """Breakdown by the three collaboration tiers only.
 
@@ -139,8 +139,8 @@ class UserDashboardStatsView(GenericAPIView[User], SDBAPIViewMixin):
         ``summary.total_projects`` which reports all accessible projects.
         """
         counts: Counter[str] = Counter()
-        for perm in permissions_list:
-            counts[str(perm.level_label)] += 1
+        for level in levels:
+            counts[str(PermissionLevel.from_value(level).label)] += 1
         return {
             "ADMIN": counts.get("ADMIN", 0),
             "READ_AND_WRITE": counts.get("READ_AND_WRITE", 0),
@@ -11,6 +11,7 @@ from rest_framework.generics import GenericAPIView
 
 from speleodb.api.v2.permissions import SDB_AdminAccess
 from speleodb.api.v2.permissions import SDB_ReadAccess
+from speleodb.api.v2.resource_access import UserPermissionLevelMixin
 from speleodb.api.v2.serializers import ExperimentSerializer
 from speleodb.api.v2.serializers import ExperimentUserPermissionSerializer
 from speleodb.common.enums import PermissionLevel
@@ -32,7 +33,9 @@ if TYPE_CHECKING:
     from rest_framework.response import Response
 
 
-class ExperimentUserPermissionListApiView(GenericAPIView[Experiment], SDBAPIViewMixin):
+class ExperimentUserPermissionListApiView(
+    UserPermissionLevelMixin, GenericAPIView[Experiment], SDBAPIViewMixin
+):
     queryset = Experiment.objects.all()
     permission_classes = [SDB_ReadAccess]
     serializer_class = ExperimentSerializer
@@ -57,7 +60,7 @@ class ExperimentUserPermissionListApiView(GenericAPIView[Experiment], SDBAPIView
 
 
 class ExperimentUserPermissionSpecificApiView(
-    GenericAPIView[Experiment], SDBAPIViewMixin
+    UserPermissionLevelMixin, GenericAPIView[Experiment], SDBAPIViewMixin
 ):
     queryset = Experiment.objects.all()
     permission_classes = [SDB_AdminAccess]
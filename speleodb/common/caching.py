@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from dataclasses import dataclass
+import time
 from typing import TYPE_CHECKING
+from typing import ClassVar
 
 from django.core.cache import cache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
     from uuid import UUID
 
 
@@ -17,52 +21,148 @@ logger = logging.getLogger(__name__)
 DEBUG_CACHING = False
 
 
-@dataclass
-class UserProjectPermissionInfo:
-    user: int | None
-    teams: list[int]
+class CacheGeneration:
+    """A cache-resident counter naming the current state of some data.
+
+    Cache entries derived from that data embed the generation in their key
+    and ``bump()`` is called whenever the data changes: stale entries are
+    never read again and simply expire. A generation that is evicted from
+    the cache restarts from the current time, so it never goes back to a
+    value an older entry was stored under.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def cache_key(self, scope: object = None) -> str:
+        return f"[{self.__class__.__name__}]{self.name}:{scope}"
+
+    def get(self, scope: object = None) -> int:
+        cache_key = self.cache_key(scope)
+        if (generation := cache.get(cache_key)) is None:
+            generation = time.time_ns()
+            if not cache.add(cache_key, generation, timeout=None):
+                generation = cache.get(cache_key, generation)
+        return generation  # type: ignore[no-any-return]
+
+    def get_many(self, scopes: Iterable[object]) -> list[int]:
+        scopes = list(scopes)
+        cache_keys = [self.cache_key(scope) for scope in scopes]
+        cached = cache.get_many(cache_keys)
+        return [
+            cached[cache_key] if cache_key in cached else self.get(scope)
+            for cache_key, scope in zip(cache_keys, scopes, strict=True)
+        ]
+
+    def bump(self, scope: object = None) -> None:
+        cache_key = self.cache_key(scope)
+        try:
+            cache.incr(cache_key)
+        except ValueError:
+            # Not cached: any new value is a new generation.
+            cache.add(cache_key, time.time_ns(), timeout=None)
+
+        if DEBUG_CACHING:
+            logger.info(f"{self.__class__.__name__} BUMP [{cache_key}] !")
+
+
+# Per user: bumped whenever the projects a user can access (or how) change.
+USER_PERMISSIONS_GENERATION = CacheGeneration("user_permissions")
+
+# Per survey team: bumped whenever the team's project permissions change.
+TEAM_PERMISSIONS_GENERATION = CacheGeneration("team_permissions")
+
+# Global: bumped whenever a project or one of its GeoJSON commits changes.
+PROJECT_GEOJSONS_GENERATION = CacheGeneration("project_geojsons")
+
+# Per GIS view: bumped whenever the view or its project selection changes.
+GIS_VIEWS_GENERATION = CacheGeneration("gis_views")
+
+# Per landmark collection: bumped whenever the collection or its landmarks change.
+LANDMARK_COLLECTIONS_GENERATION = CacheGeneration("landmark_collections")
 
 
 class UserProjectPermissionCache:
+    """Best permission level of a user on a project, user or team granted.
+
+    Entries are keyed by the generation of the user and of every team the
+    user is an active member of. The signals of ``speleodb.surveys`` bump
+    them on any grant, revocation or membership change, so a cached level
+    is never stale and a warm lookup costs no query.
+    """
+
+    # Stored in place of a level when the user cannot access the project.
+    NO_ACCESS: ClassVar[int] = -1
+
+    TIMEOUT: ClassVar[int] = 60 * 60
+
     def __init__(self) -> None:
         raise RuntimeError("This class should never be instanciated")
 
     @classmethod
-    def cache_key(cls, user_id: int, project_id: UUID) -> str:
-        return f"[{cls.__name__}]user:{user_id}=>project:{project_id}"
+    def teams_cache_key(cls, user_id: int, user_generation: int) -> str:
+        return f"[{cls.__name__}]user:{user_id}@{user_generation}=>teams"
 
     @classmethod
-    def get(cls, user_id: int, project_id: UUID) -> UserProjectPermissionInfo | None:
-        return None
-        cache_key = cls.cache_key(user_id, project_id)
-
-        if (rslt := cache.get(cache_key)) is None:
-            if DEBUG_CACHING:
-                logger.info(f"{cls.__name__} CACHE MISS [{cache_key}] !")
-            return None
-
-        if DEBUG_CACHING:
-            logger.info(f"{cls.__name__} CACHE HIT [{cache_key}] !")
-        return UserProjectPermissionInfo(**rslt)
+    def cache_key(
+        cls,
+        user_id: int,
+        project_id: UUID,
+        user_generation: int,
+        team_generations: dict[int, int],
+    ) -> str:
+        teams_digest = hashlib.sha256(
+            repr(sorted(team_generations.items())).encode()
+        ).hexdigest()
+        return (
+            f"[{cls.__name__}]user:{user_id}@{user_generation}:{teams_digest}"
+            f"=>project:{project_id}"
+        )
 
     @classmethod
-    def set(
+    def get_or_set(
         cls,
         user_id: int,
         project_id: UUID,
-        payload: UserProjectPermissionInfo,
-        timeout: int = 300,
-    ) -> None:
-        cache_key = cls.cache_key(user_id, project_id)
-        cache.set(cache_key, payload.__dict__, timeout=timeout)
+        *,
+        fetch_team_ids: Callable[[], Iterable[int]],
+        fetch_level: Callable[[], int | None],
+    ) -> int | None:
+        """Return the cached level, computing it on a miss.
+
+        Generations are read before the database is, so an entry computed
+        while a change commits is stored under a key that is already stale.
+        ``None`` means the user has no access to the project.
+        """
+        user_generation = USER_PERMISSIONS_GENERATION.get(user_id)
+
+        teams_cache_key = cls.teams_cache_key(user_id, user_generation)
+        if (team_ids := cache.get(teams_cache_key)) is None:
+            team_ids = sorted(fetch_team_ids())
+            cache.set(teams_cache_key, team_ids, timeout=cls.TIMEOUT)
+
+        team_generations = dict(
+            zip(team_ids, TEAM_PERMISSIONS_GENERATION.get_many(team_ids), strict=True)
+        )
+        cache_key = cls.cache_key(
+            user_id, project_id, user_generation, team_generations
+        )
+
+        if (level := cache.get(cache_key)) is None:
+            if DEBUG_CACHING:
+                logger.info(f"{cls.__name__} CACHE MISS [{cache_key}] !")
 
-        if DEBUG_CACHING:
-            logger.info(f"{cls.__name__} CACHE SET [{cache_key}] !")
+            level = fetch_level()
+            cache.set(
+                cache_key,
+                cls.NO_ACCESS if level is None else level,
+                timeout=cls.TIMEOUT,
+            )
 
-    @classmethod
-    def delete(cls, user_id: int, project_id: UUID) -> None:
-        cache_key = cls.cache_key(user_id, project_id)
-        cache.delete(cache_key)
+            if DEBUG_CACHING:
+                logger.info(f"{cls.__name__} CACHE SET [{cache_key}] !")
 
-        if DEBUG_CACHING:
-            logger.info(f"{cls.__name__} CACHE CLEAR [{cache_key}] !")
+        elif DEBUG_CACHING:
+            logger.info(f"{cls.__name__} CACHE HIT [{cache_key}] !")
+
+        return None if level == cls.NO_ACCESS else level
@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import logging
+import multiprocessing
 import shutil
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 from typing import Any
 
 import orjson
+from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management.base import BaseCommand
 from django.core.management.base import CommandError
+from django.db import connections
 
 from speleodb.common.enums import ProjectType
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.gis.ogc_helpers import build_geometry_metadata
 from speleodb.git_engine.core import GitFile
 from speleodb.processors import ArianeTMLFileProcessor
 from speleodb.processors._impl.compass_toml import CompassTOML
@@ -25,15 +34,55 @@ from speleodb.processors._impl.compass_toml import get_compass_mak_filepath
 from speleodb.surveys.models import Project
 from speleodb.surveys.models import ProjectCommit
 from speleodb.utils.exceptions import GeoJSONGenerationError
+from speleodb.utils.helpers import file_lock
 
 if TYPE_CHECKING:
     import argparse
+    from collections.abc import Generator
 
     from speleodb.git_engine.core import GitCommit
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BuildReport:
+    projects: int = 0
+    commits: int = 0
+    geojsons: int = 0
+    reused: int = 0
+    bytes_written: int = 0
+    failures: int = 0
+
+    def merge(self, other: BuildReport) -> None:
+        self.projects += other.projects
+        self.commits += other.commits
+        self.geojsons += other.geojsons
+        self.reused += other.reused
+        self.bytes_written += other.bytes_written
+        self.failures += other.failures
+
+
+@contextlib.contextmanager
+def project_git_lock(project: Project) -> Generator[None]:
+    """Exclusive lock on the project's local git copy, across processes."""
+    lock_dir = Path(settings.DJANGO_GIT_PROJECTS_DIR) / ".locks"
+
+    with file_lock(lock_dir / f"{project.id}.lock"):
+        yield
+
+
+def _process_project_in_worker(
+    project_id: uuid.UUID, force_recompute: bool
+) -> BuildReport:
+    """Entry point of `--workers` processes: one call per project."""
+    project = Project.objects.get(id=project_id)
+    try:
+        return Command()._process_project(project, force_recompute=force_recompute)  # noqa: SLF001
+    finally:
+        connections.close_all()
+
+
 class Command(BaseCommand):
     help = "Build stored GeoJSON files for all eligible projects or one project."
 
@@ -71,6 +120,24 @@ class Command(BaseCommand):
             action="store_true",
             help="Recompute and replace GeoJSON files that already exist.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of processes used to build --all projects in parallel. "
+                "Each project is processed by a single worker."
+            ),
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            default=None,
+            help=(
+                "File recording the projects fully processed by --all. Projects "
+                "listed there are skipped, so an interrupted run can be resumed."
+            ),
+        )
 
     def _materialize_ariane_source(
         self, commit: GitCommit, tmp_dirpath: Path
@@ -126,6 +193,42 @@ class Command(BaseCommand):
             case _:
                 return None
 
+    def _get_source_fingerprint(
+        self, project: Project, commit: GitCommit
+    ) -> str | None:
+        """SHA-256 over the blob shas of the files the GeoJSON is built from.
+
+        Two commits with the same fingerprint produce the same GeoJSON (e.g. a
+        commit that only adds a photo). Returns `None` when the sources can not
+        be identified, in which case the GeoJSON is always rebuilt.
+        """
+        match project.type:
+            case ProjectType.ARIANE:
+                source_paths = [ArianeTMLFileProcessor.TARGET_SAVE_FILENAME]
+            case ProjectType.COMPASS:
+                try:
+                    compass_toml_file = commit.tree / CompassTOML.__FILENAME__
+                except KeyError:
+                    return None
+                if not isinstance(compass_toml_file, GitFile):
+                    return None
+                cfg = CompassTOML.from_toml(compass_toml_file.content)
+                source_paths = [CompassTOML.__FILENAME__, *cfg.files]
+            case _:
+                return None
+
+        hasher = hashlib.sha256()
+        for rel_path in sorted(source_paths):
+            try:
+                git_file = commit.tree / rel_path
+            except KeyError:
+                return None
+            if not isinstance(git_file, GitFile):
+                return None
+            hasher.update(f"{rel_path}\0{git_file.hexsha}\n".encode())
+
+        return hasher.hexdigest()
+
     @staticmethod
     def _remove_local_copy(project: Project) -> None:
         with contextlib.suppress(FileNotFoundError):
@@ -137,82 +240,257 @@ class Command(BaseCommand):
         *,
         force_recompute: bool,
         fresh: bool = False,
-    ) -> None:
+    ) -> BuildReport:
         logger.info("")
         logger.info("-" * 60)
         logger.info("Processing Project: %s ~ %s", project.id, project.name)
 
-        try:
-            if fresh:
-                self._remove_local_copy(project)
+        report = BuildReport(projects=1)
+        # Source fingerprint => GeoJSON file generated during this run.
+        built_files: dict[str, str] = {}
 
-            git_repo = project.git_repo
+        with project_git_lock(project):
+            try:
+                if fresh:
+                    self._remove_local_copy(project)
 
-            for commit in git_repo.commits:
-                with contextlib.suppress(ProjectGeoJSON.DoesNotExist):
-                    obj = ProjectGeoJSON.objects.get(
-                        # Globally unique. Does not need to specify the project.
-                        commit__id=commit.hexsha,
-                    )
+                git_repo = project.git_repo
 
-                    if not force_recompute:
-                        logger.info(
-                            "GeoJSON for commit %s already exists. Skipping ...",
-                            commit.hexsha,
+                for commit in git_repo.commits:
+                    with contextlib.suppress(ProjectGeoJSON.DoesNotExist):
+                        obj = ProjectGeoJSON.objects.get(
+                            # Globally unique. Does not need to specify the project.
+                            commit__id=commit.hexsha,
                         )
-                        continue
-
-                    obj.delete()
 
-                logger.info(
-                    "Processing commit: %s - %s", commit.hexsha, commit.date_dt
-                )
+                        if not force_recompute:
+                            logger.info(
+                                "GeoJSON for commit %s already exists. Skipping ...",
+                                commit.hexsha,
+                            )
+                            continue
 
-                try:
-                    with TemporaryDirectory() as tmp_dir:
-                        source_path = self._materialize_geojson_source(
-                            project=project,
-                            commit=commit,
-                            tmp_dirpath=Path(tmp_dir),
-                        )
+                        obj.delete()
 
-                        if source_path is None:
-                            logger.warning(
-                                "No `%s` source file found in commit `%s`",
-                                project.type,
+                    logger.info(
+                        "Processing commit: %s - %s", commit.hexsha, commit.date_dt
+                    )
+                    report.commits += 1
+
+                    try:
+                        fingerprint = self._get_source_fingerprint(project, commit)
+
+                        if fingerprint is not None and (
+                            reused_file := self._get_reusable_geojson_file(
+                                project,
+                                fingerprint,
+                                # Existing files are what is being recomputed.
+                                built_files=built_files,
+                                allow_existing=not force_recompute,
+                            )
+                        ):
+                            logger.info(
+                                "Survey sources unchanged in commit %s. "
+                                "Reusing `%s` ...",
                                 commit.hexsha,
+                                reused_file,
                             )
+                            ProjectGeoJSON.objects.create(
+                                project=project,
+                                commit=ProjectCommit.get_or_create_from_commit(
+                                    project=project,
+                                    commit=commit,
+                                ),
+                                file=reused_file,
+                                source_fingerprint=fingerprint,
+                                geometry_metadata=self._get_geometry_metadata(
+                                    reused_file
+                                ),
+                            )
+                            report.reused += 1
                             continue
 
-                        try:
-                            geojson_data = project.build_geojson(source_path)
-                        except GeoJSONGenerationError:
-                            continue
+                        with TemporaryDirectory() as tmp_dir:
+                            source_path = self._materialize_geojson_source(
+                                project=project,
+                                commit=commit,
+                                tmp_dirpath=Path(tmp_dir),
+                            )
 
-                        geojson_f = SimpleUploadedFile(
-                            "test.geojson",
-                            orjson.dumps(geojson_data),
-                            content_type="application/geo+json",
-                        )
+                            if source_path is None:
+                                logger.warning(
+                                    "No `%s` source file found in commit `%s`",
+                                    project.type,
+                                    commit.hexsha,
+                                )
+                                continue
+
+                            try:
+                                geojson_data = project.build_geojson(source_path)
+                            except GeoJSONGenerationError:
+                                report.failures += 1
+                                continue
+
+                            geojson_payload = orjson.dumps(geojson_data)
+                            geojson_f = SimpleUploadedFile(
+                                "test.geojson",
+                                geojson_payload,
+                                content_type="application/geo+json",
+                            )
 
-                        commit_obj = ProjectCommit.get_or_create_from_commit(
-                            project=project,
-                            commit=commit,
-                        )
+                            commit_obj = ProjectCommit.get_or_create_from_commit(
+                                project=project,
+                                commit=commit,
+                            )
+
+                            obj = ProjectGeoJSON.objects.create(
+                                project=project,
+                                commit=commit_obj,
+                                file=geojson_f,
+                                source_fingerprint=fingerprint,
+                                geometry_metadata=build_geometry_metadata(
+                                    geojson_data.get("features", [])
+                                ),
+                            )
 
-                        ProjectGeoJSON.objects.create(
-                            project=project,
-                            commit=commit_obj,
-                            file=geojson_f,
+                            if fingerprint is not None:
+                                built_files[fingerprint] = obj.file.name
+
+                            report.geojsons += 1
+                            report.bytes_written += len(geojson_payload)
+
+                    except Exception:
+                        logger.exception(
+                            "Error processing project source in commit %s",
+                            commit.hexsha,
                         )
+                        report.failures += 1
+                        continue
+            finally:
+                self._remove_local_copy(project)
 
-                except Exception:
-                    logger.exception(
-                        "Error processing project source in commit %s", commit.hexsha
+        return report
+
+    @staticmethod
+    def _get_reusable_geojson_file(
+        project: Project,
+        fingerprint: str,
+        *,
+        built_files: dict[str, str],
+        allow_existing: bool,
+    ) -> str | None:
+        if (file_name := built_files.get(fingerprint)) is not None:
+            return file_name
+
+        if not allow_existing:
+            return None
+
+        return (
+            ProjectGeoJSON.objects.filter(
+                project=project, source_fingerprint=fingerprint
+            )
+            .values_list("file", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def _get_geometry_metadata(file_name: str) -> dict[str, Any] | None:
+        # Commits sharing a file share its metadata: no need to read it again.
+        return (
+            ProjectGeoJSON.objects.filter(
+                file=file_name, geometry_metadata__isnull=False
+            )
+            .values_list("geometry_metadata", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def _read_checkpoint(checkpoint: Path | None) -> set[str]:
+        if checkpoint is None or not checkpoint.exists():
+            return set()
+        return {line.strip() for line in checkpoint.read_text().splitlines()} - {""}
+
+    @staticmethod
+    def _write_checkpoint(checkpoint: Path | None, project_id: uuid.UUID) -> None:
+        if checkpoint is None:
+            return
+        with checkpoint.open(mode="a") as f:
+            f.write(f"{project_id}\n")
+
+    def _process_all_projects(
+        self,
+        projects: list[Project],
+        *,
+        force_recompute: bool,
+        workers: int,
+        checkpoint: Path | None,
+    ) -> BuildReport:
+        report = BuildReport()
+
+        if workers <= 1:
+            for project in projects:
+                try:
+                    project_report = self._process_project(
+                        project,
+                        force_recompute=force_recompute,
                     )
+                except Exception:
+                    logger.exception("An error occurred with project: %s", project.id)
+                    report.failures += 1
+                    continue
+
+                if isinstance(project_report, BuildReport):
+                    report.merge(project_report)
+                self._write_checkpoint(checkpoint, project.id)
+
+            return report
+
+        # Forked workers must not share the parent's database connections.
+        connections.close_all()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # Forked workers inherit the configured Django app registry.
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _process_project_in_worker, project.id, force_recompute
+                ): project
+                for project in projects
+            }
+
+            for future in as_completed(futures):
+                project = futures[future]
+                try:
+                    report.merge(future.result())
+                except Exception:
+                    logger.exception("An error occurred with project: %s", project.id)
+                    report.failures += 1
                     continue
-        finally:
-            self._remove_local_copy(project)
+
+                self._write_checkpoint(checkpoint, project.id)
+
+        return report
+
+    @staticmethod
+    def _log_report(report: BuildReport, elapsed: float) -> None:
+        logger.info("")
+        logger.info("=" * 60)
+        logger.info(
+            "Processed %d project(s) and %d commit(s) in %.1fs (%.2f commits/sec)",
+            report.projects,
+            report.commits,
+            elapsed,
+            report.commits / elapsed if elapsed > 0 else 0.0,
+        )
+        logger.info(
+            "GeoJSON files written: %d (%.2f MB) - reused: %d",
+            report.geojsons,
+            report.bytes_written / (1024 * 1024),
+            report.reused,
+        )
+        logger.info("Failures: %d", report.failures)
 
     def handle(
         self,
@@ -222,6 +500,8 @@ class Command(BaseCommand):
         fresh: bool = False,
         project_type: str | None = None,
         force_recompute: bool = False,
+        workers: int = 1,
+        checkpoint: Path | None = None,
         **kwargs: Any,
     ) -> None:
         if all_projects == (project_id is not None):
@@ -235,19 +515,35 @@ class Command(BaseCommand):
             if project_type is not None:
                 projects = projects.filter(type=project_type)
 
-            for project in projects.order_by("-modified_date"):
-                try:
-                    self._process_project(
-                        project,
-                        force_recompute=force_recompute,
-                    )
-                except Exception:
-                    logger.exception("An error occurred with project: %s", project.id)
+            done_project_ids = self._read_checkpoint(checkpoint)
+            if done_project_ids:
+                logger.info(
+                    "Resuming from checkpoint: %d project(s) already processed.",
+                    len(done_project_ids),
+                )
+
+            start_t = time.perf_counter()
+            report = self._process_all_projects(
+                [
+                    project
+                    for project in projects.order_by("-modified_date")
+                    if str(project.id) not in done_project_ids
+                ],
+                force_recompute=force_recompute,
+                workers=workers,
+                checkpoint=checkpoint,
+            )
+            self._log_report(report, elapsed=time.perf_counter() - start_t)
             return
 
         if project_type is not None:
             raise CommandError("--project_type can only be used with --all.")
 
+        if workers != 1 or checkpoint is not None:
+            raise CommandError(
+                "--workers and --checkpoint can only be used with --all."
+            )
+
         if project_id is None:
             raise CommandError("--project must include a project UUID.")
 
@@ -25,8 +25,11 @@ from speleodb.api.v2.tests.base_testcase import PermissionType
 from speleodb.api.v2.tests.factories import ProjectFactory
 from speleodb.common.enums import PermissionLevel
 from speleodb.common.enums import ProjectType
+from speleodb.common.management.commands.build_project_geojsons import BuildReport
 from speleodb.common.management.commands.build_project_geojsons import Command
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitRepo
 from speleodb.surveys.models import FileFormat
 from speleodb.surveys.models import Project
 
@@ -173,6 +176,96 @@ class TestBuildProjectGeoJSONCommand(TestCase):
 
         mock_process_project.assert_called_once()
 
+    def test_command_rejects_workers_in_project_mode(self) -> None:
+        with pytest.raises(CommandError, match="--workers"):
+            call_command(
+                "build_project_geojsons",
+                "--project",
+                str(self.project.id),
+                "--workers",
+                "4",
+            )
+
+    @patch.object(Command, "_process_project")
+    def test_all_mode_resumes_from_checkpoint(
+        self, mock_process_project: MagicMock
+    ) -> None:
+        other_project = ProjectFactory.create(
+            type=ProjectType.COMPASS, exclude_geojson=False
+        )
+        failing_project = ProjectFactory.create(
+            type=ProjectType.COMPASS, exclude_geojson=False
+        )
+
+        def process_project(project: Project, **kwargs: Any) -> BuildReport:
+            if project == failing_project:
+                raise RuntimeError("broken project")
+            return BuildReport(projects=1, commits=2)
+
+        mock_process_project.side_effect = process_project
+
+        with TemporaryDirectory() as tmp_dir:
+            checkpoint = pathlib.Path(tmp_dir) / "checkpoint.txt"
+            checkpoint.write_text(f"{self.project.id}\n")
+
+            call_command(
+                "build_project_geojsons", "--all", "--checkpoint", str(checkpoint)
+            )
+
+            processed = {c.args[0] for c in mock_process_project.call_args_list}
+            assert processed == {other_project, failing_project}
+
+            # Failed projects are not recorded: they are retried on resume.
+            assert checkpoint.read_text().splitlines() == [
+                str(self.project.id),
+                str(other_project.id),
+            ]
+
+    def test_process_project_reports_throughput(self) -> None:
+        git_repo = MagicMock()
+        git_repo.commits = [MagicMock(hexsha="a" * 40), MagicMock(hexsha="b" * 40)]
+
+        with (
+            TemporaryDirectory() as tmp_dir,
+            override_settings(DJANGO_GIT_PROJECTS_DIR=pathlib.Path(tmp_dir)),
+            patch.object(
+                Project, "git_repo", new_callable=PropertyMock, return_value=git_repo
+            ),
+            patch.object(
+                Command,
+                "_materialize_geojson_source",
+                side_effect=[None, RuntimeError("broken commit")],
+            ),
+        ):
+            report = Command()._process_project(  # noqa: SLF001
+                self.project, force_recompute=False
+            )
+
+        assert report == BuildReport(projects=1, commits=2, failures=1)
+
+    def test_source_fingerprint_ignores_non_survey_files(self) -> None:
+        command = Command()
+
+        with TemporaryDirectory() as tmp_dir:
+            repo = GitRepo.init(path=pathlib.Path(tmp_dir))
+
+            def commit_file(rel_path: str, content: bytes) -> str | None:
+                (repo.path / rel_path).write_bytes(content)
+                repo.index.add([rel_path])
+                repo.index.commit(
+                    f"Update {rel_path}", author=GIT_COMMITTER, committer=GIT_COMMITTER
+                )
+                return command._get_source_fingerprint(  # noqa: SLF001
+                    self.project, repo.head.commit
+                )
+
+            assert commit_file("README.md", b"no survey yet") is None
+
+            fingerprint = commit_file("ariane.tml", b"survey v1")
+            assert fingerprint is not None
+            assert commit_file("cave.jpg", b"photo") == fingerprint
+            assert commit_file("ariane.tml", b"survey v2") != fingerprint
+
     def test_fresh_removes_existing_copy_before_clone_and_after_processing(
         self,
     ) -> None:
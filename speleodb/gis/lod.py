@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""Levels of detail (LOD) of the per-commit project GeoJSON.
+
+Survey lines are stored at full precision, which is far more than an
+overview map can display. Each ``ProjectGeoJSON`` therefore gets a few
+simplified copies, written next to its file by a worker once it is
+created (see ``ProjectGeoJSON.build_levels_of_detail``):
+
+* level 0 is the original file;
+* level ``n > 0`` is the previous level with its lines simplified by
+  Douglas-Peucker at ``GEOJSON_LOD_TOLERANCES[n]`` degrees.
+
+Simplification never adds, drops or reorders features — points (the
+survey stations) are kept as is and every line keeps its two ends — so
+positions and feature ids are identical across levels, and a spatial
+index built on level 0 stays valid for the others.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+#: Douglas-Peucker tolerance, in degrees, of each level of detail.
+#: Roughly 5 m, 20 m and 100 m at the equator.
+GEOJSON_LOD_TOLERANCES: Final[dict[int, float]] = {
+    1: 0.00005,
+    2: 0.0002,
+    3: 0.001,
+}
+
+# Size of a map pixel at zoom 0 (a 256 px tile covering 360°).
+_DEGREES_PER_PIXEL_Z0: Final[float] = 360.0 / 256
+
+_MIN_LINE_VERTICES: Final[int] = 2
+
+
+def lod_file_name(name: str, level: int) -> str:
+    """Return the storage name of *level* for the GeoJSON stored at *name*.
+
+    ``<project>/<commit>.json`` becomes ``<project>/<commit>.lod<level>.json``.
+    """
+    return str(PurePosixPath(name).with_suffix(f".lod{level}.json"))
+
+
+def lod_for_zoom(zoom: int | None) -> int:
+    """Return the coarsest level of detail that is invisible at *zoom*.
+
+    A level qualifies when its tolerance is at most one map pixel at that
+    (Web Mercator) zoom level. ``None`` means full precision.
+    """
+    if zoom is None:
+        return 0
+    pixel_size = _DEGREES_PER_PIXEL_Z0 * 2.0 ** -max(zoom, 0)
+    level = 0
+    for candidate, tolerance in sorted(GEOJSON_LOD_TOLERANCES.items()):
+        if tolerance <= pixel_size:
+            level = candidate
+    return level
+
+
+def _segment_distance(
+    point: Sequence[float],
+    start: Sequence[float],
+    end: Sequence[float],
+) -> float:
+    """Planar distance from *point* to the segment ``start-end`` (2-D)."""
+    px, py = point[0], point[1]
+    sx, sy = start[0], start[1]
+    dx, dy = end[0] - sx, end[1] - sy
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(px - sx, py - sy)
+    t = max(0.0, min(1.0, ((px - sx) * dx + (py - sy) * dy) / length_sq))
+    return math.hypot(px - (sx + t * dx), py - (sy + t * dy))
+
+
+def simplify_line(
+    coordinates: Sequence[Sequence[float]],
+    tolerance: float,
+) -> list[Sequence[float]]:
+    """Douglas-Peucker simplification of a line, ends always kept.
+
+    Distances only use the first two ordinates; kept vertices are copied
+    unchanged (altitude included).
+    """
+    if len(coordinates) <= _MIN_LINE_VERTICES:
+        return list(coordinates)
+
+    keep = [False] * len(coordinates)
+    keep[0] = keep[-1] = True
+    # Iterative: survey lines can have thousands of vertices.
+    stack = [(0, len(coordinates) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_distance = 0.0
+        farthest = first
+        for i in range(first + 1, last):
+            distance = _segment_distance(
+                coordinates[i], coordinates[first], coordinates[last]
+            )
+            if distance > max_distance:
+                max_distance, farthest = distance, i
+        if max_distance > tolerance:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+
+    return [coord for coord, kept in zip(coordinates, keep, strict=True) if kept]
+
+
+def _is_line(coordinates: Any) -> bool:
+    return isinstance(coordinates, list) and all(
+        isinstance(coord, list) and len(coord) >= _MIN_LINE_VERTICES
+        for coord in coordinates
+    )
+
+
+def simplify_features(
+    features: Sequence[dict[str, Any]],
+    tolerance: float,
+) -> list[dict[str, Any]]:
+    """Return *features* with their (multi)line geometries simplified.
+
+    Pure: features that change are shallow-copied, the others (points,
+    malformed geometries) are returned as is.
+    """
+    out: list[dict[str, Any]] = []
+    for feature in features:
+        geometry = feature.get("geometry")
+        geom_type = geometry.get("type") if isinstance(geometry, dict) else None
+        coordinates = geometry.get("coordinates") if geom_type else None
+
+        if geom_type == "LineString" and _is_line(coordinates):
+            simplified: Any = simplify_line(coordinates, tolerance)
+        elif (
+            geom_type == "MultiLineString"
+            and isinstance(coordinates, list)
+            and all(_is_line(line) for line in coordinates)
+        ):
+            simplified = [simplify_line(line, tolerance) for line in coordinates]
+        else:
+            out.append(feature)
+            continue
+
+        out.append(
+            {**feature, "geometry": {**geometry, "coordinates": simplified}}  # type: ignore[dict-item]
+        )
+    return out
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-16
+
+from django.db import migrations
+from django.db import models
+
+import speleodb.surveys.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gis", "0037_landmark_collections"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectgeojson",
+            name="source_fingerprint",
+            field=speleodb.surveys.fields.Sha256Field(
+                blank=True,
+                default=None,
+                editable=False,
+                max_length=64,
+                null=True,
+                validators=[speleodb.surveys.fields.sha256_validator],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectgeojson",
+            index=models.Index(
+                fields=["project", "source_fingerprint"],
+                name="gis_project_project_014cb9_idx",
+            ),
+        ),
+    ]
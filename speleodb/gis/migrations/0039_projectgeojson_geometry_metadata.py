@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gis", "0038_projectgeojson_source_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectgeojson",
+            name="geometry_metadata",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+            ),
+        ),
+    ]
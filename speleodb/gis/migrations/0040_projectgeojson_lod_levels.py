@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-16
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gis", "0039_projectgeojson_geometry_metadata"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectgeojson",
+            name="lod_levels",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                editable=False,
+            ),
+        ),
+    ]
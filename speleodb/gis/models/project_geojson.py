@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 
+import orjson
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
 from django.db import models
+from django.db import transaction
 
+from speleodb.common.caching import PROJECT_GEOJSONS_GENERATION
+from speleodb.gis.lod import GEOJSON_LOD_TOLERANCES
+from speleodb.gis.lod import lod_file_name
+from speleodb.gis.lod import simplify_features
+from speleodb.gis.ogc_helpers import build_geometry_metadata
+from speleodb.gis.ogc_helpers import filter_features_by_geometry_group
+from speleodb.gis.ogc_helpers import normalize_features
+from speleodb.surveys.fields import Sha256Field
 from speleodb.surveys.models import Project
 from speleodb.surveys.models import ProjectCommit
 from speleodb.utils.s3_storages import GeoJSONStorage
+from speleodb.utils.s3_storages import get_cached_signed_url
 from speleodb.utils.validators import GeoJsonValidator
 
 if TYPE_CHECKING:
@@ -51,6 +64,34 @@ class ProjectGeoJSON(models.Model):
         validators=[GeoJsonValidator()],
     )
 
+    # SHA-256 of the survey source blobs the GeoJSON was generated from.
+    # Commits sharing a fingerprint share the same GeoJSON `file`.
+    source_fingerprint = Sha256Field(
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+
+    # Bbox, present geometry groups and per-group feature counts of `file`
+    # (see `build_geometry_metadata`), computed once at creation - callers
+    # that already parsed the GeoJSON pass it in. `None` on rows created
+    # before it existed.
+    geometry_metadata = models.JSONField(
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+
+    # Levels of detail of `file` that are stored (see `build_levels_of_detail`),
+    # so that serving one never needs a storage round trip to check for it.
+    lod_levels = models.JSONField(
+        blank=True,
+        default=list,
+        editable=False,
+    )
+
     creation_date = models.DateTimeField(auto_now_add=True, editable=False)
     modified_date = models.DateTimeField(auto_now=True, editable=False)
 
@@ -60,6 +101,7 @@ class ProjectGeoJSON(models.Model):
         indexes = [
             models.Index(fields=["project"]),
             models.Index(fields=["commit"]),
+            models.Index(fields=["project", "source_fingerprint"]),
         ]
         ordering = ["-commit__authored_date"]
 
@@ -73,12 +115,135 @@ class ProjectGeoJSON(models.Model):
         # (pk is always set due to OneToOneField)
         if not self._state.adding:
             raise ValidationError("ProjectGeoJSON objects are immutable once created.")
-        return super().save(*args, **kwargs)
+        if self.geometry_metadata is None:
+            self.geometry_metadata = build_geometry_metadata(
+                self._read_file_data().get("features", [])
+            )
+        super().save(*args, **kwargs)
+
+        from speleodb.gis.tasks import (  # noqa: PLC0415
+            build_project_geojson_derived_files,
+        )
+
+        # Derived from the stored file, so only once it is committed, and
+        # by a worker: simplification is far too slow for the upload request.
+        transaction.on_commit(
+            partial(build_project_geojson_derived_files.delay, self.pk),
+            robust=True,
+        )
 
     def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
-        self.file.delete(save=False)
+        # The file may be shared with other commits (see `source_fingerprint`)
+        if (
+            not ProjectGeoJSON.objects.filter(file=self.file.name)
+            .exclude(pk=self.pk)
+            .exists()
+        ):
+            for level in GEOJSON_LOD_TOLERANCES:
+                self.file.storage.delete(self.get_lod_file_name(level))
+            self.file.delete(save=False)
+        for group in self._stored_geometry_groups():
+            self.file.storage.delete(self.get_group_file_name(group))
         return super().delete(*args, **kwargs)
 
+    def _read_file_data(self) -> dict[str, Any]:
+        # NOTE: `file` may be an upload that Django saves after us, so it is
+        # rewound rather than closed (same as `GeoJsonValidator`).
+        file = self.file.open(mode="rb")
+        try:
+            return orjson.loads(file.read())  # type: ignore[no-any-return]
+        finally:
+            file.seek(0)
+
+    def _stored_geometry_groups(self) -> list[str]:
+        if self.geometry_metadata is None:
+            return []
+        return list(self.geometry_metadata["groups"])
+
+    def build_derived_files(self) -> None:
+        """Store everything derived from `file`: group splits and LODs.
+
+        Run by the `build_project_geojson_derived_files` task.
+        """
+        data = self._read_file_data()
+        self.build_geometry_group_files(data)
+        self.build_levels_of_detail(data)
+
+    # Per geometry group splits, served by the `<sha>_<group>` OGC collections
+    def get_group_file_name(self, group: str) -> str:
+        return f"{self.project_id}/{self.commit_id}.{group}.json"
+
+    def build_geometry_group_files(self, data: dict[str, Any] | None = None) -> None:
+        """Store the features of each geometry group present in `file`.
+
+        Features are stored normalized (see `normalize_features`): the
+        synthetic ids depend on the commit and on the position in the
+        whole collection, so the splits are per commit even when `file`
+        is shared with other commits.
+        """
+        if data is None:
+            data = self._read_file_data()
+
+        storage = self.file.storage
+        features = normalize_features(
+            data.get("features", []), commit_sha=self.commit_id
+        )
+        for group in self._stored_geometry_groups():
+            name = self.get_group_file_name(group)
+            if storage.exists(name):
+                continue
+            payload = orjson.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": filter_features_by_geometry_group(features, group),
+                }
+            )
+            storage.save(name, ContentFile(payload))
+
+    # Levels of detail — see `speleodb.gis.lod`
+    def get_lod_file_name(self, level: int) -> str:
+        return lod_file_name(self.file.name, level)
+
+    def get_stored_file_name(self, lod: int = 0) -> str:
+        """Storage name of the *lod* level of detail, or of `file` if the
+        level was not built (yet)."""
+        if lod and lod in self.lod_levels:
+            return self.get_lod_file_name(lod)
+        return self.file.name  # type: ignore[return-value]
+
+    def build_levels_of_detail(self, data: dict[str, Any] | None = None) -> None:
+        """Store the simplified copies of `file` that do not exist yet.
+
+        Each level is simplified from the previous one, which is both
+        cheaper and monotonic (a coarser level never has more vertices).
+        Commits sharing a `file` share its levels of detail too, and all
+        of them get the stored levels recorded in `lod_levels`.
+        """
+        storage = self.file.storage
+        if not all(
+            storage.exists(self.get_lod_file_name(level))
+            for level in GEOJSON_LOD_TOLERANCES
+        ):
+            if data is None:
+                data = self._read_file_data()
+
+            features = data.get("features", [])
+            for level, tolerance in sorted(GEOJSON_LOD_TOLERANCES.items()):
+                features = simplify_features(features, tolerance)
+                name = self.get_lod_file_name(level)
+                if not storage.exists(name):
+                    payload = orjson.dumps({**data, "features": features})
+                    storage.save(name, ContentFile(payload))
+
+        self.lod_levels = sorted(GEOJSON_LOD_TOLERANCES)
+        if (
+            ProjectGeoJSON.objects.filter(file=self.file.name)
+            .exclude(lod_levels=self.lod_levels)
+            .update(lod_levels=self.lod_levels)
+        ):
+            # Cached view data links these commits to `file` until now.
+            transaction.on_commit(PROJECT_GEOJSONS_GENERATION.bump)
+
     # Backward-compatible properties for legacy code
     @property
     def commit_sha(self) -> str:
@@ -107,7 +272,11 @@ class ProjectGeoJSON(models.Model):
 
     # Signed URL helper — delegates to django-storages which produces
     # CloudFront signed URLs in production or S3 presigned URLs in local dev.
-    def get_signed_download_url(self, expires_in: int = 3600) -> str:
+    # The file is immutable, so signed URLs are reused until close to expiry.
+    # A missing level of detail (not built yet) falls back to the original file.
+    def get_signed_download_url(self, expires_in: int = 3600, lod: int = 0) -> str:
         if not self.file:
             raise ValidationError("No file to download.")
-        return self.file.storage.url(self.file.name, expire=expires_in)  # type: ignore[call-arg]
+        return get_cached_signed_url(
+            self.file.storage, self.get_stored_file_name(lod), expires_in
+        )
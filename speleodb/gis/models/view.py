@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import logging
 import re
+import shutil
+import tempfile
 import uuid
 from typing import TYPE_CHECKING
 from typing import Any
 
+import orjson
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files.base import File
 from django.db import models
 from django.db.models import Prefetch
 from django.db.models import Q
@@ -17,9 +24,11 @@ from speleodb.gis.models import ProjectGeoJSON
 from speleodb.gis.models.utils import generate_random_token
 from speleodb.surveys.models import Project
 from speleodb.users.models import User
+from speleodb.utils.s3_storages import get_cached_signed_url
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from typing import IO
 
     from django.db.models.base import ModelBase
 
@@ -27,6 +36,57 @@ logger = logging.getLogger(__name__)
 
 sha1_regex = re.compile(r"^[0-9a-f]{40}$", re.IGNORECASE)
 
+# How long a queued GeoJSON bundle build is trusted to complete before
+# another request may queue it again.
+_GEOJSON_BUNDLE_LOCK_TIMEOUT = 10 * 60
+
+
+def get_geojson_bundle_name(geojsons: Iterable[ProjectGeoJSON], lod: int = 0) -> str:
+    """Content-addressed storage name of the bundle of *geojsons* at *lod*.
+
+    Keyed by the stored files the bundle is made of (a level of detail that
+    is not built yet resolves to the full-precision file, see
+    `ProjectGeoJSON.get_stored_file_name`) and when their GeoJSON was
+    generated, in case it ever is again. A bundle is therefore rebuilt
+    when one of the commits of its view changes or gets its level of detail.
+    """
+    key = ",".join(
+        sorted(
+            f"{g.commit_id}:{g.get_stored_file_name(lod)}@{g.creation_date.isoformat()}"
+            for g in geojsons
+        )
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f"bundles/{digest}.json.gz"
+
+
+def _geojson_bundle_lock_key(name: str) -> str:
+    return f"geojson_bundle_{name}:lock"
+
+
+def build_geojson_bundle(geojsons: Iterable[ProjectGeoJSON], lod: int = 0) -> IO[bytes]:
+    """Return a temporary file holding the gzip-compressed
+    ``{commit_sha: FeatureCollection}`` bundle, rewound.
+
+    Stored files are already valid JSON, so they are streamed in as is,
+    one at a time.
+    """
+    bundle = tempfile.TemporaryFile()  # noqa: SIM115
+    with gzip.GzipFile(fileobj=bundle, mode="wb") as gz:
+        gz.write(b"{")
+        for idx, project_geojson in enumerate(
+            sorted(geojsons, key=lambda g: g.commit_id)
+        ):
+            if idx:
+                gz.write(b",")
+            gz.write(orjson.dumps(project_geojson.commit_id) + b":")
+            name = project_geojson.get_stored_file_name(lod)
+            with project_geojson.file.storage.open(name, "rb") as f:
+                shutil.copyfileobj(f, gz)
+        gz.write(b"}")
+    bundle.seek(0)
+    return bundle
+
 
 class GISView(models.Model):
     """
@@ -193,7 +253,9 @@ class GISView(models.Model):
 
         return results
 
-    def get_geojson_urls(self, expires_in: int = 3600) -> list[dict[str, Any]]:
+    def get_geojson_urls(
+        self, expires_in: int = 3600, lod: int = 0
+    ) -> list[dict[str, Any]]:
         """
         Get all GeoJSON signed URLs for projects in this view.
 
@@ -201,6 +263,7 @@ class GISView(models.Model):
 
         Args:
             expires_in: URL expiration time in seconds (default: 1 hour)
+            lod: level of detail of the GeoJSON (default: 0, full precision)
 
         Returns:
             List of dicts containing project info and signed URLs
@@ -214,7 +277,7 @@ class GISView(models.Model):
             try:
                 geojson_data["url"] = geojson_data.pop(
                     "project_geojson"
-                ).get_signed_download_url(expires_in=expires_in)
+                ).get_signed_download_url(expires_in=expires_in, lod=lod)
 
             except ValidationError, Exception:
                 logger.exception(
@@ -228,6 +291,62 @@ class GISView(models.Model):
 
         return result
 
+    def get_geojson_bundle_url(
+        self, expires_in: int = 3600, lod: int = 0
+    ) -> str | None:
+        """
+        Get a signed URL to the GeoJSON of every project in this view at once.
+
+        The bundle is a single gzip-encoded JSON object mapping each commit
+        SHA to its GeoJSON (see `build_geojson_bundle`). It is immutable and
+        built by a worker (`build_gis_view_geojson_bundle`), queued by the
+        first request that misses it.
+
+        Args:
+            expires_in: URL expiration time in seconds (default: 1 hour)
+            lod: level of detail of the GeoJSON (default: 0, full precision)
+
+        Returns:
+            The signed URL, or None for an empty view or until the bundle
+            is built.
+        """
+
+        geojsons = [data["project_geojson"] for data in self.get_view_geojson_data()]
+        if not geojsons:
+            return None
+
+        storage = geojsons[0].file.storage
+        name = get_geojson_bundle_name(geojsons, lod)
+        if storage.exists(name):
+            return get_cached_signed_url(storage, name, expires_in)
+
+        if cache.add(
+            _geojson_bundle_lock_key(name), "1", timeout=_GEOJSON_BUNDLE_LOCK_TIMEOUT
+        ):
+            from speleodb.gis.tasks import (  # noqa: PLC0415
+                build_gis_view_geojson_bundle,
+            )
+
+            build_gis_view_geojson_bundle.delay(str(self.pk), lod)
+
+        return None
+
+    def build_geojson_bundle(self, lod: int = 0) -> None:
+        """Store the GeoJSON bundle of this view at *lod*, unless it exists."""
+        geojsons = [data["project_geojson"] for data in self.get_view_geojson_data()]
+        if not geojsons:
+            return
+
+        storage = geojsons[0].file.storage
+        name = get_geojson_bundle_name(geojsons, lod)
+        try:
+            if not storage.exists(name):
+                with build_geojson_bundle(geojsons, lod) as bundle:
+                    # `.json.gz`: stored with `Content-Encoding: gzip`.
+                    storage.save(name, File(bundle))
+        finally:
+            cache.delete(_geojson_bundle_lock_key(name))
+
 
 class GISProjectView(models.Model):
     """
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+
+"""Mapbox Vector Tile (MVT 2.1) encoding of GeoJSON features.
+
+Pure helpers — no Django, no I/O — used by the ``.../tiles/{z}/{x}/{y}.mvt``
+endpoints to render the immutable per-commit ``ProjectGeoJSON`` data one
+Web Mercator tile at a time, so that a client zoomed out over a whole cave
+system downloads a few quantized tiles instead of the full GeoJSON.
+
+The protobuf wire format is written by hand: a tile only uses varints,
+length-delimited fields and doubles, which does not justify an extra
+dependency. See https://github.com/mapbox/vector-tile-spec/tree/master/2.1.
+
+Geometry handling:
+
+* Coordinates are projected to Web Mercator, then to the tile-local
+  ``[0, extent]`` integer grid. The third (altitude) ordinate is dropped.
+* Lines are clipped to the tile square grown by ``buffer`` units on each
+  side (so that strokes do not show seams at tile edges); a line leaving
+  and re-entering the tile becomes several parts of the same feature.
+* Points outside the buffered square are dropped.
+* Polygons (and any geometry :func:`classify_geometry` does not know) are
+  ignored, mirroring the OGC typed collections.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import struct
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+MVT_CONTENT_TYPE: Final[str] = "application/vnd.mapbox-vector-tile"
+
+#: ``Cache-Control`` of tiles rendered from a single (immutable) commit.
+MVT_IMMUTABLE_CACHE_CONTROL: Final[str] = "public, max-age=31536000, immutable"
+
+#: Tile-local grid size. 4096 is the de-facto standard (Mapbox GL, QGIS).
+MVT_EXTENT: Final[int] = 4096
+
+#: Clipping buffer around the tile, in tile-local units.
+MVT_BUFFER: Final[int] = 64
+
+#: Deepest zoom level served. z=24 is ~1 cm per tile unit at the equator,
+#: well beyond the precision of a cave survey.
+MVT_MAX_ZOOM: Final[int] = 24
+
+# Web Mercator latitude limit: the latitude at which the projected world
+# becomes a square.
+_MAX_LATITUDE: Final[float] = 85.0511287798066
+
+# MVT geometry command ids (spec §4.3.1).
+_CMD_MOVE_TO: Final[int] = 1
+_CMD_LINE_TO: Final[int] = 2
+
+# MVT ``GeomType`` enum values.
+_GEOM_TYPE_POINT: Final[int] = 1
+_GEOM_TYPE_LINESTRING: Final[int] = 2
+
+# Protobuf wire types.
+_WIRE_VARINT: Final[int] = 0
+_WIRE_FIXED64: Final[int] = 1
+_WIRE_LENGTH_DELIMITED: Final[int] = 2
+
+_MIN_LINE_VERTICES: Final[int] = 2
+_UINT64_MAX: Final[int] = 2**64 - 1
+_SINT64_MIN: Final[int] = -(2**63)
+
+
+# ---------------------------------------------------------------------------
+# Tile addressing
+# ---------------------------------------------------------------------------
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    """Return ``True`` if ``z/x/y`` addresses an existing XYZ tile."""
+    if not 0 <= z <= MVT_MAX_ZOOM:
+        return False
+    n = 1 << z
+    return 0 <= x < n and 0 <= y < n
+
+
+def _tile_to_lon(x: float, n: int) -> float:
+    return x / n * 360.0 - 180.0
+
+
+def _tile_to_lat(y: float, n: int) -> float:
+    return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * y / n))))
+
+
+def tile_bbox(
+    z: int,
+    x: int,
+    y: int,
+    *,
+    extent: int = MVT_EXTENT,
+    buffer: int = MVT_BUFFER,
+) -> tuple[float, float, float, float]:
+    """Return the CRS84 ``(min_lon, min_lat, max_lon, max_lat)`` of a tile.
+
+    The bbox includes the clipping *buffer*, so it selects every feature
+    that may contribute to the tile. Longitudes are not wrapped: the
+    buffered bbox of an edge tile extends slightly past ±180°.
+    """
+    n = 1 << z
+    pad = buffer / extent
+    y_min = max(y - pad, 0.0)
+    y_max = min(y + 1 + pad, float(n))
+    return (
+        _tile_to_lon(x - pad, n),
+        _tile_to_lat(y_max, n),
+        _tile_to_lon(x + 1 + pad, n),
+        _tile_to_lat(y_min, n),
+    )
+
+
+class _TileProjection:
+    """Project CRS84 positions to the tile-local grid of ``z/x/y``."""
+
+    def __init__(self, z: int, x: int, y: int, extent: int) -> None:
+        self.scale = float((1 << z) * extent)
+        self.x_offset = float(x * extent)
+        self.y_offset = float(y * extent)
+
+    def __call__(self, position: Sequence[Any]) -> tuple[float, float] | None:
+        try:
+            lon = float(position[0])
+            lat = float(position[1])
+        except IndexError, TypeError, ValueError:
+            return None
+        if not (math.isfinite(lon) and math.isfinite(lat)):
+            return None
+
+        lat = max(-_MAX_LATITUDE, min(_MAX_LATITUDE, lat))
+        sin_lat = math.sin(math.radians(lat))
+        world_x = (lon + 180.0) / 360.0
+        world_y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+        return (
+            world_x * self.scale - self.x_offset,
+            world_y * self.scale - self.y_offset,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Clipping
+# ---------------------------------------------------------------------------
+
+
+def _clip_segment(
+    p0: tuple[float, float],
+    p1: tuple[float, float],
+    lo: float,
+    hi: float,
+) -> tuple[tuple[float, float], tuple[float, float]] | None:
+    """Liang-Barsky clip of segment ``p0-p1`` to the square ``[lo, hi]²``."""
+    x0, y0 = p0
+    dx = p1[0] - x0
+    dy = p1[1] - y0
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, x0 - lo),
+        (dx, hi - x0),
+        (-dy, y0 - lo),
+        (dy, hi - y0),
+    ):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            if t > t1:
+                return None
+            t0 = max(t0, t)
+        else:
+            if t < t0:
+                return None
+            t1 = min(t1, t)
+    return (x0 + t0 * dx, y0 + t0 * dy), (x0 + t1 * dx, y0 + t1 * dy)
+
+
+def _clip_line(
+    line: Sequence[tuple[float, float]],
+    lo: float,
+    hi: float,
+) -> list[list[tuple[int, int]]]:
+    """Clip a projected line and quantize it to the integer grid.
+
+    Returns one part per run of the line inside the square. Consecutive
+    vertices collapsing onto the same grid cell are merged, and parts
+    shorter than two distinct vertices are dropped.
+    """
+    parts: list[list[tuple[int, int]]] = []
+    current: list[tuple[int, int]] = []
+
+    def flush() -> None:
+        if len(current) >= _MIN_LINE_VERTICES:
+            parts.append(current.copy())
+        current.clear()
+
+    for p0, p1 in itertools.pairwise(line):
+        clipped = _clip_segment(p0, p1, lo, hi)
+        if clipped is None:
+            flush()
+            continue
+        start, end = clipped
+        q_start = (round(start[0]), round(start[1]))
+        q_end = (round(end[0]), round(end[1]))
+        if current and current[-1] != q_start:
+            # The previous segment left the square: start a new part.
+            flush()
+        if not current:
+            current.append(q_start)
+        if current[-1] != q_end:
+            current.append(q_end)
+        if not (lo <= p1[0] <= hi and lo <= p1[1] <= hi):
+            # The line leaves the square within this segment.
+            flush()
+    flush()
+    return parts
+
+
+# ---------------------------------------------------------------------------
+# Protobuf encoding
+# ---------------------------------------------------------------------------
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:  # noqa: PLR2004
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _length_delimited(field: int, payload: bytes) -> bytes:
+    return _key(field, _WIRE_LENGTH_DELIMITED) + _varint(len(payload)) + payload
+
+
+def _packed(field: int, values: Iterable[int]) -> bytes:
+    return _length_delimited(field, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: Any) -> bytes | None:
+    """Encode a property value as an MVT ``Value`` message.
+
+    Nested values (lists, objects) are stored as their JSON text since MVT
+    attributes are scalar. ``None`` values are skipped (``None`` return).
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return _key(7, _WIRE_VARINT) + _varint(int(value))
+    if isinstance(value, int) and _SINT64_MIN <= value <= _UINT64_MAX:
+        if value >= 0:
+            return _key(5, _WIRE_VARINT) + _varint(value)
+        return _key(6, _WIRE_VARINT) + _varint(_zigzag(value))
+    if isinstance(value, float):
+        return _key(3, _WIRE_FIXED64) + struct.pack("<d", value)
+    if not isinstance(value, str):
+        value = orjson.dumps(value, default=str).decode()
+    return _length_delimited(1, value.encode())
+
+
+class _LayerBuilder:
+    """Accumulates the features of one layer and its key/value tables."""
+
+    def __init__(self, name: str, extent: int) -> None:
+        self.name = name
+        self.extent = extent
+        self.keys: dict[str, int] = {}
+        self.values: dict[bytes, int] = {}
+        self.features: list[bytes] = []
+
+    def _tags(self, feature: dict[str, Any]) -> list[int]:
+        properties = feature.get("properties")
+        attributes = dict(properties) if isinstance(properties, dict) else {}
+        # MVT feature ids must be unsigned integers; SpeleoDB ids are
+        # strings, so they travel as a regular attribute.
+        if feature.get("id") is not None:
+            attributes.setdefault("id", feature["id"])
+
+        tags: list[int] = []
+        for key, value in attributes.items():
+            encoded = _encode_value(value)
+            if encoded is None:
+                continue
+            tags.append(self.keys.setdefault(str(key), len(self.keys)))
+            tags.append(self.values.setdefault(encoded, len(self.values)))
+        return tags
+
+    def add(
+        self,
+        feature: dict[str, Any],
+        geom_type: int,
+        commands: list[int],
+    ) -> None:
+        message = (
+            _packed(2, self._tags(feature))
+            + _key(3, _WIRE_VARINT)
+            + _varint(geom_type)
+            + _packed(4, commands)
+        )
+        self.features.append(_length_delimited(2, message))
+
+    def encode(self) -> bytes:
+        return (
+            _key(15, _WIRE_VARINT)
+            + _varint(2)
+            + _length_delimited(1, self.name.encode())
+            + b"".join(self.features)
+            + b"".join(_length_delimited(3, key.encode()) for key in self.keys)
+            + b"".join(_length_delimited(4, value) for value in self.values)
+            + _key(5, _WIRE_VARINT)
+            + _varint(self.extent)
+        )
+
+
+def _command(command_id: int, count: int) -> int:
+    return (command_id & 0x7) | (count << 3)
+
+
+def _point_commands(points: Sequence[tuple[int, int]]) -> list[int]:
+    commands = [_command(_CMD_MOVE_TO, len(points))]
+    cx, cy = 0, 0
+    for px, py in points:
+        commands.extend((_zigzag(px - cx), _zigzag(py - cy)))
+        cx, cy = px, py
+    return commands
+
+
+def _line_commands(parts: Sequence[Sequence[tuple[int, int]]]) -> list[int]:
+    commands: list[int] = []
+    cx, cy = 0, 0
+    for part in parts:
+        (sx, sy), rest = part[0], part[1:]
+        commands.extend((_command(_CMD_MOVE_TO, 1), _zigzag(sx - cx), _zigzag(sy - cy)))
+        cx, cy = sx, sy
+        commands.append(_command(_CMD_LINE_TO, len(rest)))
+        for px, py in rest:
+            commands.extend((_zigzag(px - cx), _zigzag(py - cy)))
+            cx, cy = px, py
+    return commands
+
+
+def _geometry_lines(geometry: dict[str, Any]) -> list[Sequence[Any]]:
+    coordinates = geometry.get("coordinates")
+    if not isinstance(coordinates, list):
+        return []
+    if geometry.get("type") == "LineString":
+        return [coordinates]
+    return [line for line in coordinates if isinstance(line, list)]
+
+
+def _geometry_points(geometry: dict[str, Any]) -> list[Sequence[Any]]:
+    coordinates = geometry.get("coordinates")
+    if not isinstance(coordinates, list):
+        return []
+    if geometry.get("type") == "Point":
+        return [coordinates]
+    return [point for point in coordinates if isinstance(point, list)]
+
+
+def encode_tile(
+    layers: Mapping[str, Iterable[dict[str, Any]]],
+    *,
+    z: int,
+    x: int,
+    y: int,
+    extent: int = MVT_EXTENT,
+    buffer: int = MVT_BUFFER,
+) -> bytes:
+    """Encode GeoJSON features as the MVT tile ``z/x/y``.
+
+    *layers* maps each layer name to its features; features whose geometry
+    does not touch the (buffered) tile are skipped, and so are layers left
+    without features. A tile with no feature at all encodes to ``b""``,
+    which is a valid, empty MVT.
+
+    Layers are independent protobuf fields, so tiles rendered with disjoint
+    layer names can be merged by plain byte concatenation.
+    """
+    project = _TileProjection(z, x, y, extent)
+    lo, hi = float(-buffer), float(extent + buffer)
+
+    out: list[bytes] = []
+    for name, features in layers.items():
+        layer = _LayerBuilder(name, extent)
+        for feature in features:
+            geometry = feature.get("geometry")
+            if not isinstance(geometry, dict):
+                continue
+            geom_type = geometry.get("type")
+
+            if geom_type in {"LineString", "MultiLineString"}:
+                parts: list[list[tuple[int, int]]] = []
+                for line in _geometry_lines(geometry):
+                    projected = [project(pos) for pos in line]
+                    if None in projected:
+                        continue
+                    parts.extend(_clip_line(projected, lo, hi))  # type: ignore[arg-type]
+                if parts:
+                    layer.add(feature, _GEOM_TYPE_LINESTRING, _line_commands(parts))
+
+            elif geom_type in {"Point", "MultiPoint"}:
+                points: list[tuple[int, int]] = []
+                for pos in _geometry_points(geometry):
+                    projected_pos = project(pos)
+                    if projected_pos is None:
+                        continue
+                    px, py = projected_pos
+                    if lo <= px <= hi and lo <= py <= hi:
+                        points.append((round(px), round(py)))
+                if points:
+                    layer.add(feature, _GEOM_TYPE_POINT, _point_commands(points))
+
+        if layer.features:
+            out.append(_length_delimited(3, layer.encode()))
+
+    return b"".join(out)
@@ -41,14 +41,18 @@ from urllib.parse import quote
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
 
+import orjson
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
 from rest_framework.exceptions import ParseError
 
+from speleodb.gis.mvt import MVT_MAX_ZOOM
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Sequence
 
     from rest_framework.request import Request
@@ -96,6 +100,12 @@ _BBOX_3D_LEN: int = 6
 # Minimum number of coordinate components in a valid GeoJSON position.
 _COORD_MIN_DIM: int = 2
 
+# Average number of features per cell targeted by :class:`FeatureSpatialIndex`.
+# Cave surveys are dense along a few passages, so a small constant keeps
+# most cells empty and the populated ones short.
+_SPATIAL_INDEX_FEATURES_PER_CELL: int = 8
+_SPATIAL_INDEX_MAX_CELLS_PER_AXIS: int = 512
+
 # When self_url is ``.../items/{featureId}`` and we split on ``/`` from
 # the right with maxsplit=2, we expect exactly three parts.
 _FEATURE_URL_PARTS: int = 3
@@ -118,8 +128,10 @@ class OGCQuery(BaseModel):
 
     All four families share this parser. ``bbox``, ``datetime``,
     ``limit`` and ``offset`` are the OGC core query parameters honoured
-    here; everything else is silently ignored (the OGC spec explicitly
-    allows server-defined extensions).
+    here, plus the ``zoom`` extension (map zoom level the features are
+    displayed at, which selects a level of detail — see
+    :mod:`speleodb.gis.lod`); everything else is silently ignored (the
+    OGC spec explicitly allows server-defined extensions).
 
     The ``bbox`` field is constrained to either a 4-tuple
     (``min_lon, min_lat, max_lon, max_lat``) or a 6-tuple
@@ -135,6 +147,7 @@ class OGCQuery(BaseModel):
     offset: int = 0
     limit_was_supplied: bool = False
     offset_was_supplied: bool = False
+    zoom: int | None = None
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -274,6 +287,7 @@ def parse_ogc_query(request: Request) -> OGCQuery:
     datetime_raw = request.query_params.get("datetime")
     limit_raw = request.query_params.get("limit")
     offset_raw = request.query_params.get("offset")
+    zoom_raw = request.query_params.get("zoom")
 
     bbox = _parse_bbox(bbox_raw) if bbox_raw else None
     datetime_value = _parse_datetime(datetime_raw) if datetime_raw else None
@@ -288,6 +302,12 @@ def parse_ogc_query(request: Request) -> OGCQuery:
         else 0
     )
 
+    zoom = (
+        _parse_int(zoom_raw, name="zoom", min_value=0, max_value=MVT_MAX_ZOOM)
+        if zoom_raw
+        else None
+    )
+
     return OGCQuery(
         bbox=bbox,
         datetime=datetime_value,
@@ -295,6 +315,7 @@ def parse_ogc_query(request: Request) -> OGCQuery:
         offset=offset,
         limit_was_supplied=limit_raw is not None,
         offset_was_supplied=offset_raw is not None,
+        zoom=zoom,
     )
 
 
@@ -440,6 +461,111 @@ def _bbox_intersects(
     return x_intersects and y_intersects
 
 
+class FeatureSpatialIndex:
+    """Uniform-grid spatial index over the 2-D bboxes of a feature list.
+
+    Built once per (immutable) feature list; :meth:`query` then returns
+    the positions of the features intersecting a ``bbox`` by visiting
+    only the grid cells it overlaps, instead of recomputing
+    :func:`feature_bbox_2d` for every feature on every request.
+
+    Candidates are confirmed with :func:`_bbox_intersects`, so results
+    (including antimeridian-crossing bboxes and features without a
+    usable geometry) are identical to the linear scan, in the same
+    order.
+    """
+
+    def __init__(self, features: Sequence[dict[str, Any]]) -> None:
+        self.bboxes: list[tuple[float, float, float, float] | None] = [
+            feature_bbox_2d(feat) for feat in features
+        ]
+
+        # Non-finite bboxes can not be placed on the grid: they are
+        # checked on every query, exactly as the linear scan would.
+        self.unplaced: list[int] = []
+        placed: list[int] = []
+        for pos, bbox in enumerate(self.bboxes):
+            if bbox is None:
+                continue
+            if all(math.isfinite(v) for v in bbox):
+                placed.append(pos)
+            else:
+                self.unplaced.append(pos)
+
+        if placed:
+            self.extent = (
+                min(self.bboxes[pos][0] for pos in placed),  # type: ignore[index]
+                min(self.bboxes[pos][1] for pos in placed),  # type: ignore[index]
+                max(self.bboxes[pos][2] for pos in placed),  # type: ignore[index]
+                max(self.bboxes[pos][3] for pos in placed),  # type: ignore[index]
+            )
+        else:
+            self.extent = (0.0, 0.0, 0.0, 0.0)
+
+        self.cells_per_axis = max(
+            1,
+            min(
+                _SPATIAL_INDEX_MAX_CELLS_PER_AXIS,
+                math.isqrt(len(placed) // _SPATIAL_INDEX_FEATURES_PER_CELL),
+            ),
+        )
+        min_x, min_y, max_x, max_y = self.extent
+        self._cell_w = (max_x - min_x) / self.cells_per_axis or 1.0
+        self._cell_h = (max_y - min_y) / self.cells_per_axis or 1.0
+
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        for pos in placed:
+            for cell in self._cells_overlapping(*self.bboxes[pos]):  # type: ignore[misc]
+                self.cells.setdefault(cell, []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def _cell_range(self, low: float, high: float, *, axis: int) -> range:
+        origin = self.extent[axis]
+        size = self._cell_w if axis == 0 else self._cell_h
+        last = self.cells_per_axis - 1
+        start = min(last, max(0, int((low - origin) // size)))
+        stop = min(last, max(0, int((high - origin) // size)))
+        return range(start, stop + 1)
+
+    def _cells_overlapping(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> Iterable[tuple[int, int]]:
+        e_min_x, e_min_y, e_max_x, e_max_y = self.extent
+        if x_min > e_max_x or x_max < e_min_x or y_min > e_max_y or y_max < e_min_y:
+            return
+        x_range = self._cell_range(max(x_min, e_min_x), min(x_max, e_max_x), axis=0)
+        y_range = self._cell_range(max(y_min, e_min_y), min(y_max, e_max_y), axis=1)
+        for ix in x_range:
+            for iy in y_range:
+                yield (ix, iy)
+
+    def query(self, bbox: tuple[float, ...]) -> list[int]:
+        """Return the sorted positions of the features intersecting *bbox*."""
+        if len(bbox) == _BBOX_2D_LEN:
+            bx_min, by_min, bx_max, by_max = bbox
+        else:
+            bx_min, by_min, _, bx_max, by_max, _ = bbox
+
+        if bx_min <= bx_max:
+            x_ranges = [(bx_min, bx_max)]
+        else:
+            # Antimeridian-crossing bbox: two disjoint longitude ranges.
+            x_ranges = [(bx_min, math.inf), (-math.inf, bx_max)]
+
+        candidates: set[int] = set(self.unplaced)
+        for x_min, x_max in x_ranges:
+            for cell in self._cells_overlapping(x_min, by_min, x_max, by_max):
+                candidates.update(self.cells.get(cell, ()))
+
+        return sorted(
+            pos
+            for pos in candidates
+            if _bbox_intersects(self.bboxes[pos], bbox)  # type: ignore[arg-type]
+        )
+
+
 def _dedupe_feature_id(
     feature_id: Any,
     seen_ids: set[str],
@@ -676,14 +802,80 @@ def collection_bbox_2d_for_group(
     return collection_bbox_2d(filter_features_by_geometry_group(features, group))
 
 
+def build_geometry_metadata(features: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Return the per-commit facts the OGC collections are described with.
+
+    ``{"bbox": [...], "groups": {"points": {"count": 12, "bbox": [...]}}}``
+    — bboxes are ``[min_lon, min_lat, max_lon, max_lat]`` (or ``None``)
+    and only the geometry groups present in *features* are listed. JSON
+    friendly so that it can be persisted next to the GeoJSON it describes
+    (see ``ProjectGeoJSON.geometry_metadata``).
+    """
+    groups: dict[str, dict[str, Any]] = {}
+    present = geometry_groups_present(features)
+    for group in GEOMETRY_GROUPS_ORDERED:
+        if group not in present:
+            continue
+        members = filter_features_by_geometry_group(features, group)
+        bbox = collection_bbox_2d(members)
+        groups[group] = {
+            "count": len(members),
+            "bbox": list(bbox) if bbox is not None else None,
+        }
+    bbox = collection_bbox_2d(features)
+    return {"bbox": list(bbox) if bbox is not None else None, "groups": groups}
+
+
 # ---------------------------------------------------------------------------
 # OGC core query application
 # ---------------------------------------------------------------------------
 
 
+def ogc_query_positions(
+    query: OGCQuery,
+    *,
+    count: int,
+    features: Sequence[dict[str, Any]] | None = None,
+    spatial_index: FeatureSpatialIndex | None = None,
+) -> tuple[Sequence[int], int]:
+    """Apply *query* to a list of *count* features, by position.
+
+    Returns ``(positions, numberMatched)`` where *positions* are the
+    indexes of the features on the requested page. See
+    :func:`apply_ogc_query` for the semantics.
+
+    The features themselves are only needed to filter a ``bbox``
+    without a matching *spatial_index*; callers holding pre-serialized
+    features (see :func:`iter_items_envelope`) can then skip loading
+    them altogether.
+    """
+    matched: Sequence[int]
+    if query.bbox is None:
+        matched = range(count)
+    elif spatial_index is not None and len(spatial_index) == count:
+        matched = spatial_index.query(query.bbox)
+    elif features is not None:
+        matched = []
+        for pos, feat in enumerate(features):
+            fbbox = feature_bbox_2d(feat)
+            if fbbox is None:
+                continue
+            if _bbox_intersects(fbbox, query.bbox):
+                matched.append(pos)
+    else:
+        raise ValueError("`features` are required to filter by bbox without index.")
+
+    # datetime: pass-through validation only — no filtering.
+
+    start = query.offset
+    return matched[start : start + query.limit], len(matched)
+
+
 def apply_ogc_query(
     features: list[dict[str, Any]],
     query: OGCQuery,
+    *,
+    spatial_index: FeatureSpatialIndex | None = None,
 ) -> tuple[list[dict[str, Any]], int]:
     """Apply *query* to *features* and return ``(sliced, numberMatched)``.
 
@@ -700,25 +892,17 @@ def apply_ogc_query(
     before offset/limit slicing — the OGC spec is explicit that this is
     the total number of features matching the query, not the number
     returned in a single page.
-    """
-    if query.bbox is None:
-        matched = list(features)
-    else:
-        matched = []
-        for feat in features:
-            fbbox = feature_bbox_2d(feat)
-            if fbbox is None:
-                continue
-            if _bbox_intersects(fbbox, query.bbox):
-                matched.append(feat)
-
-    # datetime: pass-through validation only — no filtering.
-
-    number_matched = len(matched)
 
-    start = query.offset
-    sliced = matched[start : start + query.limit]
-    return sliced, number_matched
+    *spatial_index*, when built from this exact *features* list, makes
+    the ``bbox`` step sublinear; the result is the same either way.
+    """
+    positions, number_matched = ogc_query_positions(
+        query,
+        count=len(features),
+        features=features,
+        spatial_index=spatial_index,
+    )
+    return [features[pos] for pos in positions], number_matched
 
 
 # ---------------------------------------------------------------------------
@@ -780,6 +964,7 @@ def _items_self_query_params(query: OGCQuery) -> dict[str, Any]:
             if query.offset_was_supplied or query.offset != 0
             else None
         ),
+        "zoom": str(query.zoom) if query.zoom is not None else None,
     }
 
 
@@ -789,6 +974,7 @@ def _items_pagination_query_params(query: OGCQuery) -> dict[str, Any]:
         "bbox": (",".join(str(v) for v in query.bbox) if query.bbox else None),
         "datetime": query.datetime_value,
         "limit": str(query.limit),
+        "zoom": str(query.zoom) if query.zoom is not None else None,
     }
 
 
@@ -872,6 +1058,43 @@ def build_items_envelope(
     }
 
 
+# Number of pre-serialized features joined into one chunk of an
+# ``/items`` stream: large enough to keep the per-chunk overhead
+# negligible, small enough to keep the first byte fast.
+_ITEMS_STREAM_BATCH_SIZE: int = 500
+
+
+def iter_items_envelope(
+    *,
+    features: Sequence[bytes],
+    request: Request,
+    number_matched: int,
+    query: OGCQuery,
+) -> Iterator[bytes]:
+    """Stream the envelope of :func:`build_items_envelope` chunk by chunk.
+
+    *features* are already serialized with ``orjson.dumps``: they are
+    spliced into the ``features`` array as-is, so geometries are never
+    re-serialized per request. The output is byte-for-byte what
+    ``orjson.dumps(build_items_envelope(...))`` would produce.
+    """
+    envelope = build_items_envelope(
+        features=[],
+        request=request,
+        number_matched=number_matched,
+        query=query,
+    )
+    envelope["numberReturned"] = len(features)
+    del envelope["features"]
+
+    # ``features`` is the last key of the envelope: re-open the object.
+    yield orjson.dumps(envelope)[:-1] + b',"features":['
+    for start in range(0, len(features), _ITEMS_STREAM_BATCH_SIZE):
+        chunk = b",".join(features[start : start + _ITEMS_STREAM_BATCH_SIZE])
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
+
+
 def build_single_feature_response(
     *,
     feature: dict[str, Any],
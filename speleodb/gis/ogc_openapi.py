@@ -401,6 +401,18 @@ _PARAMETERS: dict[str, Any] = {
         ),
         "schema": {"type": "integer", "minimum": 0},
     },
+    "ZoomParam": {
+        "name": "zoom",
+        "in": "query",
+        "required": False,
+        "description": (
+            "SpeleoDB extension. Web Mercator zoom level the features "
+            "will be displayed at: survey lines are then served "
+            "simplified to a tolerance invisible at that zoom. Omit "
+            "for full precision. Point geometries are never simplified."
+        ),
+        "schema": {"type": "integer", "minimum": 0, "maximum": 24},
+    },
 }
 
 
@@ -584,6 +596,7 @@ def _build_paths_for(family: dict[str, str]) -> dict[str, Any]:
                     {"$ref": "#/components/parameters/DatetimeParam"},
                     {"$ref": "#/components/parameters/LimitParam"},
                     {"$ref": "#/components/parameters/OffsetParam"},
+                    {"$ref": "#/components/parameters/ZoomParam"},
                 ],
                 "responses": {
                     "200": {"$ref": "#/components/responses/Features"},
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from speleodb.common.caching import GIS_VIEWS_GENERATION
+from speleodb.common.caching import LANDMARK_COLLECTIONS_GENERATION
+from speleodb.common.caching import PROJECT_GEOJSONS_GENERATION
+from speleodb.gis.models import GISProjectView
+from speleodb.gis.models import GISView
+from speleodb.gis.models import Landmark
+from speleodb.gis.models import LandmarkCollection
+from speleodb.gis.models import ProjectGeoJSON
+from speleodb.surveys.models import Project
+
+
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=ProjectGeoJSON)
+def invalidate_project_geojsons(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(PROJECT_GEOJSONS_GENERATION.bump)
+
+
+@receiver([post_save, post_delete], sender=GISView)
+def invalidate_gis_view(sender: Any, instance: GISView, **kwargs: Any) -> None:
+    gis_view_id = instance.pk  # Cleared once the instance is deleted
+    transaction.on_commit(lambda: GIS_VIEWS_GENERATION.bump(gis_view_id))
+
+
+@receiver([post_save, post_delete], sender=GISProjectView)
+def invalidate_gis_project_view(
+    sender: Any, instance: GISProjectView, **kwargs: Any
+) -> None:
+    transaction.on_commit(
+        lambda: GIS_VIEWS_GENERATION.bump(
+            instance.gis_view_id  # pyright: ignore[reportAttributeAccessIssue]
+        )
+    )
+
+
+@receiver([post_save, post_delete], sender=LandmarkCollection)
+def invalidate_landmark_collection(
+    sender: Any, instance: LandmarkCollection, **kwargs: Any
+) -> None:
+    collection_id = instance.pk  # Cleared once the instance is deleted
+    transaction.on_commit(lambda: LANDMARK_COLLECTIONS_GENERATION.bump(collection_id))
+
+
+@receiver(pre_save, sender=Landmark)
+def invalidate_landmark_previous_collection(
+    sender: Any, instance: Landmark, **kwargs: Any
+) -> None:
+    # A landmark moved to another collection also changes the one it leaves.
+    if instance._state.adding:  # noqa: SLF001
+        return
+    previous_collection_id = (
+        Landmark.objects.filter(pk=instance.pk)
+        .exclude(collection_id=instance.collection_id)  # pyright: ignore[reportAttributeAccessIssue]
+        .values_list("collection_id", flat=True)
+        .first()
+    )
+    if previous_collection_id is not None:
+        transaction.on_commit(
+            lambda: LANDMARK_COLLECTIONS_GENERATION.bump(previous_collection_id)
+        )
+
+
+@receiver([post_save, post_delete], sender=Landmark)
+def invalidate_landmark(sender: Any, instance: Landmark, **kwargs: Any) -> None:
+    transaction.on_commit(
+        lambda: LANDMARK_COLLECTIONS_GENERATION.bump(
+            instance.collection_id  # pyright: ignore[reportAttributeAccessIssue]
+        )
+    )
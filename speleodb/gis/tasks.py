@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from celery import shared_task
+
+from speleodb.gis.models import GISView
+from speleodb.gis.models import ProjectGeoJSON
+
+
+@shared_task(soft_time_limit=15 * 60, time_limit=20 * 60)
+def build_project_geojson_derived_files(commit_id: str) -> None:
+    """Store the group splits and levels of detail of a project GeoJSON."""
+    project_geojson = ProjectGeoJSON.objects.filter(commit_id=commit_id).first()
+    if project_geojson is None:
+        # Deleted before the task ran.
+        return
+
+    project_geojson.build_derived_files()
+
+
+@shared_task(soft_time_limit=15 * 60, time_limit=20 * 60)
+def build_gis_view_geojson_bundle(gis_view_id: str, lod: int = 0) -> None:
+    """Store the GeoJSON bundle of a GIS view (see `GISView.get_geojson_bundle_url`)."""
+    gis_view = GISView.objects.filter(pk=gis_view_id).first()
+    if gis_view is None:
+        return
+
+    gis_view.build_geojson_bundle(lod)
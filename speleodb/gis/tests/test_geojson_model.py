@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 from typing import Any
+from unittest import mock
 
 import boto3
 import pytest
@@ -11,6 +12,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
 
 from speleodb.api.v2.tests.test_project_geojson_commits_api import sha1_hash
+from speleodb.gis.lod import GEOJSON_LOD_TOLERANCES
 from speleodb.gis.models import ProjectGeoJSON
 from speleodb.surveys.models import ProjectCommit
 
@@ -140,3 +142,169 @@ class TestGeoJSONModel:
 
         assert isinstance(url, str)
         assert len(url) > 0
+
+    def test_signed_download_url_is_reused(self, project: Project) -> None:
+        payload = {"type": "FeatureCollection", "features": []}
+        commit = ProjectCommit.objects.create(
+            id=sha1_hash(),
+            project=project,
+            author_name="John Doe",
+            author_email="john.doe@example.com",
+            authored_date=timezone.now(),
+            message="Initial commit",
+        )
+        obj = ProjectGeoJSON.objects.create(
+            commit=commit,
+            project=project,
+            file=make_uploaded("map.geojson", payload),
+        )
+
+        storage = obj.file.storage
+        with mock.patch.object(storage, "url", wraps=storage.url) as sign:
+            url = obj.get_signed_download_url(expires_in=3600)
+            assert obj.get_signed_download_url(expires_in=3600) == url
+            assert sign.call_count == 1
+
+            # Another lifetime is another URL.
+            obj.get_signed_download_url(expires_in=600)
+            assert sign.call_count == 2  # noqa: PLR2004
+
+        # Signed to expire with its reuse window: never less than half of
+        # the requested lifetime left when handed out.
+        (_, kwargs) = sign.call_args_list[0]
+        assert 1800 <= kwargs["expire"] <= 3600  # noqa: PLR2004
+
+    def test_levels_of_detail_built_on_creation(
+        self, project: Project, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        line = [[-87.5 + i * 0.0001, 20.2 + (i % 2) * 0.00001, -i] for i in range(50)]
+        payload = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": line},
+                    "properties": {"name": "Passage"},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [-87.5, 20.2]},
+                    "properties": {"name": "Station"},
+                },
+            ],
+        }
+
+        commit = ProjectCommit.objects.create(
+            id=sha1_hash(),
+            project=project,
+            author_name="John Doe",
+            author_email="john.doe@example.com",
+            authored_date=timezone.now(),
+            message="Initial commit",
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            obj = ProjectGeoJSON.objects.create(
+                commit=commit,
+                project=project,
+                file=make_uploaded("map.geojson", payload),
+            )
+
+        lod_name = obj.get_lod_file_name(max(GEOJSON_LOD_TOLERANCES))
+        assert lod_name == f"{project.id}/{commit.id}.lod3.json"
+        with obj.file.storage.open(lod_name, "rb") as f:
+            simplified = json.loads(f.read())
+
+        passage, station = simplified["features"]
+        # Ends (altitude included) are kept, the zig-zag is gone.
+        assert passage["geometry"]["coordinates"] == [line[0], line[-1]]
+        assert station == payload["features"][1]
+
+        # Built levels are recorded on the row: no storage lookup to serve one.
+        obj.refresh_from_db()
+        assert obj.lod_levels == sorted(GEOJSON_LOD_TOLERANCES)
+        with mock.patch.object(obj.file.storage, "exists") as exists:
+            assert obj.get_stored_file_name(3) == lod_name
+        exists.assert_not_called()
+
+    def test_geometry_metadata_and_group_files_built_on_creation(
+        self, project: Project, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        payload = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[-87.5, 20.2], [-87.4, 20.3]],
+                    },
+                    "properties": {"name": "Passage"},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [-87.6, 20.1]},
+                    "properties": {"name": "Station"},
+                },
+            ],
+        }
+
+        commit = ProjectCommit.objects.create(
+            id=sha1_hash(),
+            project=project,
+            author_name="John Doe",
+            author_email="john.doe@example.com",
+            authored_date=timezone.now(),
+            message="Initial commit",
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            obj = ProjectGeoJSON.objects.create(
+                commit=commit,
+                project=project,
+                file=make_uploaded("map.geojson", payload),
+            )
+
+        obj.refresh_from_db()
+        assert obj.geometry_metadata == {
+            "bbox": [-87.6, 20.1, -87.4, 20.3],
+            "groups": {
+                "points": {"count": 1, "bbox": [-87.6, 20.1, -87.6, 20.1]},
+                "lines": {"count": 1, "bbox": [-87.5, 20.2, -87.4, 20.3]},
+            },
+        }
+
+        name = obj.get_group_file_name("points")
+        assert name == f"{project.id}/{commit.id}.points.json"
+        with obj.file.storage.open(name, "rb") as f:
+            (station,) = json.loads(f.read())["features"]
+
+        # Stored normalized: same synthetic id as in the full collection.
+        assert station["id"] == f"{commit.id}:1"
+        assert station["properties"] == {"name": "Station"}
+
+    def test_geometry_metadata_passed_in_is_not_recomputed(
+        self, project: Project
+    ) -> None:
+        payload = {"type": "FeatureCollection", "features": []}
+        metadata = {"bbox": None, "groups": {}}
+
+        commit = ProjectCommit.objects.create(
+            id=sha1_hash(),
+            project=project,
+            author_name="John Doe",
+            author_email="john.doe@example.com",
+            authored_date=timezone.now(),
+            message="Initial commit",
+        )
+
+        with mock.patch.object(ProjectGeoJSON, "_read_file_data") as read:
+            obj = ProjectGeoJSON.objects.create(
+                commit=commit,
+                project=project,
+                file=make_uploaded("map.geojson", payload),
+                geometry_metadata=metadata,
+            )
+
+        read.assert_not_called()
+        assert obj.geometry_metadata == metadata
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import orjson
 import pytest
@@ -14,6 +16,7 @@ from speleodb.api.v2.tests.factories import ProjectFactory
 from speleodb.gis.models import GISProjectView
 from speleodb.gis.models import GISView
 from speleodb.gis.models import ProjectGeoJSON
+from speleodb.gis.models.view import get_geojson_bundle_name
 from speleodb.surveys.models import Project
 from speleodb.surveys.models import ProjectCommit
 from speleodb.users.tests.factories import UserFactory
@@ -439,3 +442,54 @@ class TestGISViewIntegration:
 
         assert str(geojson_objs[0].project.id) in project_ids
         assert str(geojson_objs[1].project.id) in project_ids
+
+    def test_get_geojson_bundle_url(self) -> None:
+        """All the GeoJSONs of a view are bundled once, keyed by commit SHA."""
+        user = UserFactory.create()
+        gis_view = GISView.objects.create(
+            name="Test View",
+            owner=user,
+            allow_precise_zoom=False,
+        )
+        geojson_objs = []
+        for commit_sha in ("c" * 40, "d" * 40):
+            project = ProjectFactory.create()
+            geojson_objs.append(
+                create_project_geojson(
+                    project=project,
+                    commit_sha=commit_sha,
+                    commit_date=timezone.now(),
+                    author_name="John Doe",
+                    author_email="john.doe@example.com",
+                    message="Initial commit",
+                    file=temp_geojson_file(),
+                )
+            )
+            GISProjectView.objects.create(
+                gis_view=gis_view,
+                project=project,
+                use_latest=True,
+            )
+
+        # Built by a worker (eager in tests) for the requests that follow.
+        assert gis_view.get_geojson_bundle_url() is None
+
+        storage = geojson_objs[0].file.storage
+        name = get_geojson_bundle_name(geojson_objs)
+        with storage.open(name, "rb") as f:
+            bundle = orjson.loads(gzip.decompress(f.read()))
+
+        assert set(bundle) == {"c" * 40, "d" * 40}
+        assert bundle["c" * 40]["features"][0]["properties"] == {"name": "Test"}
+
+        # Built once: the same commits resolve to the same bundle.
+        with mock.patch.object(storage, "save") as save:
+            assert gis_view.get_geojson_bundle_url() is not None
+        save.assert_not_called()
+
+        # Keyed by the files it is made of: a level of detail that is not
+        # built yet is the full-precision bundle, not a bundle of that level.
+        assert get_geojson_bundle_name(geojson_objs, lod=3) == name
+        for project_geojson in geojson_objs:
+            project_geojson.lod_levels = [3]
+        assert get_geojson_bundle_name(geojson_objs, lod=3) != name
@@ -179,6 +179,16 @@ class GitFile(GitObjectMixin):
         data.name = self.name
         return data
 
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Generator[bytes]:
+        """Read the blob from the object database `chunk_size` bytes at a time.
+
+        Unlike `content`, the blob is never fully loaded in memory. The stream
+        must be consumed entirely before reading another object of the repo.
+        """
+        stream = self.blob.data_stream
+        while chunk := stream.read(chunk_size):  # type: ignore[no-untyped-call]
+            yield chunk
+
     @property
     def name(self) -> str:
         return self.blob.name
@@ -484,6 +494,52 @@ class GitCommit(Commit):
         """
         yield from self.tree.root_files
 
+    def last_modifying_commits(self) -> dict[str, str]:
+        """Map every file path of the tree to the hexsha of the commit that
+        introduced its current content.
+
+        Computed with a single `git log --raw` walk over the ancestry of this
+        commit instead of one `git log -- <path>` per file (see
+        `GitObjectMixin.commit`).
+
+        Equivalent to:
+        `git log --raw --no-renames --no-abbrev -z --format=%x01%H <hexsha>`
+        """
+        pending: dict[str, str] = {
+            git_f.path.as_posix(): git_f.hexsha for git_f in self.tree.files
+        }
+        rslt: dict[str, str] = {}
+
+        output: str = self.repo.git.log(
+            self.hexsha,
+            "--raw",
+            "--no-renames",
+            "--no-abbrev",
+            "-z",
+            "--format=%x01%H",
+        )
+
+        # Records are NUL separated: `\x01<commit>`, then for each changed file
+        # `:<src_mode> <dst_mode> <src_sha> <dst_sha> <status>` and `<path>`.
+        commit_hexsha: str | None = None
+        tokens = iter(output.split("\0"))
+        for token in tokens:
+            if not pending:
+                break
+
+            token = token.lstrip("\n")  # noqa: PLW2901
+            if token.startswith("\x01"):
+                commit_hexsha = token[1:]
+
+            elif token.startswith(":"):
+                path = next(tokens, "")
+                dst_hexsha = token.split(" ")[3]
+                if commit_hexsha is not None and pending.get(path) == dst_hexsha:
+                    rslt[path] = commit_hexsha
+                    del pending[path]
+
+        return rslt
+
     def tree_to_json(self, prefi: str = "") -> list[dict[str, Any]]:
         """Convert the commit tree to a JSON-serializable dictionary.
 
@@ -691,6 +747,33 @@ class GitRepo(Repo):
                 f"{self.remotes.origin.url.split('@')[-1]}"  # Removes OAUTH2 token
             ) from None
 
+    def fetch(self) -> None:
+        """Refresh every ref from `origin` without touching any working tree.
+
+        Used on bare mirrors (`git clone --mirror`) where refs are fetched 1:1.
+        """
+        origin = self.remotes.origin
+        try:
+            retry_with_backoff(
+                origin.fetch,
+                prune=True,
+                retries=settings.DJANGO_GIT_RETRY_ATTEMPTS,
+                exc_types=(GitCommandError,),
+            )
+        except GitCommandError:
+            raise GitBaseError(
+                "Impossible to fetch repository: "
+                f"{self.remotes.origin.url.split('@')[-1]}"  # Removes OAUTH2 token
+            ) from None
+
+    def is_corrupted(self) -> bool:
+        """Return `True` if the object database fails a connectivity check."""
+        try:
+            self.git.fsck("--connectivity-only", "--no-progress")
+        except GitCommandError:
+            return True
+        return False
+
     def _checkout_branch_or_commit_and_maybe_pull(
         self, hexsha: str | None = None, branch_name: str | None = None
     ) -> None:
@@ -782,6 +865,32 @@ class GitRepo(Repo):
 
         return None
 
+    def get_blob(
+        self, hexsha: str, path: PathLike, mode: int = Blob.file_mode
+    ) -> GitFile:
+        """Build a `GitFile` straight from the object database.
+
+        Unlike `find_blob`, no history is walked: `path` and `mode` are expected
+        to come from an index (e.g. `ProjectBlob`).
+        """
+        try:
+            binsha = binascii.a2b_hex(hexsha)
+            # Raises `ValueError` if the object is not (yet) in the local clone.
+            _ = self.odb.info(binsha)
+        except ValueError:  # `binascii.Error` is a subclass of `ValueError`
+            raise GitBlobNotFoundError(
+                f"Git Object with id `{hexsha}` not found."
+            ) from None
+
+        return GitFile(repo=self, blob=Blob(self, binsha, mode=mode, path=str(path)))
+
+    def has_blob(self, hexsha: str) -> bool:
+        """Return `True` if `hexsha` is a blob of the object database."""
+        try:
+            return self.odb.info(binascii.a2b_hex(hexsha)).type == b"blob"
+        except ValueError:  # `binascii.Error` is a subclass of `ValueError`
+            return False
+
     def find_blob(self, hexsha: str) -> GitFile:
         for commit in self.iter_commits():
             for git_file in commit.tree.traverse():
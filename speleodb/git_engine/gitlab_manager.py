@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import shutil
+import uuid
 from dataclasses import dataclass
 from functools import cache
 from functools import lru_cache
@@ -123,8 +124,6 @@ class GitlabManagerCls(metaclass=SingletonMetaClass):
         project: Project,
         base_dir: str | Path | None = None,
     ) -> GitRepo | None:
-        gitlab_creds = GitlabCredentials.get()
-
         git_repo_base_dir = (
             Path(base_dir)
             if base_dir is not None
@@ -136,7 +135,7 @@ class GitlabManagerCls(metaclass=SingletonMetaClass):
         shutil.rmtree(project_dir, ignore_errors=True)
 
         project_dir.parent.mkdir(exist_ok=True, parents=True)
-        git_url = f"{settings.GITLAB_HTTP_PROTOCOL}://oauth2:{gitlab_creds.token}@{gitlab_creds.instance}/{gitlab_creds.group_name}/{project.id}.git"
+        git_url = self._get_git_url(project)
 
         git_repo: GitRepo
         try:
@@ -162,6 +161,41 @@ class GitlabManagerCls(metaclass=SingletonMetaClass):
 
         return git_repo
 
+    @check_initialized
+    def clone_mirror(self, project: Project, mirror_dir: str | Path) -> GitRepo:
+        """Clone a bare mirror (`git clone --mirror`) of the project - no worktree.
+
+        The project must already exist in Gitlab (see `create_or_clone_project`).
+        The clone is written to a sibling directory and renamed into place, so
+        `mirror_dir` never holds a partial repository: an existing mirror is
+        swapped out rather than deleted first. Callers must hold the mirror
+        lock (see `Project.git_mirror`).
+        """
+        mirror_dir = Path(mirror_dir)
+        mirror_dir.parent.mkdir(exist_ok=True, parents=True)
+
+        tmp_dir = mirror_dir.with_name(f".{mirror_dir.name}.{uuid.uuid4().hex}")
+        old_dir = tmp_dir.with_suffix(".old")
+        try:
+            GitRepo.clone_from(
+                url=self._get_git_url(project), to_path=tmp_dir, mirror=True
+            ).close()
+
+            if mirror_dir.exists():
+                mirror_dir.rename(old_dir)
+            tmp_dir.rename(mirror_dir)
+
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+        return GitRepo(mirror_dir)
+
+    @staticmethod
+    def _get_git_url(project: Project) -> str:
+        gitlab_creds = GitlabCredentials.get()
+        return f"{settings.GITLAB_HTTP_PROTOCOL}://oauth2:{gitlab_creds.token}@{gitlab_creds.instance}/{gitlab_creds.group_name}/{project.id}.git"
+
     @lru_cache(maxsize=256)  # noqa: B019
     @check_initialized
     def _get_project(self, project: Project) -> GL_Project | None:
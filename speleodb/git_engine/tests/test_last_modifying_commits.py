@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+from unittest import TestCase
+
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitFile
+from speleodb.git_engine.core import GitRepo
+
+
+class TestLastModifyingCommits(TestCase):
+    """Test suite for GitCommit.last_modifying_commits() method."""
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = GitRepo.init(path=pathlib.Path(self._tmp_dir.name) / "repo")
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _commit(
+        self, files: dict[str, bytes], message: str, removed: list[str] | None = None
+    ) -> str:
+        for rel_path, content in files.items():
+            path = self.repo.path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+        if files:
+            self.repo.index.add(list(files))
+        if removed:
+            self.repo.index.remove(removed, working_tree=True)
+
+        return self.repo.index.commit(
+            message, author=GIT_COMMITTER, committer=GIT_COMMITTER
+        ).hexsha
+
+    def test_matches_per_file_history_walk(self) -> None:
+        first = self._commit(
+            {"ariane.tml": b"v1", "photos/a b.jpg": b"jpeg", "misc.txt": b"x"},
+            "First commit",
+        )
+        second = self._commit({"ariane.tml": b"v2"}, "Second commit")
+        third = self._commit({"notes/new.txt": b"n"}, "Third", removed=["misc.txt"])
+
+        commit = self.repo.commit(third)
+        rslt = commit.last_modifying_commits()
+
+        assert rslt == {
+            "ariane.tml": second,
+            "photos/a b.jpg": first,
+            "notes/new.txt": third,
+        }
+
+        # Same answer as the per-file walk used by `GitObjectMixin.commit`
+        for item in commit.tree.traverse():
+            if isinstance(item, GitFile):
+                assert item.commit.hexsha == rslt[item.path.as_posix()]
+
+    def test_historical_commit_ignores_newer_history(self) -> None:
+        first = self._commit({"ariane.tml": b"v1"}, "First commit")
+        self._commit({"ariane.tml": b"v2"}, "Second commit")
+
+        assert self.repo.commit(first).last_modifying_commits() == {"ariane.tml": first}
+
+    def test_reverted_content(self) -> None:
+        self._commit({"ariane.tml": b"v1"}, "First commit")
+        self._commit({"ariane.tml": b"v2"}, "Second commit")
+        third = self._commit({"ariane.tml": b"v1"}, "Revert")
+
+        assert self.repo.commit(third).last_modifying_commits() == {"ariane.tml": third}
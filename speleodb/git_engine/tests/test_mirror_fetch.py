@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+from unittest import TestCase
+
+import pytest
+
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitRepo
+
+
+class TestMirrorFetch(TestCase):
+    """Test suite for reading from a bare mirror refreshed by GitRepo.fetch()."""
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        tmp_path = pathlib.Path(self._tmp_dir.name)
+
+        self.origin = GitRepo.init(path=tmp_path / "origin")
+        self._commit({"ariane.tml": b"v1"}, "First commit")
+
+        self.mirror = GitRepo.clone_from(
+            url=str(self.origin.path), to_path=tmp_path / "mirror.git", mirror=True
+        )
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _commit(self, files: dict[str, bytes], message: str) -> str:
+        for rel_path, content in files.items():
+            (self.origin.path / rel_path).write_bytes(content)
+
+        self.origin.index.add(list(files))
+        return self.origin.index.commit(
+            message, author=GIT_COMMITTER, committer=GIT_COMMITTER
+        ).hexsha
+
+    def test_mirror_is_bare(self) -> None:
+        assert self.mirror.bare
+        assert self.mirror.head.commit.hexsha == self.origin.head.commit.hexsha
+
+    def test_fetch_brings_new_commits(self) -> None:
+        new_sha = self._commit({"ariane.tml": b"v2"}, "Second commit")
+
+        with pytest.raises(ValueError, match="could not be resolved"):
+            self.mirror.commit(new_sha)
+
+        self.mirror.fetch()
+
+        assert self.mirror.head.commit.hexsha == new_sha
+        assert (
+            self.mirror.commit(new_sha).tree / "ariane.tml"
+        ).data_stream.read() == b"v2"
@@ -30,6 +30,7 @@ from speleodb.surveys.models import Project
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from collections.abc import Iterator
 
     from rest_framework.request import Request
 
@@ -278,11 +279,10 @@ class WriteServiceView(RWServiceView):
         self, request: Request, *args: Any, **kwargs: Any
     ) -> StreamingHttpResponse:
         git_service = "git-receive-pack"
+        project = self.get_object()
 
         # Check for active mutex
-        if (
-            mutex := self.get_object().active_mutex
-        ) is None or mutex.user != request.user:
+        if (mutex := project.active_mutex) is None or mutex.user != request.user:
             return generate_git_error_response(
                 "You did not lock the project - Impossible to push",
                 service_name=git_service,
@@ -290,4 +290,23 @@ class WriteServiceView(RWServiceView):
 
         # TODO: Add the creation of `ProjectCommit` objects after a successful push
 
-        return self.proxy_git_request(request, path="git-receive-pack")
+        response = self.proxy_git_request(request, path="git-receive-pack")
+
+        # The remote HEAD only moves once receive-pack is done, i.e. once the
+        # proxied stream has been consumed: invalidate it at that point.
+        response.streaming_content = self._invalidate_remote_head_after(
+            response.streaming_content, project
+        )
+
+        return response
+
+    @staticmethod
+    def _invalidate_remote_head_after(
+        content: Iterator[bytes], project: Project
+    ) -> Generator[bytes]:
+        try:
+            yield from content
+        finally:
+            # The remote HEAD may have moved: force the next HEAD read to
+            # check again.
+            project.invalidate_remote_head()
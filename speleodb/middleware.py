@@ -8,7 +8,6 @@ from typing import Any
 
 import sentry_sdk
 from django.conf import settings
-from django.contrib.auth.models import update_last_login
 from django.http import FileResponse
 from django.http import HttpRequest
 from django.http import HttpResponse
@@ -48,7 +47,7 @@ class LastLoginUpdateMiddleware:
         # Note this middleware only works for Session-based authentication
         # Does not work for Django Token auth: Anonymous until DRF Auth.
         if request.user.is_authenticated:
-            update_last_login(None, user=request.user)  # type: ignore[arg-type]
+            request.user.touch_last_login()  # type: ignore[union-attr]
 
         return self.get_response(request)
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import io
 import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import IO
 from typing import TYPE_CHECKING
 from zipfile import ZipFile
 
@@ -14,6 +16,7 @@ from django.utils.timezone import localtime
 from mnemo_lib.commands.split import split_dmp_into_sections
 from mnemo_lib.models import DMPFile
 
+from speleodb.git_engine.core import GitFile
 from speleodb.processors.artifact import Artifact
 from speleodb.processors.base import BaseFileProcessor
 from speleodb.surveys.models import FileFormat
@@ -75,15 +78,33 @@ def calculate_sha1(
     return sha1.hexdigest()
 
 
+def calculate_git_blob_sha1(file_path: Path, buffer_size: int = 65536) -> str:
+    """SHA-1 of `file_path` as a git blob (i.e. `git hash-object file_path`)."""
+    sha1 = hashlib.sha1(usedforsecurity=False)
+    sha1.update(f"blob {file_path.stat().st_size}\0".encode())
+
+    with file_path.open(mode="rb") as f:
+        while chunk := f.read(buffer_size):
+            sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
 def metadata_invariant_zip_hash(
-    src: Path | str | bytes | io.BytesIO | bytearray,
+    src: Path | str | bytes | bytearray | IO[bytes],
 ) -> str:
+    """Hash the content of a ZIP archive, ignoring its metadata (dates, etc.).
+
+    Members are decompressed and hashed in chunks: `src` is never fully loaded
+    in memory when given as a path or a seekable file object.
+    """
     match src:
         case Path() | str():
             zf = ZipFile(src, "r")
         case bytes() | bytearray():
             zf = ZipFile(io.BytesIO(src), "r")
-        case io.BytesIO():
+        case _ if hasattr(src, "read") and hasattr(src, "seek"):
+            src.seek(0)
             zf = ZipFile(src, "r")
         case _:
             raise TypeError(f"Unsupported type for `src`: {type(src)=}")
@@ -94,7 +115,7 @@ def metadata_invariant_zip_hash(
         for name in sorted(zf.namelist()):
             hash_obj.update(name.encode("utf-8"))
             with zf.open(name, "r") as f:
-                while chunk := f.read(8192):
+                while chunk := f.read(65536):
                     hash_obj.update(chunk)
 
     return hash_obj.hexdigest()
@@ -119,28 +140,76 @@ class MnemoDMPFileProcessor(BaseFileProcessor):
     TARGET_SAVE_FILENAME = None
     TARGET_DOWNLOAD_FILENAME = None
 
+    _pending_hashes: dict[str, Path] | None = None
+    _committed_hashes: dict[str, Path] | None = None
+
+    def _find_duplicate(self, file: Path, filehash: str) -> Path | None:
+        """Return the DMP already stored in the project with the same content.
+
+        Committed DMPs are looked up by git blob sha among the entries of HEAD's
+        tree under `storage_folder` (git already knows their sha), only DMPs not
+        committed yet (i.e. added by the current upload) are hashed - instead
+        of hashing every DMP of the project.
+        """
+        git_repo = self.project.git_repo
+
+        # 1. DMPs not committed yet - hashed once per processor
+        if self._pending_hashes is None:
+            self._pending_hashes = {}
+            for rel_path in git_repo.untracked_files:
+                path = git_repo.path / rel_path
+                if path.suffix == ".dmp" and path.is_relative_to(self.storage_folder):
+                    self._pending_hashes[calculate_sha1(file_path=path)] = path
+
+        if (existing_f := self._pending_hashes.get(filehash)) is not None:
+            return existing_f
+
+        # 2. Committed DMPs - read from the tree once per processor
+        if self._committed_hashes is None:
+            self._committed_hashes = {}
+            if git_repo.head.is_valid():
+                with contextlib.suppress(KeyError):
+                    folder = git_repo.head.commit.tree / str(
+                        self.storage_folder.relative_to(git_repo.path)
+                    )
+                    for item in folder.traverse():
+                        if isinstance(item, GitFile) and item.path.suffix == ".dmp":
+                            self._committed_hashes[item.hexsha] = (
+                                git_repo.path / item.path
+                            )
+
+        existing_f = self._committed_hashes.get(calculate_git_blob_sha1(file))
+        if existing_f is not None and existing_f.is_file():
+            return existing_f
+
+        return None
+
     def _get_storage_name(self, file: Path) -> str:  # type: ignore[override]
         # 1. Calculate the new file sha1 hash
         filehash = calculate_sha1(file_path=file)
 
         # 2. Look for a collision with pre-existing files
         # - if found raises `FileExistsError`
-        for existing_f in self.storage_folder.rglob("*.dmp"):
-            if existing_f.is_file():  # Skip directories and other non-files
-                if filehash == calculate_sha1(file_path=existing_f):
-                    raise FileExistsError(
-                        f"This file already exist at path: `{existing_f}`."
-                    )
+        if (existing_f := self._find_duplicate(file, filehash)) is not None:
+            raise FileExistsError(f"This file already exist at path: `{existing_f}`.")
+
         dmp_model = DMPFile.from_dmp(file)
 
-        # 3. Build the new filename and return it
+        # 3. Build the new filename
         try:
             dmp_date = dmp_model.sections[0].date.strftime(self.DATETIME_FORMAT)
             dmp_name = dmp_model.sections[0].name
-            return f"mnemo_{dmp_date}_{dmp_name}__{filehash[:8]}.dmp"
+            filename = f"mnemo_{dmp_date}_{dmp_name}__{filehash[:8]}.dmp"
 
         except IndexError:
-            return f"mnemo_{localtime().strftime(self.DATETIME_FORMAT)}__{filehash[:8]}.dmp"  # noqa: E501
+            filename = f"mnemo_{localtime().strftime(self.DATETIME_FORMAT)}__{filehash[:8]}.dmp"  # noqa: E501
+
+        # 4. The file is about to be stored: later sections of the same upload
+        # must see it.
+        if self._pending_hashes is not None:
+            self._pending_hashes[filehash] = self.storage_folder / filename
+
+        return filename
 
     def _add_to_project(self, artifact: Artifact) -> list[Path]:
         with TemporaryDirectory() as tmp_dir:
@@ -189,20 +258,54 @@ class ArianeTMLFileProcessor(BaseFileProcessor):
 
         target_path = self.storage_folder / filename
 
-        bytes_io = io.BytesIO(artifact.read())
-
-        new_hash = metadata_invariant_zip_hash(bytes_io)
+        # Hashed straight from the upload (spooled file or memory) - no copy.
+        new_hash = metadata_invariant_zip_hash(artifact.file)
 
-        if (
-            not target_path.exists()
-            or metadata_invariant_zip_hash(target_path) != new_hash
-        ):
+        if self._get_zip_hash(target_path) != new_hash:
             with timed_section("File copy to project dir"):
-                bytes_io.seek(0)
-                target_path.write_bytes(bytes_io.read())
+                artifact.write(path=target_path)
+
+            self._set_zip_hash(target_path, new_hash)
 
         return [target_path]
 
+    # The metadata invariant hash of the file in the worktree is cached inside the
+    # `.git` directory (never committed), keyed by the file size and mtime.
+
+    def _get_zip_hash_cache_path(self, target_path: Path) -> Path:
+        git_repo = self.project.git_repo
+        return (
+            Path(git_repo.git_dir)
+            / "speleodb"
+            / "zip_hashes"
+            / f"{target_path.relative_to(git_repo.path)}.sha256"
+        )
+
+    @staticmethod
+    def _get_stat_key(target_path: Path) -> str:
+        stat = target_path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _get_zip_hash(self, target_path: Path) -> str | None:
+        if not target_path.exists():
+            return None
+
+        cache_path = self._get_zip_hash_cache_path(target_path)
+        with contextlib.suppress(OSError, ValueError):
+            stat_key, zip_hash = cache_path.read_text().split()
+            if stat_key == self._get_stat_key(target_path):
+                return zip_hash
+
+        zip_hash = metadata_invariant_zip_hash(target_path)
+        self._set_zip_hash(target_path, zip_hash)
+        return zip_hash
+
+    def _set_zip_hash(self, target_path: Path, zip_hash: str) -> None:
+        cache_path = self._get_zip_hash_cache_path(target_path)
+        with contextlib.suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(f"{self._get_stat_key(target_path)} {zip_hash}")
+
 
 class ArianeTMLUFileProcessor(BaseFileProcessor):
     ALLOWED_EXTENSIONS = [".tmlu"]
@@ -28,10 +28,9 @@ class CompassZIPFileProcessor(BaseFileProcessor):
     TARGET_FOLDER = None
     TARGET_SAVE_FILENAME = "project.zip"
     TARGET_DOWNLOAD_FILENAME = "{project_name}__{timestamp}.zip"
+    ARCHIVE_DOWNLOAD = True
 
-    def _generate_or_copy_file_for_download(
-        self, commit: GitCommit, target_f: Path
-    ) -> None:
+    def _get_archive_files(self, commit: GitCommit) -> list[GitFile]:
         gitfile: GitFile
         for item in commit.tree.traverse():
             if not isinstance(item, GitFile):
@@ -49,28 +48,23 @@ class CompassZIPFileProcessor(BaseFileProcessor):
 
         compass_cfg = CompassTOML.from_toml(gitfile.content)
 
-        with zipfile.ZipFile(target_f, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
-            commit_files: list[GitFile] = [
-                item
-                for item in commit.tree.traverse()
-                if isinstance(item, GitFile) and str(item.path) in compass_cfg.files
-            ]
-
-            if not commit_files:
-                raise RuntimeError(f"No file found in commit: `{commit.hexsha}`")
-
-            if len(commit_files) != len(compass_cfg.files):
-                missing_files = compass_cfg.files - {str(f.path) for f in commit_files}
-                raise RuntimeError(
-                    f"Some files listed in `{CompassTOML.__FILENAME__}` are missing "
-                    f"in commit `{commit.hexsha}`: {missing_files}"
-                )
-
-            for file in commit_files:
-                zipf.writestr(
-                    str(file.path),
-                    file.content.getvalue(),
-                )
+        commit_files: list[GitFile] = [
+            item
+            for item in commit.tree.traverse()
+            if isinstance(item, GitFile) and str(item.path) in compass_cfg.files
+        ]
+
+        if not commit_files:
+            raise RuntimeError(f"No file found in commit: `{commit.hexsha}`")
+
+        if len(commit_files) != len(compass_cfg.files):
+            missing_files = compass_cfg.files - {str(f.path) for f in commit_files}
+            raise RuntimeError(
+                f"Some files listed in `{CompassTOML.__FILENAME__}` are missing "
+                f"in commit `{commit.hexsha}`: {missing_files}"
+            )
+
+        return commit_files
 
     def _add_to_project(self, artifact: Artifact) -> list[Path]:
         with TemporaryDirectory() as tmp_dir:
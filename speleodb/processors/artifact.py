@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+import uuid
 from pathlib import Path
 
 from django.core.exceptions import ValidationError
@@ -56,11 +58,32 @@ class Artifact:
         return data  # type: ignore[no-any-return]
 
     def write(self, path: Path) -> None:
+        """Save the upload at `path` without ever loading it fully in memory.
+
+        Uploads spooled to disk by Django are hard-linked (zero-copy) when the
+        temporary file lives on the same filesystem, otherwise copied by the
+        kernel. In-memory uploads are written chunk by chunk.
+        """
         if self._path is not None:
             raise RuntimeError(f"This file as been already saved at: `{self.path}`.")
 
-        with path.open(mode="wb") as f:
-            f.write(self.read())
+        if isinstance(self.file, TemporaryUploadedFile):
+            src = Path(self.file.temporary_file_path())
+
+            # Link under a temporary name, then atomically swap it in place:
+            # hard links can not overwrite an existing file.
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+            try:
+                tmp_path.hardlink_to(src)
+            except OSError:
+                # e.g. cross-device link
+                shutil.copyfile(src, tmp_path)
+            tmp_path.replace(path)
+
+        else:
+            with path.open(mode="wb") as f:
+                for chunk in self.file.chunks():
+                    f.write(chunk)
 
         self._path = path
 
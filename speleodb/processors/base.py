@@ -7,6 +7,7 @@ import time
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import InMemoryUploadedFile
@@ -23,6 +24,11 @@ from speleodb.processors.artifact import UploadedFile
 from speleodb.surveys.models import FileFormat
 from speleodb.surveys.models import Project
 from speleodb.utils.timing_ctx import timed_section
+from speleodb.utils.zip_stream import ZipStreamEntry
+from speleodb.utils.zip_stream import stream_zip
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 # ruff: noqa: E501
 
@@ -108,6 +114,10 @@ class BaseFileProcessor:
 
     DATETIME_FORMAT: str = "%Y-%m-%d_%Hh%M"
 
+    # If `True`, the download is a ZIP archive of the files returned by
+    # `_get_archive_files` and can be streamed (see `get_archive_stream_for_download`)
+    ARCHIVE_DOWNLOAD: bool = False
+
     _project: Project
 
     def __init__(self, project: Project) -> None:
@@ -184,32 +194,9 @@ class BaseFileProcessor:
         if not isinstance(target_f, Path):
             target_f = Path(target_f)
 
-        # 1. Fetch the commit requested by the user - pull repository if needed.
-        try:
-            if hexsha is not None:
-                if not self.validate_hexsha(hexsha):
-                    raise ValueError(f"Invalid Git SHA value: `{hexsha}`.")
-
-                for _ in range(2):
-                    try:
-                        commit = self.project.git_repo.commit(hexsha)
-                        break
-                    except ValueError:
-                        # In case the commit doesn't exist - pull and retry
-                        self.project.git_repo.pull()
-                else:
-                    raise ValueError(f"Impossible to find commit `{hexsha}`")
-
-            else:
-                # If we select the HEAD commit - no other choice than pull first
-                self.project.git_repo.pull()
-                commit = self.project.git_repo.head.commit
-
-            if commit is None:
-                raise ValueError("Impossible to find HEAD commit")
-
-        except (GitBaseError, GitCommandError) as e:
-            raise RuntimeError(f"Impossible to find commit: `{hexsha}`") from e
+        # 1. Fetch the commit requested by the user from the project's bare
+        #    mirror - the mirror is only fetched if needed, no checkout.
+        commit = self._get_commit_for_download(hexsha=hexsha)
 
         # 2. Generate or copy the file to be downloaded to path `target_f`:
         # What file(s) to download is determined by the `Processor` class.
@@ -222,29 +209,110 @@ class BaseFileProcessor:
         except PermissionError as e:
             raise RuntimeError from e
 
-        # 3. Fetch the date at which the commit was submitted.
-        commit_date = time.gmtime(commit.committed_date)
+        return self.get_download_filename(
+            committed_date=commit.committed_date, default=target_f.name
+        )
+
+    def get_archive_stream_for_download(
+        self, hexsha: str | None = None
+    ) -> tuple[Iterator[bytes], str]:
+        """Return the ZIP archive to download as a stream of bytes and its name.
+
+        Only available for processors with `ARCHIVE_DOWNLOAD = True`. Every
+        error that can be detected upfront (missing commit, missing files) is
+        raised before the first byte is produced.
+        """
+        if not self.ARCHIVE_DOWNLOAD:
+            raise RuntimeError(
+                f"This download processor `{self.__class__.__name__}` does not support archive download."
+            )
+
+        commit = self._get_commit_for_download(hexsha=hexsha)
+        stream = self._stream_archive(commit=commit)
+
+        filename = self.get_download_filename(
+            committed_date=commit.committed_date,
+            default=f"{slugify(self.project.name, allow_unicode=False).lower()}.zip",
+        )
 
-        # 4. Convert `time.struct_time` to datetime to be "timezone-aware"
+        return stream, filename
+
+    def get_download_filename(self, committed_date: int, default: str) -> str:
+        """Filename seen in the browser for a commit submitted at `committed_date`."""
+        # 1. Convert the commit timestamp to `time.struct_time`.
+        commit_date = time.gmtime(committed_date)
+
+        # 2. Convert `time.struct_time` to datetime to be "timezone-aware"
         naive_datetime = datetime(*commit_date[:6], tzinfo=UTC)
         tz_aware_datetime = naive_datetime.astimezone(tz=get_default_timezone())
 
-        # 5. Generate the filename that will be seen in the browser
+        # 3. Generate the filename that will be seen in the browser
         if self.TARGET_DOWNLOAD_FILENAME is not None:
             return self.TARGET_DOWNLOAD_FILENAME.format(
                 project_name=slugify(self.project.name, allow_unicode=False).lower(),
                 timestamp=tz_aware_datetime.strftime(self.DATETIME_FORMAT),
             )
 
-        return target_f.name
+        return default
 
     # ----------------------------- Private APIs ----------------------------- #
 
     # ~~~~~~~~~~~~~ Download API ~~~~~~~~~~~~~ #
 
+    def _get_commit_for_download(self, hexsha: str | None = None) -> GitCommit:
+        try:
+            if hexsha is not None:
+                if not self.validate_hexsha(hexsha):
+                    raise ValueError(f"Invalid Git SHA value: `{hexsha}`.")
+
+                try:
+                    commit = self.project.get_git_commit(hexsha)
+                except ValueError:
+                    raise ValueError(f"Impossible to find commit `{hexsha}`") from None
+
+            else:
+                # If we select the HEAD commit - no other choice than fetch first
+                commit = self.project.get_git_commit()
+
+            if commit is None:
+                raise ValueError("Impossible to find HEAD commit")
+
+        except (GitBaseError, GitCommandError) as e:
+            raise RuntimeError(f"Impossible to find commit: `{hexsha}`") from e
+
+        return commit
+
+    def _get_archive_files(self, commit: GitCommit) -> list[GitFile]:
+        """Files of `commit` to zip. Overridden by `ARCHIVE_DOWNLOAD` processors."""
+        raise RuntimeError(
+            f"This download processor `{self.__class__.__name__}` does not support archive download."
+        )
+
+    def _stream_archive(self, commit: GitCommit) -> Iterator[bytes]:
+        # Resolved eagerly: errors must surface before the response starts.
+        files = self._get_archive_files(commit=commit)
+        date_time = time.gmtime(commit.committed_date)[:6]
+
+        return stream_zip(
+            ZipStreamEntry(
+                arcname=str(file.path),
+                size=file.size,
+                chunks=file.iter_content(),
+                mode=file.mode,
+                date_time=date_time,
+            )
+            for file in files
+        )
+
     def _generate_or_copy_file_for_download(
         self, commit: GitCommit, target_f: Path
     ) -> None:
+        if self.ARCHIVE_DOWNLOAD:
+            with target_f.open(mode="wb") as f:
+                for chunk in self._stream_archive(commit=commit):
+                    f.write(chunk)
+            return
+
         if self.TARGET_SAVE_FILENAME is None:
             raise RuntimeError(
                 f"This download processor `{self.__class__.__name__}` does not support shortcut download."
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils.http import content_disposition_header
+from git.exc import GitCommandError
+
+from speleodb.git_engine.exceptions import GitBaseError
+from speleodb.surveys.models import ProjectCommit
+from speleodb.utils.helpers import file_lock
+from speleodb.utils.s3_storages import DownloadArtifactStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from speleodb.git_engine.core import GitCommit
+    from speleodb.surveys.models import FileFormat
+    from speleodb.surveys.models import Project
+
+logger = logging.getLogger(__name__)
+
+_SIGNED_URL_EXPIRY = 3600  # 1 hour
+
+# Eviction brings the cache down to this fraction of its maximum size, so that
+# the next sweep only happens once a sizeable amount of entries was added.
+_EVICTION_LOW_WATERMARK = 0.9
+
+# Temporary files older than this were left behind by a killed worker.
+_STALE_TMP_SECONDS = 24 * 3600
+
+
+@dataclass(frozen=True)
+class CachedDownload:
+    committed_date: int
+    path: Path | None = None
+    storage_name: str | None = None
+
+    def get_url(self, filename: str) -> str:
+        """Signed URL of the S3 entry, downloaded as `filename`."""
+        if self.storage_name is None:
+            raise ValueError("This cached download is not stored on S3.")
+
+        return DownloadArtifactStorage().url(  # type: ignore[no-untyped-call,no-any-return]
+            self.storage_name,
+            parameters={
+                "ResponseContentDisposition": content_disposition_header(
+                    as_attachment=True, filename=filename
+                )
+            },
+            expire=_SIGNED_URL_EXPIRY,
+        )
+
+
+class DownloadCache:
+    """Content-addressed cache of generated download artifacts.
+
+    A `(commit, FileFormat)` pair always produces the same artifact, so once
+    built it is kept on local disk at:
+    `DJANGO_DOWNLOAD_CACHE_DIR/<project_id>/<hexsha>/<format>__<committed_date>`.
+
+    The commit date is part of the entry name so that the download filename can
+    be rebuilt without any git access. Entries are evicted least recently used
+    first (the mtime is refreshed on every hit) once the cache grows over
+    `DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB`: the total size is tracked in a small
+    file next to the entries, so the tree is only walked when it overflows.
+    With `DJANGO_DOWNLOAD_CACHE_S3`, entries are also pushed to
+    `DownloadArtifactStorage` and served through a signed URL by workers that
+    do not have them locally.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return settings.DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB > 0  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _root() -> Path:
+        return Path(settings.DJANGO_DOWNLOAD_CACHE_DIR)
+
+    @staticmethod
+    def _entry_prefix(project: Project, hexsha: str) -> str:
+        return f"{project.id}/{hexsha}"
+
+    @staticmethod
+    def _entry_name(fileformat: FileFormat, committed_date: int | None = None) -> str:
+        name = f"{fileformat.label.lower()}__"
+        return name if committed_date is None else f"{name}{committed_date}"
+
+    # ------------------------------ Lookup ------------------------------ #
+
+    @classmethod
+    def resolve_hexsha(cls, project: Project, hexsha: str | None) -> str | None:
+        """Return the full hexsha of the commit to download.
+
+        HEAD is resolved against the project's git mirror (see
+        `Project.get_git_commit`), partial hexshas against the recorded
+        `ProjectCommit`. Returns `None` if the commit can not be determined
+        unambiguously: the download then simply bypasses the cache.
+        """
+        if hexsha is None:
+            try:
+                return project.get_git_commit().hexsha
+            except (GitBaseError, GitCommandError) as e:
+                raise RuntimeError("Impossible to find HEAD commit") from e
+
+        hexsha = hexsha.lower()
+        if len(hexsha) == 40:  # noqa: PLR2004
+            return hexsha
+
+        matches = list(
+            ProjectCommit.objects.filter(
+                project=project, id__startswith=hexsha
+            ).values_list("id", flat=True)[:2]
+        )
+        return matches[0] if len(matches) == 1 else None
+
+    @classmethod
+    def get(
+        cls, project: Project, hexsha: str, fileformat: FileFormat
+    ) -> CachedDownload | None:
+        if not cls.is_enabled():
+            return None
+
+        entry_dir = cls._root() / cls._entry_prefix(project, hexsha)
+        for path in entry_dir.glob(f"{cls._entry_name(fileformat)}*"):
+            try:
+                # Mark the entry as recently used for the LRU eviction
+                os.utime(path)
+                committed_date = int(path.name.rsplit("__", maxsplit=1)[-1])
+            except FileNotFoundError, ValueError:
+                continue
+
+            return CachedDownload(committed_date=committed_date, path=path)
+
+        if settings.DJANGO_DOWNLOAD_CACHE_S3:
+            return cls._get_from_storage(project, hexsha, fileformat)
+
+        return None
+
+    @classmethod
+    def _get_from_storage(
+        cls, project: Project, hexsha: str, fileformat: FileFormat
+    ) -> CachedDownload | None:
+        storage = DownloadArtifactStorage()  # type: ignore[no-untyped-call]
+        prefix = cls._entry_prefix(project, hexsha)
+
+        try:
+            _, files = storage.listdir(prefix)
+        except Exception:
+            logger.exception("Unable to list cached downloads at `%s`", prefix)
+            return None
+
+        for name in files:
+            if not name.startswith(cls._entry_name(fileformat)):
+                continue
+
+            with contextlib.suppress(ValueError):
+                return CachedDownload(
+                    committed_date=int(name.rsplit("__", maxsplit=1)[-1]),
+                    storage_name=f"{prefix}/{name}",
+                )
+
+        return None
+
+    # ------------------------------ Storage ----------------------------- #
+
+    @classmethod
+    def _lock_path(cls) -> Path:
+        return cls._root() / ".lock"
+
+    @classmethod
+    def _size_path(cls) -> Path:
+        return cls._root() / ".size"
+
+    @classmethod
+    def _tmp_path(cls) -> Path:
+        tmp_dir = cls._root() / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir / uuid.uuid4().hex
+
+    @classmethod
+    def _commit_entry(
+        cls,
+        tmp_path: Path,
+        project: Project,
+        commit: GitCommit,
+        fileformat: FileFormat,
+    ) -> Path:
+        prefix = cls._entry_prefix(project, commit.hexsha)
+        name = cls._entry_name(fileformat, committed_date=commit.committed_date)
+
+        target = cls._root() / prefix / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic: concurrent readers never observe a partially written entry.
+        tmp_path.replace(target)
+
+        cls._record_size(target.stat().st_size)
+
+        if settings.DJANGO_DOWNLOAD_CACHE_S3:
+            from speleodb.surveys.tasks import upload_cached_download  # noqa: PLC0415
+
+            # Uploads can be large: never hold the request for them.
+            upload_cached_download.delay(str(target), f"{prefix}/{name}")
+
+        return target
+
+    @classmethod
+    def upload_to_storage(cls, path: Path, storage_name: str) -> None:
+        """Push the local entry at `path` to `DownloadArtifactStorage`."""
+        try:
+            with path.open(mode="rb") as f:
+                DownloadArtifactStorage().save(storage_name, f)  # type: ignore[no-untyped-call]
+        except FileNotFoundError:
+            # Evicted before the upload ran: the next download caches it again.
+            return
+        except Exception:
+            logger.exception("Unable to upload cached download `%s`", path)
+
+    @classmethod
+    def store_file(
+        cls,
+        project: Project,
+        commit: GitCommit,
+        fileformat: FileFormat,
+        source: Path,
+    ) -> Path | None:
+        """Copy `source` into the cache. Returns the entry path (if cached)."""
+        if not cls.is_enabled():
+            return None
+
+        tmp_path = cls._tmp_path()
+        try:
+            shutil.copyfile(source, tmp_path)
+            return cls._commit_entry(tmp_path, project, commit, fileformat)
+        except OSError:
+            logger.exception("Unable to cache download for commit %s", commit.hexsha)
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+    @classmethod
+    def store_stream(
+        cls,
+        project: Project,
+        commit: GitCommit,
+        fileformat: FileFormat,
+        stream: Iterator[bytes],
+    ) -> Iterator[bytes]:
+        """Pass `stream` through while writing it to the cache.
+
+        The entry is only recorded once the stream is exhausted: an interrupted
+        download never leaves a truncated artifact behind.
+        """
+        if not cls.is_enabled():
+            yield from stream
+            return
+
+        tmp_path = cls._tmp_path()
+        try:
+            with tmp_path.open(mode="wb") as f:
+                for chunk in stream:
+                    f.write(chunk)
+                    yield chunk
+
+            # Every byte has been sent: a caching error must not abort the
+            # response of a download that succeeded.
+            try:
+                cls._commit_entry(tmp_path, project, commit, fileformat)
+            except OSError:
+                logger.exception(
+                    "Unable to cache download for commit %s", commit.hexsha
+                )
+
+        finally:
+            # Also reached when the consumer abandons the stream (`close()`):
+            # release the source stream and drop the partial file right away.
+            if (close := getattr(stream, "close", None)) is not None:
+                close()
+            tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def _record_size(cls, size: int) -> None:
+        """Add `size` bytes to the tracked cache size, evicting on overflow."""
+        max_size = settings.DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB * 1024 * 1024
+
+        with file_lock(cls._lock_path()):
+            try:
+                total_size = int(cls._size_path().read_text()) + size
+            except FileNotFoundError, ValueError:
+                # Not tracked yet: the sweep measures it.
+                total_size = max_size + 1
+
+            if total_size <= max_size:
+                cls._size_path().write_text(str(total_size))
+                return
+
+            cls._sweep()
+
+    @classmethod
+    def evict(cls) -> None:
+        """Delete the least recently used entries until the cache fits."""
+        with file_lock(cls._lock_path()):
+            cls._sweep()
+
+    @classmethod
+    def _sweep(cls) -> None:
+        """Evict down to the low watermark and record the resulting size.
+
+        Must be called with the cache lock held. Temporary files left behind
+        by killed workers are deleted along the way.
+        """
+        root = cls._root()
+        max_size = settings.DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB * 1024 * 1024
+        stale_before = time.time() - _STALE_TMP_SECONDS
+
+        entries: list[tuple[float, int, Path]] = []
+        for dirpath, _, filenames in os.walk(root):
+            # `.lock` and `.size` live at the root, entries further down.
+            if Path(dirpath) == root:
+                continue
+
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                with contextlib.suppress(FileNotFoundError):
+                    stat = path.stat()
+
+                    if Path(dirpath).name == ".tmp":
+                        if stat.st_mtime < stale_before:
+                            path.unlink(missing_ok=True)
+                        continue
+
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        if total_size > max_size:
+            target_size = max_size * _EVICTION_LOW_WATERMARK
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total_size <= target_size:
+                    break
+
+                path.unlink(missing_ok=True)
+                total_size -= size
+
+        cls._size_path().write_text(str(total_size))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import io
+import pathlib
+import tempfile
+import zipfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.test import SimpleTestCase
+
+from speleodb.processors._impl.ariane import calculate_git_blob_sha1
+from speleodb.processors._impl.ariane import metadata_invariant_zip_hash
+from speleodb.processors.artifact import Artifact
+
+
+def _zip_bytes(date_time: tuple[int, int, int, int, int, int]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zipf:
+        zipf.writestr(zipfile.ZipInfo("Data.xml", date_time=date_time), b"<xml/>")
+    return buffer.getvalue()
+
+
+class TestArtifactWrite(SimpleTestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = pathlib.Path(self._tmp_dir.name)
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def test_in_memory_upload(self) -> None:
+        upload = SimpleUploadedFile("ariane.tml", b"x" * 200_000)
+        target = self.tmp_path / "ariane.tml"
+
+        Artifact(upload).write(target)
+
+        assert target.read_bytes() == b"x" * 200_000
+
+    def test_temporary_upload_overwrites_existing_file(self) -> None:
+        upload = TemporaryUploadedFile(
+            "ariane.tml", "application/zip", size=6, charset=None
+        )
+        upload.write(b"new v2")
+        upload.flush()
+
+        target = self.tmp_path / "ariane.tml"
+        target.write_bytes(b"old v1")
+
+        try:
+            Artifact(upload).write(target)
+        finally:
+            upload.close()
+
+        # The worktree file survives the removal of the temporary upload
+        assert target.read_bytes() == b"new v2"
+        assert [p.name for p in self.tmp_path.iterdir()] == ["ariane.tml"]
+
+
+class TestMetadataInvariantZipHash(SimpleTestCase):
+    def test_same_hash_for_all_sources(self) -> None:
+        data = _zip_bytes((2020, 1, 1, 0, 0, 0))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "ariane.tml"
+            path.write_bytes(data)
+
+            assert (
+                metadata_invariant_zip_hash(data)
+                == metadata_invariant_zip_hash(path)
+                == metadata_invariant_zip_hash(io.BytesIO(data))
+                == metadata_invariant_zip_hash(SimpleUploadedFile("a.tml", data))
+            )
+
+    def test_ignores_metadata(self) -> None:
+        assert metadata_invariant_zip_hash(
+            _zip_bytes((2020, 1, 1, 0, 0, 0))
+        ) == metadata_invariant_zip_hash(_zip_bytes((2024, 6, 1, 12, 30, 0)))
+
+
+class TestCalculateGitBlobSha1(SimpleTestCase):
+    def test_matches_git_hash_object(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "dive.dmp"
+            path.write_bytes(b"hello\n")
+
+            # $ printf 'hello\n' | git hash-object --stdin
+            assert (
+                calculate_git_blob_sha1(path)
+                == "ce013625030ba8dba906f756967f9e9ca394464a"
+            )
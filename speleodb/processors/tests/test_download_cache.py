@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import os
+import pathlib
+import tempfile
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test import override_settings
+
+from speleodb.api.v2.tests.factories import ProjectCommitFactory
+from speleodb.api.v2.tests.factories import ProjectFactory
+from speleodb.processors import DumpProcessor
+from speleodb.processors import download_cache
+from speleodb.processors.download_cache import DownloadCache
+from speleodb.surveys.models import FileFormat
+from speleodb.users.tests.factories import UserFactory
+
+if TYPE_CHECKING:
+    from speleodb.git_engine.core import GitCommit
+
+
+def _commit(hexsha: str, committed_date: int = 1_700_000_000) -> GitCommit:
+    commit: Any = SimpleNamespace(hexsha=hexsha, committed_date=committed_date)
+    return commit  # type: ignore[no-any-return]
+
+
+class TestDownloadCache(TestCase):
+    """Test suite for the `(project, commit, format)` download cache."""
+
+    def setUp(self) -> None:
+        self.user = UserFactory.create()
+        self.project = ProjectFactory.create(created_by=self.user.email)
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = pathlib.Path(self._tmp_dir.name)
+
+        self._settings = override_settings(
+            DJANGO_DOWNLOAD_CACHE_DIR=self.tmp_path / "cache",
+            DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB=1,
+            DJANGO_DOWNLOAD_CACHE_S3=False,
+        )
+        self._settings.enable()
+
+    def tearDown(self) -> None:
+        self._settings.disable()
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def _source(self, content: bytes) -> pathlib.Path:
+        path = self.tmp_path / "source.bin"
+        path.write_bytes(content)
+        return path
+
+    def test_store_and_get(self) -> None:
+        commit = _commit("a" * 40)
+
+        assert DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP) is None
+
+        DownloadCache.store_file(
+            self.project, commit, FileFormat.DUMP, self._source(b"archive")
+        )
+
+        cached = DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP)
+        assert cached is not None
+        assert cached.path is not None
+        assert cached.path.read_bytes() == b"archive"
+        assert cached.committed_date == commit.committed_date
+
+        # Entries are keyed by format
+        assert (
+            DownloadCache.get(self.project, commit.hexsha, FileFormat.ARIANE_TML)
+            is None
+        )
+
+    def test_download_filename_rebuilt_from_entry(self) -> None:
+        commit = _commit("b" * 40)
+        DownloadCache.store_file(
+            self.project, commit, FileFormat.DUMP, self._source(b"archive")
+        )
+
+        cached = DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP)
+        assert cached is not None
+
+        processor = DumpProcessor(project=self.project)
+        assert processor.get_download_filename(
+            committed_date=cached.committed_date, default=""
+        ) == processor.get_download_filename(
+            committed_date=commit.committed_date, default=""
+        )
+
+    def test_store_stream(self) -> None:
+        commit = _commit("c" * 40)
+        chunks = [b"chunk-1", b"chunk-2"]
+
+        stream = DownloadCache.store_stream(
+            self.project, commit, FileFormat.DUMP, iter(chunks)
+        )
+        assert list(stream) == chunks
+
+        cached = DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP)
+        assert cached is not None
+        assert cached.path is not None
+        assert cached.path.read_bytes() == b"".join(chunks)
+
+    def test_interrupted_stream_is_not_cached(self) -> None:
+        commit = _commit("d" * 40)
+
+        stream = DownloadCache.store_stream(
+            self.project, commit, FileFormat.DUMP, iter([b"chunk-1", b"chunk-2"])
+        )
+        assert next(stream) == b"chunk-1"
+        stream.close()  # type: ignore[attr-defined]
+
+        assert DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP) is None
+        assert not any((self.tmp_path / "cache" / ".tmp").iterdir())
+
+    def test_stream_survives_caching_error(self) -> None:
+        commit = _commit("f" * 40)
+        chunks = [b"chunk-1", b"chunk-2"]
+
+        with patch.object(
+            DownloadCache, "_commit_entry", side_effect=OSError("disk full")
+        ):
+            stream = DownloadCache.store_stream(
+                self.project, commit, FileFormat.DUMP, iter(chunks)
+            )
+            assert list(stream) == chunks
+
+        assert DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP) is None
+        assert not any((self.tmp_path / "cache" / ".tmp").iterdir())
+
+    @override_settings(DJANGO_DOWNLOAD_CACHE_S3=True)
+    def test_s3_upload_is_queued(self) -> None:
+        commit = _commit("a" * 40)
+
+        with patch("speleodb.surveys.tasks.upload_cached_download.delay") as mock_delay:
+            path = DownloadCache.store_file(
+                self.project, commit, FileFormat.DUMP, self._source(b"archive")
+            )
+
+        assert path is not None
+        mock_delay.assert_called_once_with(
+            str(path), f"{self.project.id}/{commit.hexsha}/{path.name}"
+        )
+
+    def test_lru_eviction(self) -> None:
+        content = b"x" * (400 * 1024)
+        commits = [_commit(char * 40) for char in "abc"]
+
+        for idx, commit in enumerate(commits):
+            path = DownloadCache.store_file(
+                self.project, commit, FileFormat.DUMP, self._source(content)
+            )
+            assert path is not None
+            # Make sure every entry gets a distinct, increasing mtime
+            os.utime(path, (1_000 + idx, 1_000 + idx))
+
+            if idx == 1:
+                # Access the first entry: it becomes the most recently used
+                assert DownloadCache.get(
+                    self.project, commits[0].hexsha, FileFormat.DUMP
+                )
+
+        # Cache holds 1 MiB: the least recently used entry was evicted
+        assert DownloadCache.get(self.project, commits[0].hexsha, FileFormat.DUMP)
+        assert (
+            DownloadCache.get(self.project, commits[1].hexsha, FileFormat.DUMP) is None
+        )
+        assert DownloadCache.get(self.project, commits[2].hexsha, FileFormat.DUMP)
+
+    def test_tree_is_only_walked_on_overflow(self) -> None:
+        with patch.object(download_cache.os, "walk", wraps=os.walk) as mock_walk:
+            for char in "abc":
+                commit = _commit(char * 40)
+                DownloadCache.store_file(
+                    self.project, commit, FileFormat.DUMP, self._source(b"x")
+                )
+
+        # Only the first entry walks the tree, to measure the cache size.
+        assert mock_walk.call_count == 1
+        assert (self.tmp_path / "cache" / ".size").read_text() == "3"
+
+    def test_eviction_drops_stale_tmp_files(self) -> None:
+        tmp_dir = self.tmp_path / "cache" / ".tmp"
+        tmp_dir.mkdir(parents=True)
+        stale = tmp_dir / "stale"
+        stale.write_bytes(b"partial")
+        os.utime(stale, (1_000, 1_000))
+        fresh = tmp_dir / "fresh"
+        fresh.write_bytes(b"partial")
+
+        DownloadCache.evict()
+
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_resolve_partial_hexsha(self) -> None:
+        commit = ProjectCommitFactory.create(project=self.project)
+
+        assert DownloadCache.resolve_hexsha(self.project, commit.id[:8]) == commit.id
+        assert DownloadCache.resolve_hexsha(self.project, commit.id) == commit.id
+        assert DownloadCache.resolve_hexsha(self.project, "0000000") is None
+
+    @override_settings(DJANGO_DOWNLOAD_CACHE_MAX_SIZE_MB=0)
+    def test_disabled(self) -> None:
+        commit = _commit("e" * 40)
+
+        assert (
+            DownloadCache.store_file(
+                self.project, commit, FileFormat.DUMP, self._source(b"archive")
+            )
+            is None
+        )
+        assert DownloadCache.get(self.project, commit.hexsha, FileFormat.DUMP) is None
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+from unittest.mock import patch
 
 import pytest
+from django.test import TestCase
 
+from speleodb.api.v2.tests.factories import ProjectFactory
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitRepo
+from speleodb.processors._impl.ariane import MnemoDMPFileProcessor
+from speleodb.processors._impl.ariane import calculate_sha1
 from speleodb.processors.base import BaseFileProcessor
+from speleodb.surveys.models import Project
 
 
 @pytest.mark.parametrize(
@@ -80,5 +92,88 @@ def test_no_dangerous_extension_is_allowed(
     assert not error_messages, "\n".join(error_messages)
 
 
+@pytest.mark.parametrize(
+    "cls_processor",
+    [cls for cls in BaseFileProcessor.__subclasses__() if cls.ARCHIVE_DOWNLOAD],
+)
+def test_archive_processors_list_their_files(
+    cls_processor: type[BaseFileProcessor],
+) -> None:
+    assert (
+        cls_processor._get_archive_files  # noqa: SLF001
+        is not BaseFileProcessor._get_archive_files  # noqa: SLF001
+    )
+
+
+@pytest.mark.parametrize(
+    "cls_processor",
+    [cls for cls in BaseFileProcessor.__subclasses__() if not cls.ARCHIVE_DOWNLOAD],
+)
+def test_archive_download_is_rejected_without_support(
+    cls_processor: type[BaseFileProcessor],
+) -> None:
+    # No project needed: the request is rejected before it is ever used.
+    processor = cls_processor.__new__(cls_processor)
+
+    with pytest.raises(RuntimeError, match="does not support archive download"):
+        processor.get_archive_stream_for_download()
+
+    with pytest.raises(RuntimeError, match="does not support archive download"):
+        processor._get_archive_files(commit=MagicMock())  # noqa: SLF001
+
+
+class TestMnemoDMPDuplicate(TestCase):
+    def setUp(self) -> None:
+        self.project = ProjectFactory.create()
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp_dir.name)
+        self.repo = GitRepo.init(path=self.tmp_path / "repo")
+
+        self._git_repo = patch.object(
+            Project, "git_repo", new_callable=PropertyMock, return_value=self.repo
+        )
+        self._git_repo.start()
+
+    def tearDown(self) -> None:
+        self._git_repo.stop()
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def _commit_file(self, rel_path: str, content: bytes) -> None:
+        path = self.repo.path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        self.repo.index.add([rel_path])
+        self.repo.index.commit(rel_path, author=GIT_COMMITTER, committer=GIT_COMMITTER)
+
+    def test_content_first_committed_elsewhere_is_a_duplicate(self) -> None:
+        # The blob is first seen outside of the DMP folder, then copied into it.
+        self._commit_file("archive/dive.dmp", b"dmp content")
+        self._commit_file("mnemo_DMPs/dive_copy.dmp", b"dmp content")
+
+        upload = self.tmp_path / "upload.dmp"
+        upload.write_bytes(b"dmp content")
+
+        processor = MnemoDMPFileProcessor(project=self.project)
+        assert processor._find_duplicate(  # noqa: SLF001
+            upload, calculate_sha1(file_path=upload)
+        ) == (self.repo.path / "mnemo_DMPs/dive_copy.dmp")
+
+    def test_new_content_is_not_a_duplicate(self) -> None:
+        self._commit_file("mnemo_DMPs/dive.dmp", b"dmp content")
+
+        upload = self.tmp_path / "upload.dmp"
+        upload.write_bytes(b"other content")
+
+        processor = MnemoDMPFileProcessor(project=self.project)
+        assert (
+            processor._find_duplicate(  # noqa: SLF001
+                upload, calculate_sha1(file_path=upload)
+            )
+            is None
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
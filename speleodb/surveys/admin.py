@@ -18,6 +18,7 @@ from django.utils.html import format_html
 from speleodb.common.enums import PermissionLevel
 from speleodb.surveys.models import Format
 from speleodb.surveys.models import Project
+from speleodb.surveys.models import ProjectBlob
 from speleodb.surveys.models import ProjectCommit
 from speleodb.surveys.models import ProjectMutex
 from speleodb.utils.admin_filters import ProjectCountryFilter
@@ -138,6 +139,18 @@ class ProjectAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
         super().save_model(request, obj, form, change)
 
 
+@admin.register(ProjectBlob)
+class ProjectBlobAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = ("hexsha", "project", "path", "size", "commit")
+    search_fields = ("hexsha", "path")
+    list_filter = ("project",)
+    ordering = ("-creation_date",)
+
+    # Prevent edits - The index is maintained by `construct_git_history_from_project`
+    def has_change_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        return False
+
+
 @admin.register(ProjectCommit)
 class ProjectCommitAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     list_display = ("id", "project", "author_name", "author_email", "authored_date")
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.7 on 2026-10-16 09:12
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0028_alter_project_color'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hexsha', models.CharField(help_text='Specific blob SHA (40 hex chars).', max_length=40, validators=[django.core.validators.RegexValidator(message='Enter a valid sha1 value', regex='^[0-9a-f]{40}$')])),
+                ('path', models.CharField(max_length=1024)),
+                ('size', models.PositiveBigIntegerField()),
+                ('mode', models.PositiveIntegerField()),
+                ('creation_date', models.DateTimeField(auto_now_add=True)),
+                ('commit', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='blobs', to='surveys.projectcommit')),
+                ('project', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='blobs', to='surveys.project')),
+            ],
+            options={
+                'verbose_name': 'Project Blob',
+                'verbose_name_plural': 'Project Blobs',
+                'constraints': [models.UniqueConstraint(fields=('project', 'hexsha'), name='surveys_projectblob_unique_hexsha')],
+            },
+        ),
+    ]
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+from django.db import models
+
+import speleodb.common.enums
+
+
+def backfill_effective_permissions(apps, schema_editor):
+    """Merge the active user and team permissions into their best level."""
+    UserProjectPermission = apps.get_model("surveys", "UserProjectPermission")
+    TeamProjectPermission = apps.get_model("surveys", "TeamProjectPermission")
+    EffectiveProjectPermission = apps.get_model(
+        "surveys", "EffectiveProjectPermission"
+    )
+
+    best_levels = {}
+    for user_id, project_id, level in [
+        *UserProjectPermission.objects.filter(is_active=True).values_list(
+            "target_id", "project_id", "level"
+        ),
+        *TeamProjectPermission.objects.filter(
+            is_active=True,
+            target__memberships__is_active=True,
+        ).values_list("target__memberships__user_id", "project_id", "level"),
+    ]:
+        key = (user_id, project_id)
+        best_levels[key] = max(level, best_levels.get(key, level))
+
+    EffectiveProjectPermission.objects.bulk_create(
+        [
+            EffectiveProjectPermission(
+                user_id=user_id, project_id=project_id, level=level
+            )
+            for (user_id, project_id), level in best_levels.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("surveys", "0029_projectblob"),
+        ("users", "0008_user_has_api_doc_access"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EffectiveProjectPermission",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "level",
+                    models.IntegerField(
+                        choices=speleodb.common.enums.PermissionLevel.choices,
+                        editable=False,
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="effective_permissions",
+                        to="surveys.project",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="effective_project_permissions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Project - Effective Permission",
+                "verbose_name_plural": "Project - Effective Permissions",
+                "indexes": [
+                    models.Index(
+                        fields=["project"], name="surveys_effperm_project_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "project"),
+                        name="surveys_effectiveprojectpermission_user_project_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_effective_permissions,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-16 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0030_effectiveprojectpermission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectcommit',
+            name='blobs_indexed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
@@ -8,6 +8,7 @@ from __future__ import annotations
 # Project Related Models
 from speleodb.surveys.models.project import Project
 from speleodb.surveys.models.project_commit import ProjectCommit
+from speleodb.surveys.models.project_blob import ProjectBlob
 from speleodb.surveys.models.format import Format
 from speleodb.surveys.models.format import FileFormat
 from speleodb.surveys.models.mutex import ProjectMutex
@@ -15,12 +16,15 @@ from speleodb.surveys.models.mutex import ProjectMutex
 # Permission Related Models
 from speleodb.surveys.models.permission_team import TeamProjectPermission
 from speleodb.surveys.models.permission_user import UserProjectPermission
+from speleodb.surveys.models.permission_effective import EffectiveProjectPermission
 
 
 __all__ = [
+    "EffectiveProjectPermission",
     "FileFormat",
     "Format",
     "Project",
+    "ProjectBlob",
     "ProjectCommit",
     "ProjectMutex",
     "TeamProjectPermission",
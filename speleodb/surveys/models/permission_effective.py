@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from django.db import connection
+from django.db import models
+from django.db import transaction
+from django.db.models import Q
+
+from speleodb.common.enums import PermissionLevel
+from speleodb.surveys.models import Project
+from speleodb.surveys.models.permission_team import TeamProjectPermission
+from speleodb.surveys.models.permission_user import UserProjectPermission
+from speleodb.users.models import User
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+# Key space of the advisory locks taken by `EffectiveProjectPermission.refresh`.
+_REFRESH_LOCK_NAMESPACE = "surveys_effectiveprojectpermission_refresh"
+
+
+class EffectiveProjectPermission(models.Model):
+    """Best active permission level of a user on a project.
+
+    Merges ``UserProjectPermission`` with the ``TeamProjectPermission`` of
+    every team the user is an active member of, so that the projects a
+    user can access are a single join away. Maintained by the signals of
+    ``speleodb.surveys`` through :meth:`refresh`, never edited directly.
+    """
+
+    user = models.ForeignKey(
+        User,
+        related_name="effective_project_permissions",
+        on_delete=models.CASCADE,
+        editable=False,
+    )
+
+    project = models.ForeignKey(
+        Project,
+        related_name="effective_permissions",
+        on_delete=models.CASCADE,
+        editable=False,
+    )
+
+    level = models.IntegerField(
+        choices=PermissionLevel.choices,
+        editable=False,
+    )
+
+    class Meta:
+        verbose_name = "Project - Effective Permission"
+        verbose_name_plural = "Project - Effective Permissions"
+        indexes = [
+            models.Index(fields=["project"], name="surveys_effperm_project_idx"),
+            # models.Index(fields=["user", "project"]), # Present via unique constraint  # noqa: E501
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project"],
+                name="%(app_label)s_%(class)s_user_project_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} => {self.project} [{self.level}]"
+
+    @staticmethod
+    def _lock_scope(project_ids: Iterable[UUID] | None) -> None:
+        """Serialize the refreshes of overlapping scopes, until the transaction ends.
+
+        Refreshes of given projects share a global lock and hold one lock per
+        project, a refresh of every project holds the global lock exclusively.
+        Locks are always taken in the same order: no deadlock.
+        """
+        with connection.cursor() as cursor:
+            if project_ids is None:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                    [_REFRESH_LOCK_NAMESPACE],
+                )
+                return
+
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock_shared(hashtextextended(%s, 0))",
+                [_REFRESH_LOCK_NAMESPACE],
+            )
+            for project_id in sorted({str(project_id) for project_id in project_ids}):
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                    [f"{_REFRESH_LOCK_NAMESPACE}:{project_id}"],
+                )
+
+    @classmethod
+    def refresh(
+        cls,
+        *,
+        user_ids: Iterable[int] | None = None,
+        project_ids: Iterable[UUID] | None = None,
+    ) -> None:
+        """Recompute the rows of *user_ids* x *project_ids*.
+
+        ``None`` stands for every user (resp. project).
+        """
+        scope = Q()
+        user_grants = Q(is_active=True)
+        team_grants = Q(is_active=True, target__memberships__is_active=True)
+
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            scope &= Q(user_id__in=user_ids)
+            user_grants &= Q(target_id__in=user_ids)
+            team_grants &= Q(target__memberships__user_id__in=user_ids)
+
+        if project_ids is not None:
+            project_ids = list(project_ids)
+            scope &= Q(project_id__in=project_ids)
+            user_grants &= Q(project_id__in=project_ids)
+            team_grants &= Q(project_id__in=project_ids)
+
+        # The grants are read under the scope lock, in the transaction that
+        # writes: a refresh can not overwrite the result of a concurrent one
+        # with an older snapshot. Granted pairs are upserted and only the ones
+        # no longer granted are deleted, so readers never miss a valid row.
+        with transaction.atomic():
+            cls._lock_scope(project_ids)
+
+            best_levels: dict[tuple[int, UUID], int] = {}
+            for user_id, project_id, level in chain(
+                UserProjectPermission.objects.filter(user_grants).values_list(
+                    "target_id", "project_id", "level"
+                ),
+                TeamProjectPermission.objects.filter(team_grants).values_list(
+                    "target__memberships__user_id", "project_id", "level"
+                ),
+            ):
+                key = (user_id, project_id)
+                best_levels[key] = max(level, best_levels.get(key, level))
+
+            cls.objects.bulk_create(
+                [
+                    cls(user_id=user_id, project_id=project_id, level=level)
+                    for (user_id, project_id), level in best_levels.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["user", "project"],
+                update_fields=["level"],
+            )
+            stale_pks = [
+                pk
+                for pk, user_id, project_id in cls.objects.filter(scope).values_list(
+                    "pk", "user_id", "project_id"
+                )
+                if (user_id, project_id) not in best_levels
+            ]
+            if stale_pks:
+                cls.objects.filter(pk__in=stale_pks).delete()
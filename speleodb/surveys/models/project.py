@@ -15,6 +15,7 @@ from compass_lib.geojson import project_to_geojson
 from compass_lib.io import load_project
 from compass_lib.solver.sparse import SparseSolver
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
@@ -40,9 +41,11 @@ from speleodb.common.enums import ProjectType
 from speleodb.common.enums import ProjectVisibility
 from speleodb.git_engine.core import GitRepo
 from speleodb.git_engine.exceptions import GitBaseError
+from speleodb.git_engine.exceptions import GitBlobNotFoundError
 from speleodb.git_engine.gitlab_manager import GitlabManager
 from speleodb.utils.exceptions import GeoJSONGenerationError
 from speleodb.utils.exceptions import ProjectNotFound
+from speleodb.utils.helpers import file_lock
 from speleodb.utils.timing_ctx import timed_section
 
 if TYPE_CHECKING:
@@ -56,7 +59,9 @@ if TYPE_CHECKING:
     from speleodb.gis.models import ProjectGeoJSON
     from speleodb.gis.models import SubSurfaceStation
     from speleodb.git_engine.core import GitCommit
+    from speleodb.git_engine.core import GitFile
     from speleodb.surveys.models import Format
+    from speleodb.surveys.models import ProjectBlob
     from speleodb.surveys.models import ProjectCommit
     from speleodb.surveys.models import ProjectMutex
     from speleodb.surveys.models import TeamProjectPermission
@@ -66,6 +71,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Short-lived: only bounds how long a push made outside of SpeleoDB (directly on
+# Gitlab) can go unnoticed. Our own pushes invalidate the entry immediately.
+_REMOTE_HEAD_CACHE_TIMEOUT = 30  # seconds
+
+# Blobs not reachable from HEAD: the entry is keyed by HEAD, the timeout only
+# bounds the cache size.
+_BLOB_MISS_CACHE_TIMEOUT = 60 * 60  # seconds
+
 
 class ProjectQuerySet(models.QuerySet["Project"]):
     def with_commits(self) -> Self:
@@ -179,6 +192,7 @@ class Project(models.Model):
     _team_permissions: models.QuerySet[TeamProjectPermission]
     _user_permissions: models.QuerySet[UserProjectPermission]
 
+    blobs: models.QuerySet[ProjectBlob]
     commits: models.QuerySet[ProjectCommit]
     exploration_leads: models.QuerySet[ExplorationLead]
     geojsons: models.QuerySet[ProjectGeoJSON]
@@ -466,6 +480,149 @@ class Project(models.Model):
             f"`{self.git_repo_dir}`"
         )
 
+    @property
+    def git_mirror_dir(self) -> pathlib.Path:
+        return pathlib.Path(
+            settings.DJANGO_GIT_PROJECTS_DIR / ".mirrors" / f"{self.id}.git"
+        ).resolve()
+
+    @property
+    def git_mirror_lock_path(self) -> pathlib.Path:
+        return self.git_mirror_dir.with_suffix(".lock")
+
+    @property
+    def git_mirror(self) -> GitRepo:
+        """Worker-local bare mirror of the project used by every read path.
+
+        It has no working tree: reads (explorer, downloads, blobs) go directly
+        against the object database and the mirror is only ever refreshed with
+        `git fetch` (see `fetch_git_mirror`). Write paths keep using the
+        `git_repo` working copy.
+        """
+        if (git_mirror := self._open_git_mirror()) is not None:
+            return git_mirror
+
+        with file_lock(self.git_mirror_lock_path):
+            return self._open_or_clone_git_mirror()
+
+    def _open_git_mirror(self) -> GitRepo | None:
+        if not self.git_mirror_dir.exists():
+            return None
+
+        try:
+            return GitRepo.from_directory(self.git_mirror_dir)
+        except RuntimeError:
+            return None
+
+    def _open_or_clone_git_mirror(self) -> GitRepo:
+        """Must be called with the mirror lock held."""
+        # Another worker may have cloned it while we waited for the lock.
+        if (git_mirror := self._open_git_mirror()) is not None:
+            return git_mirror
+
+        try:
+            return GitlabManager.clone_mirror(self, self.git_mirror_dir)
+        except (GitBaseError, GitCommandError) as e:
+            raise RuntimeError(
+                f"Impossible to clone or open the git mirror `{self.git_mirror_dir}`"
+            ) from e
+
+    def fetch_git_mirror(self) -> GitRepo:
+        """Refresh the bare mirror with `git fetch` and record the new commits.
+
+        Fetches of the same mirror are serialized across processes. A failed
+        fetch keeps the mirror as is, unless it turns out to be corrupted: it
+        is then re-cloned from scratch and swapped in place.
+        """
+        with file_lock(self.git_mirror_lock_path):
+            git_mirror = self._open_or_clone_git_mirror()
+
+            try:
+                git_mirror.fetch()
+
+            except GitBaseError, GitCommandError:
+                if git_mirror.is_corrupted():
+                    logger.warning(
+                        "The git mirror for project %s is corrupted. "
+                        "Re-cloning it from scratch.",
+                        self.id,
+                    )
+                    # A fresh clone is up to date by definition
+                    try:
+                        git_mirror = GitlabManager.clone_mirror(
+                            self, self.git_mirror_dir
+                        )
+                    except (GitBaseError, GitCommandError) as e:
+                        raise RuntimeError(
+                            "Impossible to re-clone the git mirror "
+                            f"`{self.git_mirror_dir}`"
+                        ) from e
+
+                else:
+                    logger.warning(
+                        "Failed to fetch the git mirror for project %s. "
+                        "Serving the local mirror as is.",
+                        self.id,
+                    )
+
+        self.construct_git_history_from_project(git_repo=git_mirror)
+        return git_mirror
+
+    @property
+    def _remote_head_cache_key(self) -> str:
+        return f"git_remote_head_{self.id}"
+
+    def get_remote_head_hexsha(self) -> str | None:
+        """Return the hexsha of the default branch on Gitlab (cached).
+
+        Returns `None` if the Gitlab API can not be reached or the project does
+        not exist there yet.
+        """
+        if (hexsha := cache.get(self._remote_head_cache_key)) is not None:
+            return hexsha  # type: ignore[no-any-return]
+
+        try:
+            hexsha = GitlabManager.get_last_commit_hash(project=self)
+        except RuntimeError:
+            return None
+
+        if hexsha is not None:
+            cache.set(
+                self._remote_head_cache_key,
+                hexsha,
+                timeout=_REMOTE_HEAD_CACHE_TIMEOUT,
+            )
+
+        return hexsha
+
+    def invalidate_remote_head(self) -> None:
+        """Forget the cached remote HEAD. Called after every push we proxy."""
+        cache.delete(self._remote_head_cache_key)
+
+    def get_git_commit(self, hexsha: str | None = None) -> GitCommit:
+        """Resolve *hexsha* (default: HEAD) against the bare mirror.
+
+        The mirror is fetched when the commit is not known locally and, for HEAD,
+        only when the local HEAD differs from the remote HEAD (or the latter is
+        unknown).
+        """
+        if hexsha is None:
+            git_mirror = self.git_mirror
+            if (
+                (remote_hexsha := self.get_remote_head_hexsha()) is not None
+                and git_mirror.head.is_valid()
+                and git_mirror.head.commit.hexsha == remote_hexsha
+            ):
+                return git_mirror.head.commit
+
+            return self.fetch_git_mirror().head.commit
+
+        try:
+            return self.git_mirror.commit(hexsha)
+        except ValueError:
+            # In case the commit doesn't exist - fetch and retry
+            return self.fetch_git_mirror().commit(hexsha)
+
     @property
     def commit_history(self) -> list[dict[str, Any]] | None:
         try:
@@ -493,7 +650,7 @@ class Project(models.Model):
     def has_write_access(self, user: User) -> bool:
         from speleodb.common.enums import PermissionLevel  # noqa: PLC0415
 
-        return user.get_best_permission(self).level >= PermissionLevel.READ_AND_WRITE
+        return user.get_best_permission_level(self) >= PermissionLevel.READ_AND_WRITE
 
     def has_admin_access(self, user: User) -> bool:
         from speleodb.common.enums import PermissionLevel  # noqa: PLC0415
@@ -508,6 +665,7 @@ class Project(models.Model):
         hexsha = git_repo.commit_and_push_project(
             message=message, author_name=author.name, author_email=author.email
         )
+        self.invalidate_remote_head()
 
         # Ensure the git history is properly constructed
         self.construct_git_history_from_project(git_repo=git_repo)
@@ -549,6 +707,7 @@ class Project(models.Model):
         self.construct_git_history_from_project(git_repo=git_repo)
 
     def construct_git_history_from_project(self, git_repo: GitRepo) -> None:
+        from speleodb.surveys.models import ProjectBlob  # noqa: PLC0415
         from speleodb.surveys.models import ProjectCommit  # noqa: PLC0415
 
         with timed_section("Constructing Git History"):
@@ -564,14 +723,84 @@ class Project(models.Model):
             commits.sort(key=lambda c: c.committed_date)
 
             # 3. Rebuild commits in order
+            new_commits: list[tuple[ProjectCommit, GitCommit]] = []
             for git_commit in commits:
                 if git_commit.hexsha not in hashtable:
                     with contextlib.suppress(IntegrityError):
-                        _ = ProjectCommit.get_or_create_from_commit(
-                            project=self,
-                            commit=git_commit,
+                        new_commits.append(
+                            (
+                                ProjectCommit.get_or_create_from_commit(
+                                    project=self,
+                                    commit=git_commit,
+                                ),
+                                git_commit,
+                            )
                         )
 
+            # 4. Index the blobs of the new commits. A cold index (e.g. history
+            #    recorded before the blob index existed) is backfilled in full.
+            if not ProjectBlob.objects.filter(project=self).exists():
+                new_commits = [
+                    (hashtable[git_commit.hexsha], git_commit)
+                    for git_commit in commits
+                    if git_commit.hexsha in hashtable
+                ] + new_commits
+                new_commits.sort(key=lambda c: c[1].committed_date)
+
+            if new_commits:
+                with timed_section("Indexing Git Blobs"):
+                    _ = ProjectBlob.index_commits(project=self, commits=new_commits)
+
+    def find_blob(self, hexsha: str) -> GitFile:
+        """Resolve a blob through the `ProjectBlob` index.
+
+        On an index miss, a blob present in the mirror triggers the indexing of
+        the commits not indexed yet (recording the commits of the mirror first).
+        Blobs still missing after that are not reachable from HEAD: the miss is
+        cached until HEAD moves.
+        """
+        from speleodb.surveys.models import ProjectBlob  # noqa: PLC0415
+
+        git_repo = self.git_mirror
+
+        if (blob := self.blobs.filter(hexsha=hexsha).first()) is not None:
+            return git_repo.get_blob(hexsha, path=blob.path, mode=blob.mode)
+
+        head = git_repo.head.commit.hexsha if git_repo.head.is_valid() else None
+        miss_key = f"git_blob_miss_{self.id}_{hexsha}_{head}"
+
+        # Unknown objects are rejected without walking the history.
+        if cache.get(miss_key) or not git_repo.has_blob(hexsha):
+            raise GitBlobNotFoundError(f"Git Object with id `{hexsha}` not found.")
+
+        # 1. The blob may come from commits of the mirror not recorded yet.
+        self.construct_git_history_from_project(git_repo=git_repo)
+
+        # 2. Or from recorded commits whose blobs were never indexed.
+        if not self.blobs.filter(hexsha=hexsha).exists() and (
+            unindexed := {
+                commit.id: commit for commit in self.commits.filter(blobs_indexed=False)
+            }
+        ):
+            _ = ProjectBlob.index_commits(
+                project=self,
+                commits=[
+                    (unindexed[git_commit.hexsha], git_commit)
+                    for git_commit in sorted(
+                        git_repo.iter_commits("HEAD"), key=lambda c: c.committed_date
+                    )
+                    if git_commit.hexsha in unindexed
+                ],
+            )
+
+        if (blob := self.blobs.filter(hexsha=hexsha).first()) is not None:
+            return git_repo.get_blob(hexsha, path=blob.path, mode=blob.mode)
+
+        # Not reachable from HEAD (e.g. another ref of the mirror, or a blob
+        # left dangling by a force-push).
+        cache.set(miss_key, value=True, timeout=_BLOB_MISS_CACHE_TIMEOUT)
+        raise GitBlobNotFoundError(f"Git Object with id `{hexsha}` not found.")
+
     @property
     def formats(self) -> models.QuerySet[Format]:
         return self._formats.all()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.validators import RegexValidator
+from django.db import models
+
+from speleodb.surveys.models import Project
+from speleodb.surveys.models import ProjectCommit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from speleodb.git_engine.core import GitCommit
+
+
+class ProjectBlob(models.Model):
+    """Persistent `blob hexsha -> (first commit, path, size, mode)` index.
+
+    Rows are appended by `Project.construct_git_history_from_project` whenever
+    new `ProjectCommit` rows are recorded, so that a blob lookup is a single
+    indexed query instead of a walk over every tree of every commit.
+    """
+
+    project = models.ForeignKey(
+        Project,
+        related_name="blobs",
+        on_delete=models.CASCADE,
+        blank=False,
+        null=False,
+        editable=False,
+    )
+
+    # Blob object ID (SHA)
+    hexsha = models.CharField(
+        max_length=40,
+        validators=[
+            RegexValidator(regex=r"^[0-9a-f]{40}$", message="Enter a valid sha1 value")
+        ],
+        help_text="Specific blob SHA (40 hex chars).",
+    )
+
+    # First commit (oldest first) in which the blob appears.
+    commit = models.ForeignKey(
+        ProjectCommit,
+        related_name="blobs",
+        on_delete=models.CASCADE,
+        blank=False,
+        null=False,
+        editable=False,
+    )
+
+    path = models.CharField(max_length=1024, blank=False, null=False)
+    size = models.PositiveBigIntegerField(blank=False, null=False)
+    mode = models.PositiveIntegerField(blank=False, null=False)
+
+    creation_date = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        verbose_name = "Project Blob"
+        verbose_name_plural = "Project Blobs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "hexsha"],
+                name="surveys_projectblob_unique_hexsha",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"[Blob {self.hexsha[:8]}] {self.path} @ {self.commit_id[:8]}"
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self}>"
+
+    @classmethod
+    def index_commits(
+        cls,
+        project: Project,
+        commits: Iterable[tuple[ProjectCommit, GitCommit]],
+    ) -> int:
+        """Record every blob not yet indexed for `project`.
+
+        `commits` must be ordered oldest first so that each blob is attributed
+        to the first commit it appears in. Returns the number of new rows.
+        """
+        commits = list(commits)
+        known_hexshas = set(
+            cls.objects.filter(project=project).values_list("hexsha", flat=True)
+        )
+
+        blobs: list[ProjectBlob] = []
+        for commit_obj, git_commit in commits:
+            for item in git_commit.tree.traverse():
+                if item.type != "blob" or item.hexsha in known_hexshas:
+                    continue
+
+                known_hexshas.add(item.hexsha)
+                blobs.append(
+                    cls(
+                        project=project,
+                        hexsha=item.hexsha,
+                        commit=commit_obj,
+                        path=str(item.path),
+                        size=item.size,
+                        mode=item.mode,
+                    )
+                )
+
+        # `ignore_conflicts` covers concurrent workers indexing the same commits.
+        cls.objects.bulk_create(blobs, batch_size=1000, ignore_conflicts=True)
+        ProjectCommit.objects.filter(
+            pk__in=[commit_obj.pk for commit_obj, _ in commits]
+        ).update(blobs_indexed=True)
+        return len(blobs)
@@ -79,6 +79,9 @@ class ProjectCommit(models.Model):
         help_text="`git ls-tree -r` data.",
     )
 
+    # Set once the blobs of the commit are recorded in `ProjectBlob`.
+    blobs_indexed = models.BooleanField(default=False, editable=False)
+
     creation_date = models.DateTimeField(auto_now_add=True, editable=False)
     modified_date = models.DateTimeField(auto_now=True, editable=False)
 
@@ -6,15 +6,20 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from django.db import transaction
+from django.db.models import QuerySet
 from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import Signal
 from django.dispatch import receiver
 
-from speleodb.common.caching import UserProjectPermissionCache
+from speleodb.common.caching import TEAM_PERMISSIONS_GENERATION
+from speleodb.common.caching import USER_PERMISSIONS_GENERATION
+from speleodb.surveys.models import EffectiveProjectPermission
+from speleodb.surveys.models import Project
 from speleodb.surveys.models import TeamProjectPermission
 from speleodb.surveys.models import UserProjectPermission
 from speleodb.users.models import SurveyTeamMembership
+from speleodb.users.models import User
 
 if TYPE_CHECKING:
     from speleodb.users.models import SurveyTeam
@@ -28,33 +33,84 @@ def notify_admin(sender: Any, **kwargs: Any) -> None:
     print(f"Git Push Executed! {sender=} | Task details: {kwargs=}")  # noqa: T201
 
 
+def _deleted_with_user_or_project(**kwargs: Any) -> bool:
+    """Whether a ``post_delete`` is part of deleting a user or a project.
+
+    Their effective permissions are then deleted by cascade and must not
+    be recomputed, which would insert rows pointing at the deleted object.
+    """
+    if (origin := kwargs.get("origin")) is None:
+        return False
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(origin_model, (User, Project))
+
+
 @receiver([post_save, post_delete], sender=UserProjectPermission)
-def invalidate_user_project_permissions(
+def refresh_user_effective_permissions(
     sender: Any, instance: UserProjectPermission, **kwargs: Any
 ) -> None:
-    transaction.on_commit(
-        lambda: UserProjectPermissionCache.delete(
-            instance.target_id,  # pyright: ignore[reportAttributeAccessIssue]
-            instance.project_id,  # pyright: ignore[reportAttributeAccessIssue]
-        )
+    if _deleted_with_user_or_project(**kwargs):
+        return
+    EffectiveProjectPermission.refresh(
+        user_ids=[instance.target_id],  # pyright: ignore[reportAttributeAccessIssue]
+        project_ids=[instance.project_id],  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
+
+@receiver([post_save, post_delete], sender=TeamProjectPermission)
+def refresh_team_effective_permissions(
+    sender: Any, instance: TeamProjectPermission, **kwargs: Any
+) -> None:
+    if _deleted_with_user_or_project(**kwargs):
+        return
+    EffectiveProjectPermission.refresh(
+        project_ids=[instance.project_id],  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
+
+@receiver([post_save, post_delete], sender=SurveyTeamMembership)
+def refresh_member_effective_permissions(
+    sender: Any, instance: SurveyTeamMembership, **kwargs: Any
+) -> None:
+    if _deleted_with_user_or_project(**kwargs):
+        return
+    EffectiveProjectPermission.refresh(
+        user_ids=[instance.user_id],  # pyright: ignore[reportAttributeAccessIssue]
     )
 
 
+@receiver([post_save, post_delete], sender=UserProjectPermission)
+def invalidate_user_project_permissions(
+    sender: Any, instance: UserProjectPermission, **kwargs: Any
+) -> None:
+    def invalidate() -> None:
+        USER_PERMISSIONS_GENERATION.bump(instance.target_id)  # pyright: ignore[reportAttributeAccessIssue]
+
+    # Now, for the rest of the transaction, and again on commit for the
+    # readers that cached the previous state meanwhile.
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
 @receiver([post_save, post_delete], sender=TeamProjectPermission)
 def invalidate_team_project_permissions(
     sender: Any, instance: TeamProjectPermission, **kwargs: Any
 ) -> None:
     def invalidate() -> None:
+        TEAM_PERMISSIONS_GENERATION.bump(instance.target_id)  # pyright: ignore[reportAttributeAccessIssue]
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+    def invalidate_members() -> None:
         survey_team: SurveyTeam = instance.target
         for user_id in survey_team.memberships.filter(is_active=True).values_list(
             "user_id", flat=True
         ):
-            UserProjectPermissionCache.delete(
-                user_id,  # pyright: ignore[reportAttributeAccessIssue]
-                instance.project_id,  # pyright: ignore[reportAttributeAccessIssue]
-            )
+            USER_PERMISSIONS_GENERATION.bump(user_id)
 
-    transaction.on_commit(invalidate)
+    invalidate_members()
+    transaction.on_commit(invalidate_members)
 
 
 @receiver([post_save, post_delete], sender=SurveyTeamMembership)
@@ -62,13 +118,7 @@ def invalidate_on_membership_change(
     sender: Any, instance: SurveyTeamMembership, **kwargs: Any
 ) -> None:
     def invalidate() -> None:
-        survey_team: SurveyTeam = instance.team
-        for project_id in survey_team.project_permissions.values_list(
-            "project_id", flat=True
-        ):
-            UserProjectPermissionCache.delete(
-                instance.user_id,  # pyright: ignore[reportAttributeAccessIssue]
-                project_id,
-            )
+        USER_PERMISSIONS_GENERATION.bump(instance.user_id)  # pyright: ignore[reportAttributeAccessIssue]
 
+    invalidate()
     transaction.on_commit(invalidate)
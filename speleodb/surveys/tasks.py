@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from celery import shared_task
 
 from speleodb.git_engine.gitlab_manager import GitlabManager
+from speleodb.processors.download_cache import DownloadCache
 from speleodb.surveys.models import Project
 
 if TYPE_CHECKING:
@@ -41,3 +42,9 @@ def refresh_all_projects_geojson() -> None:
     """Refresh the geojson for all projects."""
     for project in Project.objects.all():
         _ = refresh_project_geojson.delay(project.id)
+
+
+@shared_task(soft_time_limit=15 * 60, time_limit=20 * 60)
+def upload_cached_download(path: str, storage_name: str) -> None:
+    """Mirror a local download cache entry to S3 (see `DownloadCache`)."""
+    DownloadCache.upload_to_storage(Path(path), storage_name)
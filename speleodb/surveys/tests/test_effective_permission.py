@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from speleodb.api.v2.tests.factories import ProjectFactory
+from speleodb.api.v2.tests.factories import SurveyTeamMembershipFactory
+from speleodb.api.v2.tests.factories import TeamProjectPermissionFactory
+from speleodb.api.v2.tests.factories import UserProjectPermissionFactory
+from speleodb.common.enums import PermissionLevel
+from speleodb.surveys.models import EffectiveProjectPermission
+
+if TYPE_CHECKING:
+    from speleodb.surveys.models import Project
+    from speleodb.users.models import SurveyTeam
+    from speleodb.users.models import User
+
+
+def _effective_levels(user: User) -> dict[str, int]:
+    return {
+        str(project_id): level
+        for project_id, level in user.effective_project_permissions.values_list(
+            "project_id", "level"
+        )
+    }
+
+
+@pytest.mark.django_db
+class TestEffectiveProjectPermission:
+    def test_kept_in_sync_with_user_and_team_permissions(
+        self, project: Project, team: SurveyTeam
+    ) -> None:
+        membership = SurveyTeamMembershipFactory.create(team=team)
+        member = membership.user
+        assert _effective_levels(member) == {}
+
+        permission = UserProjectPermissionFactory.create(
+            target=member, project=project, level=PermissionLevel.READ_ONLY
+        )
+        assert _effective_levels(member) == {str(project.id): PermissionLevel.READ_ONLY}
+
+        team_permission = TeamProjectPermissionFactory.create(
+            target=team, project=project, level=PermissionLevel.ADMIN
+        )
+        assert _effective_levels(member) == {str(project.id): PermissionLevel.ADMIN}
+
+        membership.deactivate(deactivated_by=member)
+        assert _effective_levels(member) == {str(project.id): PermissionLevel.READ_ONLY}
+
+        membership.reactivate(role=membership.role)
+        team_permission.deactivate(deactivated_by=member)
+        permission.delete()
+        assert _effective_levels(member) == {}
+
+    def test_accessible_project_ids_honors_min_level(self, user: User) -> None:
+        readable = ProjectFactory.create()
+        web_only = ProjectFactory.create()
+        UserProjectPermissionFactory.create(
+            target=user, project=readable, level=PermissionLevel.READ_ONLY
+        )
+        UserProjectPermissionFactory.create(
+            target=user, project=web_only, level=PermissionLevel.WEB_VIEWER
+        )
+
+        assert set(
+            user.accessible_project_ids().values_list("project_id", flat=True)
+        ) == {readable.id, web_only.id}
+        assert list(
+            user.accessible_project_ids(PermissionLevel.READ_ONLY).values_list(
+                "project_id", flat=True
+            )
+        ) == [readable.id]
+
+    def test_project_deletion_cascades(self, user: User, project: Project) -> None:
+        UserProjectPermissionFactory.create(target=user, project=project)
+
+        project.delete()
+
+        assert not EffectiveProjectPermission.objects.filter(user=user).exists()
+
+    def test_full_refresh_matches_incremental_sync(
+        self, project: Project, team: SurveyTeam
+    ) -> None:
+        membership = SurveyTeamMembershipFactory.create(team=team)
+        UserProjectPermissionFactory.create(
+            target=membership.user, project=project, level=PermissionLevel.READ_ONLY
+        )
+        TeamProjectPermissionFactory.create(
+            target=team, project=ProjectFactory.create()
+        )
+        expected = set(
+            EffectiveProjectPermission.objects.values_list(
+                "user_id", "project_id", "level"
+            )
+        )
+
+        EffectiveProjectPermission.objects.all().delete()
+        EffectiveProjectPermission.refresh()
+
+        assert (
+            set(
+                EffectiveProjectPermission.objects.values_list(
+                    "user_id", "project_id", "level"
+                )
+            )
+            == expected
+        )
+
+    def test_refresh_updates_rows_in_place(self, user: User, project: Project) -> None:
+        permission = UserProjectPermissionFactory.create(
+            target=user, project=project, level=PermissionLevel.READ_ONLY
+        )
+        row = EffectiveProjectPermission.objects.get(user=user, project=project)
+
+        permission.level = PermissionLevel.ADMIN
+        permission.save()
+        EffectiveProjectPermission.refresh(user_ids=[user.id])
+
+        assert EffectiveProjectPermission.objects.get(pk=row.pk).level == (
+            PermissionLevel.ADMIN
+        )
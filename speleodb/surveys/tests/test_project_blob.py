@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+from unittest.mock import PropertyMock
+from unittest.mock import patch
+
+import pytest
+from django.test import TestCase
+
+from speleodb.api.v2.tests.factories import ProjectFactory
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitRepo
+from speleodb.git_engine.exceptions import GitBlobNotFoundError
+from speleodb.surveys.models import Project
+from speleodb.surveys.models import ProjectBlob
+from speleodb.surveys.models import ProjectCommit
+from speleodb.users.tests.factories import UserFactory
+
+
+class TestProjectBlobIndex(TestCase):
+    """Test suite for the `ProjectBlob` index and `Project.find_blob`."""
+
+    def setUp(self) -> None:
+        self.user = UserFactory.create()
+        self.project = ProjectFactory.create(created_by=self.user.email)
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = GitRepo.init(path=pathlib.Path(self._tmp_dir.name) / "repo")
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def _commit_files(self, files: dict[str, bytes], message: str) -> None:
+        for rel_path, content in files.items():
+            path = self.repo.path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+        self.repo.index.add(list(files))
+        self.repo.index.commit(message, author=GIT_COMMITTER, committer=GIT_COMMITTER)
+
+    def _index_history(self) -> None:
+        self.project.construct_git_history_from_project(git_repo=self.repo)
+
+    def test_blobs_attributed_to_first_commit(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        first_sha = self.repo.head.commit.hexsha
+
+        self._commit_files({"photos/cave.jpg": b"jpeg"}, "Second commit")
+        second_sha = self.repo.head.commit.hexsha
+
+        self._index_history()
+
+        assert ProjectCommit.objects.filter(project=self.project).count() == 2  # noqa: PLR2004
+
+        tml_sha = (self.repo.head.commit.tree / "ariane.tml").hexsha
+        photo_sha = (self.repo.head.commit.tree / "photos/cave.jpg").hexsha
+
+        tml_blob = ProjectBlob.objects.get(project=self.project, hexsha=tml_sha)
+        assert tml_blob.commit_id == first_sha
+        assert tml_blob.path == "ariane.tml"
+        assert tml_blob.size == len(b"v1")
+
+        photo_blob = ProjectBlob.objects.get(project=self.project, hexsha=photo_sha)
+        assert photo_blob.commit_id == second_sha
+        assert photo_blob.path == "photos/cave.jpg"
+
+    def test_incremental_indexing(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        self._index_history()
+        assert ProjectBlob.objects.filter(project=self.project).count() == 1
+
+        self._commit_files({"ariane.tml": b"v2"}, "Second commit")
+        self._index_history()
+
+        assert ProjectBlob.objects.filter(project=self.project).count() == 2  # noqa: PLR2004
+        assert (
+            ProjectBlob.objects.get(
+                project=self.project,
+                hexsha=(self.repo.head.commit.tree / "ariane.tml").hexsha,
+            ).commit_id
+            == self.repo.head.commit.hexsha
+        )
+
+    def test_cold_index_is_backfilled(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        self._index_history()
+
+        ProjectBlob.objects.filter(project=self.project).delete()
+        self._index_history()
+
+        assert ProjectBlob.objects.filter(project=self.project).count() == 1
+
+    def test_find_blob_uses_index(self) -> None:
+        self._commit_files({"data/ariane.tml": b"survey"}, "First commit")
+        self._index_history()
+
+        hexsha = (self.repo.head.commit.tree / "data/ariane.tml").hexsha
+
+        with (
+            patch.object(
+                Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+            ),
+            patch.object(GitRepo, "find_blob") as mock_find_blob,
+        ):
+            git_file = self.project.find_blob(hexsha)
+
+        mock_find_blob.assert_not_called()
+        assert git_file.hexsha == hexsha
+        assert git_file.name == "ariane.tml"
+        assert git_file.content.read() == b"survey"
+
+    def test_find_blob_unknown_with_warm_index(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        self._index_history()
+
+        with (
+            patch.object(
+                Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+            ),
+            pytest.raises(GitBlobNotFoundError),
+        ):
+            self.project.find_blob("f" * 40)
+
+    def test_find_blob_indexes_unrecorded_commits(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        self._index_history()
+
+        self._commit_files({"ariane.tml": b"v2"}, "Second commit")
+        hexsha = (self.repo.head.commit.tree / "ariane.tml").hexsha
+
+        with patch.object(
+            Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+        ):
+            git_file = self.project.find_blob(hexsha)
+
+        assert git_file.content.read() == b"v2"
+        assert (
+            ProjectBlob.objects.get(project=self.project, hexsha=hexsha).commit_id
+            == self.repo.head.commit.hexsha
+        )
+
+    def test_find_blob_backfills_partial_index(self) -> None:
+        self._commit_files({"ariane.tml": b"v1", "notes.txt": b"notes"}, "First")
+        self._index_history()
+
+        # History recorded before its blobs were indexed.
+        hexsha = (self.repo.head.commit.tree / "notes.txt").hexsha
+        ProjectBlob.objects.filter(project=self.project, hexsha=hexsha).delete()
+        ProjectCommit.objects.filter(project=self.project).update(blobs_indexed=False)
+
+        with patch.object(
+            Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+        ):
+            git_file = self.project.find_blob(hexsha)
+
+        assert git_file.name == "notes.txt"
+        assert ProjectBlob.objects.filter(project=self.project, hexsha=hexsha).exists()
+
+    def test_find_blob_caches_unreachable_blob(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        self._index_history()
+
+        # Written to the object database but not part of any commit.
+        dangling = self.repo.path / "dangling.bin"
+        dangling.write_bytes(b"dangling")
+        hexsha = self.repo.git.hash_object("-w", str(dangling))
+
+        with patch.object(
+            Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+        ):
+            with pytest.raises(GitBlobNotFoundError):
+                self.project.find_blob(hexsha)
+
+            with (
+                patch.object(
+                    Project, "construct_git_history_from_project"
+                ) as mock_history,
+                pytest.raises(GitBlobNotFoundError),
+            ):
+                self.project.find_blob(hexsha)
+
+        mock_history.assert_not_called()
+
+    def test_find_blob_falls_back_to_scan_when_cold(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+        hexsha = (self.repo.head.commit.tree / "ariane.tml").hexsha
+
+        with patch.object(
+            Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+        ):
+            git_file = self.project.find_blob(hexsha)
+
+        assert git_file.hexsha == hexsha
+
+    def test_get_blob_missing_object(self) -> None:
+        self._commit_files({"ariane.tml": b"v1"}, "First commit")
+
+        with pytest.raises(GitBlobNotFoundError):
+            self.repo.get_blob("f" * 40, path="ariane.tml")
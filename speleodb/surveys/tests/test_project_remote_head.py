@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+from unittest.mock import PropertyMock
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from speleodb.api.v2.tests.factories import ProjectFactory
+from speleodb.git_engine.core import GIT_COMMITTER
+from speleodb.git_engine.core import GitRepo
+from speleodb.git_engine.exceptions import GitBaseError
+from speleodb.git_engine.gitlab_manager import GitlabManager
+from speleodb.surveys.models import Project
+from speleodb.users.tests.factories import UserFactory
+
+
+class TestProjectRemoteHeadProbe(TestCase):
+    """Test suite for the cached remote HEAD check in `Project.get_git_commit`."""
+
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.user = UserFactory.create()
+        self.project = ProjectFactory.create(created_by=self.user.email)
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.repo = GitRepo.init(path=pathlib.Path(self._tmp_dir.name) / "repo")
+        (self.repo.path / "ariane.tml").write_bytes(b"v1")
+        self.repo.index.add(["ariane.tml"])
+        self.repo.index.commit(
+            "First commit", author=GIT_COMMITTER, committer=GIT_COMMITTER
+        )
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+        cache.clear()
+        super().tearDown()
+
+    def _get_head(self, remote_hexsha: str | None) -> tuple[str, int, int]:
+        with (
+            patch.object(
+                Project, "git_mirror", new_callable=PropertyMock, return_value=self.repo
+            ),
+            patch.object(
+                GitlabManager, "get_last_commit_hash", return_value=remote_hexsha
+            ) as mock_remote_head,
+            patch.object(
+                Project, "fetch_git_mirror", return_value=self.repo
+            ) as mock_fetch,
+        ):
+            hexsha = self.project.get_git_commit().hexsha
+
+        return hexsha, mock_remote_head.call_count, mock_fetch.call_count
+
+    def test_up_to_date_mirror_is_not_fetched(self) -> None:
+        head = self.repo.head.commit.hexsha
+
+        assert self._get_head(remote_hexsha=head) == (head, 1, 0)
+
+        # The remote HEAD is cached: no Gitlab round trip either.
+        assert self._get_head(remote_hexsha=head) == (head, 0, 0)
+
+    def test_stale_mirror_is_fetched(self) -> None:
+        head = self.repo.head.commit.hexsha
+
+        assert self._get_head(remote_hexsha="f" * 40) == (head, 1, 1)
+
+    def test_unknown_remote_head_is_fetched(self) -> None:
+        head = self.repo.head.commit.hexsha
+
+        assert self._get_head(remote_hexsha=None) == (head, 1, 1)
+
+    def test_invalidate_remote_head(self) -> None:
+        head = self.repo.head.commit.hexsha
+        assert self._get_head(remote_hexsha=head) == (head, 1, 0)
+
+        self.project.invalidate_remote_head()
+
+        assert self._get_head(remote_hexsha="f" * 40) == (head, 1, 1)
+
+    def _fetch_failing_mirror(self, *, corrupted: bool) -> int:
+        with (
+            patch.object(
+                Project,
+                "git_mirror_dir",
+                new_callable=PropertyMock,
+                return_value=self.repo.path,
+            ),
+            patch.object(
+                GitRepo, "fetch", side_effect=GitBaseError("Impossible to fetch")
+            ),
+            patch.object(GitRepo, "is_corrupted", return_value=corrupted),
+            patch.object(Project, "construct_git_history_from_project"),
+            patch.object(
+                GitlabManager, "clone_mirror", return_value=self.repo
+            ) as mock_clone_mirror,
+        ):
+            assert self.project.fetch_git_mirror() == self.repo
+
+        return mock_clone_mirror.call_count
+
+    def test_failed_fetch_keeps_healthy_mirror(self) -> None:
+        assert self._fetch_failing_mirror(corrupted=False) == 0
+
+    def test_failed_fetch_reclones_corrupted_mirror(self) -> None:
+        assert self._fetch_failing_mirror(corrupted=True) == 1
+
+    def test_clone_mirror_swaps_existing_mirror(self) -> None:
+        mirror_dir = pathlib.Path(self._tmp_dir.name) / "mirrors" / "project.git"
+        mirror_dir.mkdir(parents=True)
+        (mirror_dir / "stale").write_bytes(b"corrupted")
+
+        with patch.object(
+            GitlabManager, "_get_git_url", return_value=str(self.repo.path)
+        ):
+            git_mirror = GitlabManager.clone_mirror.__wrapped__(  # type: ignore[attr-defined]
+                GitlabManager, self.project, mirror_dir
+            )
+
+        assert git_mirror.path.resolve() == mirror_dir.resolve()
+        assert git_mirror.head.commit.hexsha == self.repo.head.commit.hexsha
+        assert not (mirror_dir / "stale").exists()
+        # Neither the temporary clone nor the swapped out mirror is left behind.
+        assert list(mirror_dir.parent.iterdir()) == [mirror_dir]
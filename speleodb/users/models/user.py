@@ -7,24 +7,32 @@ from operator import attrgetter
 from typing import TYPE_CHECKING
 from typing import ClassVar
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import update_last_login
+from django.core.cache import cache
 from django.db import models
 from django.db.models import BooleanField
 from django.db.models import CharField
 from django.db.models import EmailField
 from django_countries.fields import CountryField
 
+from speleodb.common.caching import USER_PERMISSIONS_GENERATION
 from speleodb.common.caching import UserProjectPermissionCache
-from speleodb.common.caching import UserProjectPermissionInfo
+from speleodb.common.enums import PermissionLevel
 from speleodb.users.managers import UserManager
 from speleodb.utils.exceptions import NotAuthorizedError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
     from django.db.models import QuerySet
     from django_stubs_ext import StrOrPromise
 
     from speleodb.gis.models import ExperimentUserPermission
     from speleodb.gis.models import Station
+    from speleodb.surveys.models import EffectiveProjectPermission
     from speleodb.surveys.models import Project
     from speleodb.surveys.models import ProjectMutex
     from speleodb.surveys.models import TeamProjectPermission
@@ -67,6 +75,7 @@ class User(AbstractUser):
 
     # FK Keys
     _team_memberships: models.QuerySet[SurveyTeamMembership]
+    effective_project_permissions: models.QuerySet[EffectiveProjectPermission]
     mutexes: models.QuerySet[ProjectMutex]
     experiment_permissions: models.QuerySet[ExperimentUserPermission]
     project_user_permissions: models.QuerySet[UserProjectPermission]
@@ -74,6 +83,10 @@ class User(AbstractUser):
 
     id = models.AutoField(primary_key=True)  # Explicitly declared for typing
 
+    # Set by `load_project_levels()`: the user's generation and best level
+    # on every accessible project.
+    _project_levels: tuple[int, dict[UUID, int]] | None = None
+
     # First and last name do not cover name patterns around the globe
     name = CharField("Name of User", blank=False, null=False, max_length=255)
     email = EmailField("email address", unique=True)
@@ -142,6 +155,18 @@ class User(AbstractUser):
     def projects(self) -> list[Project]:
         return [perm.project for perm in self.permissions]
 
+    def accessible_project_ids(
+        self, min_level: PermissionLevel = PermissionLevel.WEB_VIEWER
+    ) -> QuerySet[EffectiveProjectPermission]:
+        """Return the ids of the projects the user can access at *min_level*.
+
+        A subquery on the effective permissions, meant for ``project__in=``
+        filters: the projects are never loaded in Python.
+        """
+        return self.effective_project_permissions.filter(level__gte=min_level).values(
+            "project_id"
+        )
+
     @property
     def projects_with_level(
         self,
@@ -181,66 +206,105 @@ class User(AbstractUser):
 
         return user_permissions, team_permissions
 
-    def _fetch_project_permission_ids(
+    def get_best_permission(
         self, project: Project
-    ) -> UserProjectPermissionInfo:
+    ) -> UserProjectPermission | TeamProjectPermission:
         from speleodb.surveys.models import TeamProjectPermission  # noqa: PLC0415
 
-        if (ids := UserProjectPermissionCache.get(self.pk, project.pk)) is not None:
-            return ids
-
-        user_perm_id = (
-            self.project_user_permissions.filter(
+        permissions: list[UserProjectPermission | TeamProjectPermission] = [
+            *self.project_user_permissions.filter(
                 project=project,
                 is_active=True,
-            )
-            .values_list("id", flat=True)
-            .first()
-        )
+            ).select_related("target", "project"),
+            *TeamProjectPermission.objects.filter(
+                target__memberships__user=self,
+                target__memberships__is_active=True,
+                project=project,
+                is_active=True,
+            ).select_related("target", "project"),
+        ]
 
-        team_perm_ids = TeamProjectPermission.objects.filter(
-            target__memberships__user=self,
-            target__memberships__is_active=True,
-            project=project,
-            is_active=True,
-        ).values_list("id", flat=True)
+        if not permissions:
+            raise NotAuthorizedError("The user does not have access to the project")
 
-        rslt = UserProjectPermissionInfo(
-            user=user_perm_id,
-            teams=list(team_perm_ids),
-        )
+        return filter_permissions_by_best(permissions)[0]
 
-        UserProjectPermissionCache.set(self.pk, project.pk, payload=rslt)
-        return rslt
+    def load_project_levels(self) -> dict[UUID, int]:
+        """Resolve the best level on every accessible project in one query.
+
+        The result is kept on this instance, so for the rest of the request
+        when called on ``request.user``. It then answers
+        :meth:`get_best_permission_level` for every project (permission
+        classes, serializers...) until a permission or membership change
+        bumps the user's generation. Listings call it once up front.
+        """
+        generation = USER_PERMISSIONS_GENERATION.get(self.pk)
+        levels = dict(
+            self.effective_project_permissions.values_list("project_id", "level")
+        )
+        self._project_levels = (generation, levels)
+        return levels
+
+    def _get_loaded_project_levels(self) -> dict[UUID, int] | None:
+        if self._project_levels is None:
+            return None
+        generation, levels = self._project_levels
+        if generation != USER_PERMISSIONS_GENERATION.get(self.pk):
+            self._project_levels = None
+            return None
+        return levels
+
+    def get_best_permission_level(self, project: Project) -> PermissionLevel:
+        """Return the level of :meth:`get_best_permission`, cached.
+
+        Prefer it whenever the level is all that is needed: it is read from
+        :meth:`load_project_levels` when loaded, and a warm lookup costs no
+        query otherwise (see ``UserProjectPermissionCache``).
+        """
+        if (levels := self._get_loaded_project_levels()) is not None:
+            if (loaded_level := levels.get(project.pk)) is None:
+                raise NotAuthorizedError("The user does not have access to the project")
+            return PermissionLevel(loaded_level)
+
+        def fetch_team_ids() -> Iterable[int]:
+            return self._team_memberships.filter(is_active=True).values_list(
+                "team_id", flat=True
+            )
 
-    def get_best_permission(
-        self, project: Project
-    ) -> UserProjectPermission | TeamProjectPermission:
-        from speleodb.surveys.models import TeamProjectPermission  # noqa: PLC0415
-        from speleodb.surveys.models import UserProjectPermission  # noqa: PLC0415
+        def fetch_level() -> int | None:
+            return (
+                self.effective_project_permissions.filter(project=project)
+                .values_list("level", flat=True)
+                .first()
+            )
 
-        perm_nfo = self._fetch_project_permission_ids(project)
+        level = UserProjectPermissionCache.get_or_set(
+            self.pk,
+            project.pk,
+            fetch_team_ids=fetch_team_ids,
+            fetch_level=fetch_level,
+        )
 
-        permissions: list[UserProjectPermission | TeamProjectPermission] = []
+        if level is None:
+            raise NotAuthorizedError("The user does not have access to the project")
 
-        if user_id := perm_nfo.user:
-            permissions.extend(
-                UserProjectPermission.objects.filter(id=user_id).select_related(
-                    "target", "project"
-                )
-            )
+        return PermissionLevel(level)
 
-        if team_ids := perm_nfo.teams:
-            permissions.extend(
-                TeamProjectPermission.objects.filter(id__in=team_ids).select_related(
-                    "target", "project"
-                )
-            )
+    def touch_last_login(self) -> None:
+        """Refresh ``last_login`` at most once per update interval.
 
-        if not permissions:
-            raise NotAuthorizedError("The user does not have access to the project")
+        Called on every authenticated request: only the first one of each
+        ``DJANGO_LAST_LOGIN_UPDATE_INTERVAL`` claims the cache-side marker
+        through ``cache.add`` and writes, the others skip the UPDATE on the
+        users table altogether.
+        """
+        interval = settings.DJANGO_LAST_LOGIN_UPDATE_INTERVAL
+        if interval > 0 and not cache.add(
+            f"[{self.__class__.__name__}]last_login:{self.pk}", "1", timeout=interval
+        ):
+            return
 
-        return filter_permissions_by_best(permissions)[0]
+        update_last_login(None, user=self)  # type: ignore[arg-type]
 
     @property
     def active_mutexes(self) -> models.QuerySet[ProjectMutex]:
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from speleodb.users.tests.factories import UserFactory
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+def _last_login_updates(ctx: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"]
+        for query in ctx.captured_queries
+        if query["sql"].startswith('UPDATE "users_user"')
+        and "last_login" in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+class TestTouchLastLogin:
+    def test_token_requests_write_last_login_once_per_interval(self) -> None:
+        user = UserFactory.create()
+        token, _ = Token.objects.get_or_create(user=user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(3):
+                response = client.get(reverse("api:v2:projects"))
+                assert response.status_code == status.HTTP_200_OK
+
+        assert len(_last_login_updates(ctx)) == 1
+        user.refresh_from_db()
+        assert user.last_login is not None
+
+    def test_zero_interval_writes_every_time(self, settings: SettingsWrapper) -> None:
+        settings.DJANGO_LAST_LOGIN_UPDATE_INTERVAL = 0
+        user = UserFactory.create()
+
+        with CaptureQueriesContext(connection) as ctx:
+            user.touch_last_login()
+            user.touch_last_login()
+
+        assert len(_last_login_updates(ctx)) == 2  # noqa: PLR2004
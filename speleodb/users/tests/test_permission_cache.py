@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from speleodb.api.v2.tests.factories import SurveyTeamMembershipFactory
+from speleodb.api.v2.tests.factories import TeamProjectPermissionFactory
+from speleodb.api.v2.tests.factories import UserProjectPermissionFactory
+from speleodb.common.enums import PermissionLevel
+from speleodb.users.tests.factories import UserFactory
+from speleodb.utils.exceptions import NotAuthorizedError
+
+if TYPE_CHECKING:
+    from speleodb.surveys.models import Project
+    from speleodb.users.models import SurveyTeam
+
+
+@pytest.mark.django_db
+class TestBestPermissionLevelCache:
+    def test_warm_lookup_costs_no_query(self, project: Project) -> None:
+        member = UserFactory.create()
+        UserProjectPermissionFactory.create(
+            target=member, project=project, level=PermissionLevel.READ_ONLY
+        )
+
+        assert member.get_best_permission_level(project) == PermissionLevel.READ_ONLY
+
+        with CaptureQueriesContext(connection) as ctx:
+            level = member.get_best_permission_level(project)
+        assert level == PermissionLevel.READ_ONLY
+        assert len(ctx.captured_queries) == 0
+
+    def test_user_permission_changes_are_never_stale(self, project: Project) -> None:
+        member = UserFactory.create()
+        with pytest.raises(NotAuthorizedError):
+            member.get_best_permission_level(project)
+
+        permission = UserProjectPermissionFactory.create(
+            target=member, project=project, level=PermissionLevel.READ_ONLY
+        )
+        assert member.get_best_permission_level(project) == PermissionLevel.READ_ONLY
+
+        permission.level = PermissionLevel.ADMIN
+        permission.save()
+        assert member.get_best_permission_level(project) == PermissionLevel.ADMIN
+
+        permission.deactivate(deactivated_by=member)
+        with pytest.raises(NotAuthorizedError):
+            member.get_best_permission_level(project)
+
+    def test_team_permission_and_membership_changes_are_never_stale(
+        self, project: Project, team: SurveyTeam
+    ) -> None:
+        membership = SurveyTeamMembershipFactory.create(team=team)
+        member = membership.user
+        UserProjectPermissionFactory.create(
+            target=member, project=project, level=PermissionLevel.READ_ONLY
+        )
+        team_permission = TeamProjectPermissionFactory.create(
+            target=team, project=project, level=PermissionLevel.READ_AND_WRITE
+        )
+        assert (
+            member.get_best_permission_level(project) == PermissionLevel.READ_AND_WRITE
+        )
+
+        team_permission.level = PermissionLevel.ADMIN
+        team_permission.save()
+        assert member.get_best_permission_level(project) == PermissionLevel.ADMIN
+
+        membership.is_active = False
+        membership.save()
+        assert member.get_best_permission_level(project) == PermissionLevel.READ_ONLY
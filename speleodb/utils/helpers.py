@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
 import logging
 import time
 from collections import OrderedDict
@@ -11,7 +13,9 @@ from typing import Any
 from django.utils import timezone
 
 if TYPE_CHECKING:
+    import pathlib
     from collections.abc import Callable
+    from collections.abc import Generator
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,19 @@ def get_timestamp() -> str:
     return timezone.localtime().strftime("%Y-%m-%d %H:%M:%S")
 
 
+@contextlib.contextmanager
+def file_lock(lock_path: pathlib.Path) -> Generator[None]:
+    """Exclusive ``flock`` on *lock_path*, held across processes."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with lock_path.open(mode="w") as lock_f:
+        fcntl.flock(lock_f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+
 def maybe_sort_data[T](data: T) -> OrderedDict[str, Any] | list[Any] | T:
     match data:
         case dict():
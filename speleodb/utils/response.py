@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 from django.http import FileResponse
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
 from rest_framework.response import Response
 
 from speleodb.utils.helpers import maybe_sort_data
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class DownloadResponseFromBlob(FileResponse):
     def __init__(
@@ -42,6 +48,22 @@ class DownloadResponseFromFile(FileResponse):
         )
 
 
+class DownloadStreamingResponse(StreamingHttpResponse):
+    def __init__(
+        self,
+        stream: Iterator[bytes],
+        filename: str,
+        attachment: bool = True,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        super().__init__(stream, content_type=content_type)
+
+        if content_disposition := content_disposition_header(
+            as_attachment=attachment, filename=filename
+        ):
+            self["Content-Disposition"] = content_disposition
+
+
 class SortedResponse(Response):
     def __init__(self, data: dict[str, Any], *args: Any, **kwargs: Any) -> None:
         super().__init__(maybe_sort_data(data), *args, **kwargs)
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import time
 import uuid
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 from django.conf import settings
+from django.core.cache import cache
 from storages.backends.s3 import S3Storage
 
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+
 # ---------------------------------------------------------------------------
 # CloudFront signed-URL support
 # ---------------------------------------------------------------------------
@@ -171,6 +177,46 @@ class GPSTrackStorage(S3Storage):
     custom_domain = _PRIVATE_CUSTOM_DOMAIN
 
 
+class DownloadArtifactStorage(S3Storage):
+    """
+    Files are stored under the "downloads/" prefix, at a content-addressed path:
+    "project.id/commit.sha/<format>__<committed_date>" (see `DownloadCache`).
+    """
+
+    bucket_name = BaseS3Storage.bucket_name
+    object_parameters = BaseS3Storage.object_parameters
+
+    # Content-addressed: the same key always holds the same bytes.
+    file_overwrite = True
+
+    location = "downloads"
+    default_acl = "private"
+
+    # Use CloudFront signed URLs (production) or S3 presigned URLs (local dev)
+    custom_domain = _PRIVATE_CUSTOM_DOMAIN
+
+
+class VectorTileStorage(S3Storage):
+    """
+    Files are stored under the "tiles/" prefix, at a content-addressed path:
+    "commit.sha/<z>/<x>/<y>.mvt" (rendered from the commit's GeoJSON).
+    """
+
+    bucket_name = BaseS3Storage.bucket_name
+
+    # Tiles of a commit never change.
+    object_parameters = {"CacheControl": "public, max-age=31536000, immutable"}
+
+    # Content-addressed: the same key always holds the same bytes.
+    file_overwrite = True
+
+    location = "tiles"
+    default_acl = "private"
+
+    # Use CloudFront signed URLs (production) or S3 presigned URLs (local dev)
+    custom_domain = _PRIVATE_CUSTOM_DOMAIN
+
+
 class S3StaticStorage(S3Storage):
     """Public S3 storage for static files with long cache and URL timestamp."""
 
@@ -181,3 +227,39 @@ class S3StaticStorage(S3Storage):
 
     # 2min caching for static assets
     object_parameters = {"CacheControl": "public, max-age=120"}
+
+
+# ---------------------------------------------------------------------------
+# Signed-URL cache
+# ---------------------------------------------------------------------------
+# Signing a CloudFront URL is an RSA operation, so signed URLs of immutable
+# objects are reused for the first half of their lifetime: every URL handed
+# out still has at least half of the requested `expires_in` left.
+
+
+def signed_url_window(expires_in: int) -> tuple[int, int]:
+    """Return the ``(start, end)`` timestamps of the current reuse window.
+
+    URLs signed for *expires_in* during a window all expire at
+    ``start + expires_in`` and are reused until ``end``.
+    """
+    step = max(expires_in // 2, 1)
+    start = int(time.time()) // step * step
+    return start, start + step
+
+
+def get_cached_signed_url(storage: Storage, name: str, expires_in: int) -> str:
+    """Return a signed URL for *name*, reused within its expiry window.
+
+    Only meant for objects that never change under the same *name*.
+    """
+    start, end = signed_url_window(expires_in)
+    location = getattr(storage, "location", "")
+    cache_key = f"signed_url_{location}/{name}_{expires_in}_{start}"
+    if (url := cache.get(cache_key)) is not None:
+        return url  # type: ignore[no-any-return]
+
+    now = int(time.time())
+    url = storage.url(name, expire=max(start + expires_in - now, 1))  # type: ignore[call-arg]
+    cache.set(cache_key, url, timeout=max(end - now, 1))
+    return url  # type: ignore[no-any-return]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+from typing import TYPE_CHECKING
+
+from speleodb.utils.zip_stream import ZipStreamEntry
+from speleodb.utils.zip_stream import stream_zip
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _entry(arcname: str, data: bytes, chunk_size: int = 4096) -> ZipStreamEntry:
+    return ZipStreamEntry(
+        arcname=arcname,
+        size=len(data),
+        chunks=[data[i : i + chunk_size] for i in range(0, len(data), chunk_size)],
+    )
+
+
+class TestStreamZip:
+    """Test cases for the stream_zip utility function."""
+
+    def test_round_trip(self) -> None:
+        """The streamed archive is a valid ZIP holding every entry."""
+        files = {
+            "ariane.tml": os.urandom(50_000),
+            "photos/cave.jpg": os.urandom(10_000),
+            "notes/readme.txt": b"hello world\n" * 1_000,
+            "empty.txt": b"",
+        }
+
+        payload = b"".join(stream_zip(_entry(k, v) for k, v in files.items()))
+
+        with zipfile.ZipFile(io.BytesIO(payload), mode="r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == list(files)
+            for arcname, data in files.items():
+                assert zipf.read(arcname) == data
+
+    def test_compression_per_extension(self) -> None:
+        """Already-compressed formats are stored, everything else is deflated."""
+        payload = b"".join(
+            stream_zip(
+                [
+                    _entry("ariane.tml", b"tml"),
+                    _entry("cave.JPG", b"jpg"),
+                    _entry("survey.dat", b"dat"),
+                ]
+            )
+        )
+
+        with zipfile.ZipFile(io.BytesIO(payload), mode="r") as zipf:
+            assert zipf.getinfo("ariane.tml").compress_type == zipfile.ZIP_STORED
+            assert zipf.getinfo("cave.JPG").compress_type == zipfile.ZIP_STORED
+            assert zipf.getinfo("survey.dat").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_is_streamed(self) -> None:
+        """Bytes are produced before the whole input is consumed."""
+        consumed: list[int] = []
+
+        def chunks() -> Iterator[bytes]:
+            for idx in range(10):
+                consumed.append(idx)
+                yield os.urandom(8192)
+
+        stream = stream_zip(
+            [ZipStreamEntry(arcname="ariane.tml", size=10 * 8192, chunks=chunks())]
+        )
+
+        assert next(stream)
+        assert len(consumed) < 10  # noqa: PLR2004
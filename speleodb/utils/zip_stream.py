@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import io
+import zipfile
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+# Files that are already compressed: deflating them again costs CPU for
+# (almost) no size reduction - they are stored as-is.
+ZIP_STORED_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        # Archives & zip-based formats
+        ".tml",  # Ariane TML is a zipped XML document
+        ".czip",
+        ".zip",
+        ".gz",
+        ".7z",
+        ".rar",
+        ".docx",
+        ".xlsx",
+        ".pptx",
+        ".odt",
+        ".ods",
+        # Images
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".heic",
+        # Videos
+        ".mp4",
+        ".mov",
+        ".m4v",
+        ".webm",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ZipStreamEntry:
+    arcname: str
+    size: int
+    chunks: Iterable[bytes]
+    mode: int = 0o100644
+    date_time: tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+
+
+class _ZipStreamBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink drained by `stream_zip` after each write.
+
+    `zipfile` detects that the stream can not seek and falls back to data
+    descriptors, which is exactly what is needed to emit an archive on the fly.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes) -> int:  # type: ignore[override]
+        data = bytes(b)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def get_zip_compression(arcname: str) -> int:
+    if PurePosixPath(arcname).suffix.lower() in ZIP_STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def stream_zip(entries: Iterable[ZipStreamEntry]) -> Iterator[bytes]:
+    """Generate a ZIP archive chunk by chunk.
+
+    Only the chunk currently being compressed is held in memory: the archive is
+    never buffered as a whole, neither in memory nor on disk.
+    """
+    buffer = _ZipStreamBuffer()
+
+    with zipfile.ZipFile(buffer, mode="w") as zipf:
+        for entry in entries:
+            zinfo = zipfile.ZipInfo(entry.arcname, date_time=entry.date_time)
+            zinfo.compress_type = get_zip_compression(entry.arcname)
+            zinfo.external_attr = (entry.mode & 0xFFFF) << 16
+            # Lets `zipfile` decide upfront whether ZIP64 extensions are needed.
+            zinfo.file_size = entry.size
+
+            with zipf.open(zinfo, mode="w") as dst:
+                for chunk in entry.chunks:
+                    dst.write(chunk)
+                    if data := buffer.drain():
+                        yield data
+
+            if data := buffer.drain():
+                yield data
+
+    # Central directory - written when the archive is closed
+    if data := buffer.drain():
+        yield data